@@ -3,17 +3,12 @@ import urllib.error
 import urllib.request
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import cast
 
-from PySide6.QtCore import QBuffer, QIODevice, QUrl
+from PySide6.QtCore import QUrl
 from PySide6.QtGui import QDesktopServices, QIcon, Qt
 from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
 
-from foundry.gui.settings import Settings
-from smb3parse.objects.object_set import DESERT_OBJECT_SET
-
-if TYPE_CHECKING:
-    from foundry.game.level import EnemyItemAddress, LevelAddress
 
 root_dir = Path(__file__).parent.parent
 
@@ -28,6 +23,12 @@ auto_save_path.mkdir(parents=True, exist_ok=True)
 auto_save_rom_path = auto_save_path / "auto_save.nes"
 auto_save_m3l_path = auto_save_path / "auto_save.m3l"
 auto_save_level_data_path = auto_save_path / "level_data.json"
+auto_save_journal_path = auto_save_path / "auto_save.journal"
+
+scribe_auto_save_rom_path = auto_save_path / "scribe_auto_save.nes"
+scribe_auto_save_journal_path = auto_save_path / "scribe_auto_save.journal"
+
+found_levels_cache_path = home_dir / "found_levels"
 
 data_dir = root_dir.joinpath("data")
 doc_dir = root_dir.joinpath("doc")
@@ -45,6 +46,7 @@ ROM_FILE_FILTER = "ROM files (*.nes *.rom);;All files (*)"
 M3L_FILE_FILTER = "M3L files (*.m3l);;All files (*)"
 ASM_FILE_FILTER = "ASM files (*.asm);;All files (*)"
 IMG_FILE_FILTER = "Screenshots (*.png);;All files (*)"
+PATCH_FILE_FILTER = "BPS patches (*.bps);;IPS patches (*.ips);;All files (*)"
 
 
 NO_PARENT = cast(QWidget, None)
@@ -118,27 +120,3 @@ def icon(icon_name: str):
         return QIcon(str(data_path))
     else:
         raise FileNotFoundError(icon_path)
-
-
-def get_level_thumbnail(object_set, layout_address: "LevelAddress", enemy_address: "EnemyItemAddress"):
-    from foundry.game.level.LevelRef import LevelRef
-    from foundry.gui.LevelView import LevelView
-
-    level_ref = LevelRef()
-    level_ref.load_level("", layout_address, enemy_address, object_set)
-
-    view = LevelView(None, level_ref, Settings("mchlnix", "throwaway"), None)
-
-    view.settings.setValue("level view/block_transparency", object_set != DESERT_OBJECT_SET)
-
-    view.zoom_out()
-    view.zoom_out()
-
-    level_pixmap = view.grab()
-
-    buffer = QBuffer()
-    buffer.open(QIODevice.WriteOnly)
-    level_pixmap.save(buffer, "PNG", quality=100)
-    image_data = bytes(buffer.data().toBase64()).decode()
-
-    return image_data
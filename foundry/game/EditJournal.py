@@ -0,0 +1,102 @@
+import struct
+from hashlib import sha1
+
+from smb3parse.util.rom import changed_ranges
+
+JOURNAL_MAGIC = b"SMB3JRNL"
+
+_HEADER_LENGTH = len(JOURNAL_MAGIC) + sha1().digest_size
+
+_RECORD = struct.Struct("<IH")
+"""Offset and length of the bytes following it, that replace the bytes at that offset in the ROM."""
+_MAX_RECORD_LENGTH = 0xFFFF
+
+COMPACTION_SIZE = 64 * 1024
+"""Journals are compacted, once they grow beyond this size, or twice their size after the last compaction."""
+
+
+class EditJournal:
+    """
+    Records the changes made to a ROM as patches against the ROM data it was started with, the base. Only the bytes,
+    that actually changed, are recorded, so that appending the records of an edit to the journal file is cheap.
+
+    The records only ever get appended. Since the same bytes are often changed again and again, the journal is
+    compacted into a single patch per changed range of the base from time to time.
+    """
+
+    def __init__(self, base: bytes | bytearray):
+        self.base = bytes(base)
+        self._data = bytearray(base)
+        """The base with all recorded changes applied."""
+
+        self._records = bytearray()
+        """Records, that were not taken yet, to be appended to the journal file."""
+
+        self.size = _HEADER_LENGTH
+        """Size of the journal file, with all taken records appended."""
+        self._compacted_size = _HEADER_LENGTH
+
+    def record(self, rom_data: bytes | bytearray):
+        """Records the bytes of the ROM data, that differ from what was recorded last."""
+        for start, end in list(changed_ranges(self._data, rom_data, join_distance=_RECORD.size)):
+            for offset in range(start, end, _MAX_RECORD_LENGTH):
+                data = rom_data[offset : min(end, offset + _MAX_RECORD_LENGTH)]
+
+                self._records.extend(_RECORD.pack(offset, len(data)))
+                self._records.extend(data)
+
+            self._data[start:end] = rom_data[start:end]
+
+    def take_records(self) -> bytes:
+        """Returns the records made since the last call, so they can be appended to the journal file."""
+        records = bytes(self._records)
+
+        self._records.clear()
+        self.size += len(records)
+
+        return records
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.size + len(self._records) > max(COMPACTION_SIZE, 2 * self._compacted_size)
+
+    def to_bytes(self) -> bytes:
+        """Returns the whole journal, compacted to one record per changed range, to replace the journal file with."""
+        self._records.clear()
+
+        journal = EditJournal(self.base)
+        journal.record(self._data)
+
+        data = self.header() + journal.take_records()
+
+        self.size = self._compacted_size = len(data)
+
+        return data
+
+    def header(self) -> bytes:
+        return JOURNAL_MAGIC + sha1(self.base).digest()
+
+    @staticmethod
+    def replay(journal: bytes, rom_data: bytearray) -> bool:
+        """
+        Applies the records of the journal to the ROM data, if it is the base, that the journal was started with.
+        A record, that was cut short, because the editor crashed while appending it, is ignored.
+
+        :returns: Whether the journal could be applied to the ROM data.
+        """
+        if journal[:_HEADER_LENGTH] != JOURNAL_MAGIC + sha1(rom_data).digest():
+            return False
+
+        position = _HEADER_LENGTH
+
+        while position + _RECORD.size <= len(journal):
+            offset, length = _RECORD.unpack_from(journal, position)
+            position += _RECORD.size
+
+            if position + length > len(journal) or offset + length > len(rom_data):
+                break
+
+            rom_data[offset : offset + length] = journal[position : position + length]
+            position += length
+
+        return True
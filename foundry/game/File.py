@@ -1,9 +1,12 @@
+import os
 from os.path import basename
 from pathlib import Path
-from typing import Optional
+from typing import Hashable, Optional
 
 from foundry.game.additional_data import AdditionalData
-from smb3parse.util.rom import INESHeader, PRG_BANK_SIZE, Rom
+from smb3parse.objects.object_set import MAX_OBJECT_SET
+from smb3parse.types import NormalizedAddress
+from smb3parse.util.rom import ByteRanges, INESHeader, PRG_BANK_SIZE, Rom, TSA_OS_LIST, TSA_TABLE_SIZE
 
 
 class ROM(Rom):
@@ -23,6 +26,25 @@ class ROM(Rom):
 
     W_INIT_OS_LIST: list[int] = []
 
+    revision = 0
+    """Goes up with every change to the ROM data, so caches can tell, when they need to check their data again."""
+
+    dirty_ranges = ByteRanges()
+    """The ranges of the ROM data, that differ from the file at the path. Only those are written, when saving to it."""
+
+    original_data = bytes()
+    """The ROM data, as it was, when the ROM was opened. Patches are made against it."""
+
+    _file_trailer = bytes()
+    """The additional data of the editor, as it is in the file at the path."""
+    _file_stat: tuple[int, int] = (0, 0)
+    """Size and modification time of the file at the path, to tell, if it was changed outside the editor."""
+
+    _table_cache: dict[Hashable, bytes] = {}
+    """Tables read from the ROM data, that many objects share, like the TSA data of an object set."""
+    _table_ranges: dict[Hashable, list[tuple[int, int]]] = {}
+    """The ranges of the ROM data, that the tables were read from. Writing to them drops the table from the cache."""
+
     def __init__(self, path: Path | str | None = None):
         if not ROM.rom_data:
             if path is None:
@@ -30,14 +52,55 @@ class ROM(Rom):
 
             ROM.load_from_file(path)
 
-        super(ROM, self).__init__(ROM.rom_data, ROM.header)
+        super(ROM, self).__init__(ROM.rom_data, ROM.header, ROM.dirty_ranges)
 
     @staticmethod
     def get_tsa_data(object_set: int) -> bytes:
-        """Returns bytes, instead of bytearray, because bytes is hashable. FIXME?"""
-        rom = ROM()
+        """
+        Returns bytes, instead of bytearray, because bytes is hashable. All callers share the same bytes object, until
+        the TSA data of the object set, or where to find it, is written to.
+        """
+        key = ("tsa", object_set)
+
+        if key not in ROM._table_cache:
+            rom = ROM()
+
+            tsa_index_offset = rom.prg_normalize(TSA_OS_LIST + object_set)
 
-        return bytes(rom.tsa_data_for_object_set(object_set))
+            ROM._read_table(key, rom.tsa_offset_for_object_set(object_set), TSA_TABLE_SIZE, (tsa_index_offset, 1))
+
+        return ROM._table_cache[key]
+
+    @staticmethod
+    def get_palette_offset_list(address: int) -> bytes:
+        """Returns the offsets to the palette data of all object sets, as little endian words, found at the address."""
+        key = ("palette offsets", address)
+
+        if key not in ROM._table_cache:
+            ROM._read_table(key, ROM().prg_normalize(address), (MAX_OBJECT_SET + 1) * 2)
+
+        return ROM._table_cache[key]
+
+    @staticmethod
+    def _read_table(key: Hashable, offset: NormalizedAddress, length: int, *dependencies: tuple[int, int]):
+        """
+        Reads the table into the cache, where it stays, until its part of the ROM data, or any of the dependencies,
+        which are given as offset and length, is written to.
+        """
+        ROM._table_cache[key] = bytes(ROM().view(offset, length))
+        ROM._table_ranges[key] = [(offset, offset + length)] + [(start, start + size) for start, size in dependencies]
+
+    @staticmethod
+    def _invalidate_tables(start: int, end: int):
+        for key, ranges in list(ROM._table_ranges.items()):
+            if any(range_start < end and start < range_end for range_start, range_end in ranges):
+                del ROM._table_cache[key]
+                del ROM._table_ranges[key]
+
+    @staticmethod
+    def _clear_tables():
+        ROM._table_cache.clear()
+        ROM._table_ranges.clear()
 
     @staticmethod
     def load_from_file(path: Path | str):
@@ -45,6 +108,7 @@ class ROM(Rom):
             data = bytearray(rom.read())
 
         ROM.header = INESHeader.from_buffer_copy(data)
+        ROM.revision += 1
         ROM.path = str(path)
         ROM.name = basename(path)
 
@@ -60,6 +124,10 @@ class ROM(Rom):
 
             ROM.additional_data = AdditionalData.from_str(data[additional_data_start:].decode("utf-8"), ROM())
 
+        ROM.original_data = bytes(ROM.rom_data)
+        ROM.dirty_ranges.clear()
+        ROM._remember_file(path, bytes(data[len(ROM.rom_data) :]))
+
         ROM.reset_graphics()
 
     @staticmethod
@@ -71,31 +139,87 @@ class ROM(Rom):
         # circular import with ROM
         from foundry.game.gfx import restore_all_palettes, restore_graphics
 
+        ROM._clear_tables()
+
         restore_all_palettes()
         restore_graphics()
 
     @staticmethod
     def reload_from_file():
         additional_data = ROM.additional_data
+        original_data = ROM.original_data
 
         if ROM.path:
             ROM.load_from_file(ROM.path)
 
         ROM.additional_data = additional_data
+        ROM.original_data = original_data
 
     @staticmethod
-    def save_to_file(path: Path | str, set_new_path=True):
-        Path(path).open("wb").write(bytearray(ROM.rom_data))
+    def to_bytes() -> bytes:
+        """Returns the ROM, as it would be saved to a file, including the additional data of the editor."""
+        return bytes(ROM.rom_data) + ROM._trailer()
 
+    @staticmethod
+    def _trailer() -> bytes:
         if ROM.additional_data:
-            with open(path, "ab") as f:
-                f.write(ROM.MARKER_VALUE)
-                f.write(str(ROM.additional_data).encode("utf-8"))
+            return ROM.MARKER_VALUE + str(ROM.additional_data).encode("utf-8")
+        else:
+            return bytes()
+
+    @staticmethod
+    def _remember_file(path: Path | str, trailer: bytes):
+        ROM._file_trailer = trailer
+
+        stat = os.stat(path)
+        ROM._file_stat = stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _can_save_incrementally(path: Path | str, trailer: bytes) -> bool:
+        """
+        Whether only the dirty ranges need to be written to the file at the path. That is the case, if it is the file
+        the ROM was loaded from, or last saved to, it wasn't changed since and neither the size of the ROM data, nor the
+        additional data is different.
+        """
+        if not ROM.path or not os.path.exists(path) or not os.path.samefile(path, ROM.path):
+            return False
+
+        stat = os.stat(path)
 
+        if (stat.st_size, stat.st_mtime_ns) != ROM._file_stat:
+            return False
+
+        # ROM data, that grew or shrank, would be written over the old additional data, or leave parts of it behind
+        return stat.st_size == len(ROM.rom_data) + len(trailer) and trailer == ROM._file_trailer
+
+    @staticmethod
+    def save_to_file(path: Path | str, set_new_path=True):
+        trailer = ROM._trailer()
+
+        if ROM._can_save_incrementally(path, trailer):
+            with open(path, "r+b") as rom_file:
+                for start, end in ROM.dirty_ranges:
+                    rom_file.seek(start)
+                    rom_file.write(ROM.rom_data[start:end])
+
+            set_new_path = True
+        else:
+            Path(path).write_bytes(bytes(ROM.rom_data) + trailer)
+
+        # the dirty ranges are relative to the file at the path, so they only go away, when that is written to
         if set_new_path:
             ROM.path = str(path)
             ROM.name = basename(path)
 
+            ROM.dirty_ranges.clear()
+            ROM._remember_file(path, trailer)
+
+    def _write(self, offset: NormalizedAddress, data: bytes):
+        super(ROM, self)._write(offset, data)
+
+        ROM.revision += 1
+        ROM._invalidate_tables(offset, offset + len(data))
+
     @staticmethod
     def is_loaded() -> bool:
         return bool(ROM.path)
@@ -1,6 +1,8 @@
 from functools import lru_cache
+from typing import Optional
 
 from foundry.game.File import ROM
+from foundry.game.gfx.drawable import decode_chr
 from smb3parse.constants import (
     Level_BG_Pages1,
     Level_BG_Pages2,
@@ -66,6 +68,7 @@ class GraphicsSet:
         self._data = bytearray()
         self._anim_data = []
         self.anim_frame = 0
+        self._color_indices: dict[tuple[int, bool], bytes] = {}
         self.number = graphic_set_number
 
         segments = []
@@ -107,19 +110,42 @@ class GraphicsSet:
 
     @property
     def data(self):
+        return self.frame_data(self.anim_frame)
+
+    def frame_data(self, anim_frame: int) -> bytearray:
         if self.number == WORLD_MAP:
-            return self._anim_data[self.anim_frame] + self._data
+            return self._anim_data[anim_frame] + self._data
         else:
             # cycle through the second page containing the animated tiles for level objects
             page_1 = self._data[0 : 2 * CHR_ROM_SEGMENT_SIZE]
 
-            start = 2 * CHR_ROM_SEGMENT_SIZE + self.anim_frame * 2 * CHR_ROM_SEGMENT_SIZE
+            start = 2 * CHR_ROM_SEGMENT_SIZE + anim_frame * 2 * CHR_ROM_SEGMENT_SIZE
             end = 2 * CHR_ROM_SEGMENT_SIZE + start + 2 * CHR_ROM_SEGMENT_SIZE
 
             page_2 = self._data[start:end]
 
             return page_1 + page_2
 
+    def color_indices(self, mirrored=False, anim_frame: Optional[int] = None) -> bytes:
+        """
+        The decoded color indices of all tiles in an animation frame. See decode_chr for the layout.
+
+        Every animation frame is decoded only once per mirroring and kept side by side with the others, so switching
+        between frames never decodes anything again.
+
+        :param mirrored: Whether the tiles should be mirrored horizontally.
+        :param anim_frame: The animation frame to get the tiles of. Defaults to the current animation frame.
+        """
+        if anim_frame is None:
+            anim_frame = self.anim_frame
+
+        key = (anim_frame, mirrored)
+
+        if key not in self._color_indices:
+            self._color_indices[key] = decode_chr(self.frame_data(anim_frame), mirrored)
+
+        return self._color_indices[key]
+
     def _read_in(self, segments):
         for segment in segments:
             self._read_in_chr_rom_segment(segment, self._data)
@@ -124,8 +124,11 @@ def load_palette_group(object_set: int, palette_group_index: int, use_cache=True
 def _load_palettes_from_rom(object_set, palette_group_index, palette_offset_list_address: int):
     rom = ROM()
 
-    palette_offset_position = palette_offset_list_address + (object_set * PALETTE_OFFSET_SIZE)
-    palette_offset = rom.little_endian(palette_offset_position)
+    palette_offset_position = object_set * PALETTE_OFFSET_SIZE
+    palette_offset_list = ROM.get_palette_offset_list(palette_offset_list_address)
+    palette_offset = int.from_bytes(
+        palette_offset_list[palette_offset_position : palette_offset_position + PALETTE_OFFSET_SIZE], "little"
+    )
 
     palette_address = PALETTE_BASE_ADDRESS + palette_offset
     palette_address += palette_group_index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
@@ -133,7 +136,7 @@ def _load_palettes_from_rom(object_set, palette_group_index, palette_offset_list
     palettes = []
 
     for _ in range(PALETTES_PER_PALETTES_GROUP):
-        palettes.append(bytearray(rom.read(palette_address, COLORS_PER_PALETTE)))
+        palettes.append(bytearray(rom.view(palette_address, COLORS_PER_PALETTE)))
 
         palette_address += COLORS_PER_PALETTE
 
@@ -1,6 +1,7 @@
 from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import PaletteGroup, _palette_group_cache
-from foundry.game.gfx.drawable.Block import get_block, get_tile
+from foundry.game.gfx.drawable.Block import Block, get_block, get_tile
+from foundry.game.gfx.drawable.BlockCache import BlockCache
 
 
 def restore_all_palettes():
@@ -15,6 +16,13 @@ def restore_all_palettes():
 def restore_graphics():
     GraphicsSet.from_number.cache_clear()
 
+    block_image_cache().clear()
+
+
+def block_image_cache() -> BlockCache:
+    """The cache of finished block images, shared by all blocks. Can be inspected and flushed."""
+    return Block._block_cache
+
 
 def change_color(
     palette_group: PaletteGroup,
@@ -29,5 +37,4 @@ def change_color(
     else:
         palette_group[index_in_group][index_in_palette] = new_color_index
 
-    get_tile.cache_clear()
-    get_block.cache_clear()
+    # tiles and blocks only store color indices and look up the palette, when drawn, so no caches need to be cleared
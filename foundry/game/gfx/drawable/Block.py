@@ -7,6 +7,7 @@ from foundry.game.File import ROM
 from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import NESPalette, PaletteGroup, load_palette_group
 from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
+from foundry.game.gfx.drawable.BlockCache import BlockCache
 from foundry.game.gfx.drawable.Tile import Tile
 from smb3parse.objects.object_set import CLOUDY_GRAPHICS_SET, WORLD_MAP_OBJECT_SET
 
@@ -32,9 +33,9 @@ def get_block(
     return block
 
 
-@lru_cache(2**10)
-def get_tile(index, palette_group, palette_index, graphics_set, mirrored=False):
-    return Tile(index, palette_group, palette_index, graphics_set, mirrored)
+@lru_cache(2**12)
+def get_tile(index, palette_group, palette_index, graphics_set, mirrored=False, anim_frame=0):
+    return Tile(index, palette_group, palette_index, graphics_set, mirrored, anim_frame)
 
 
 def get_worldmap_tile(block_index: int, palette_index=0):
@@ -46,7 +47,7 @@ def get_worldmap_tile(block_index: int, palette_index=0):
     )
 
 
-BlockId = tuple[int, str, int]
+BlockId = tuple[int, int, bytes, int]
 
 
 class Block:
@@ -58,7 +59,7 @@ class Block:
 
     tsa_data = bytes()
 
-    _block_cache: dict[tuple[BlockId, int, bool, bool, int], QImage] = {}
+    _block_cache = BlockCache()
 
     def __init__(
         self,
@@ -78,74 +79,88 @@ class Block:
 
         self.mirrored = mirrored
 
-        self.images: dict[int, QImage] = {}
+        self.color_indices: dict[int, bytes] = {}
+        """The color indices of the blocks pixels, per animation frame. Colors are only applied, when drawing."""
+
+        self._render()
+
+    @property
+    def palette(self) -> bytearray:
+        return self.palette_group[self.palette_index]
 
-        if graphics_set.number == CLOUDY_GRAPHICS_SET:
-            self.bg_color = NESPalette[palette_group[self.palette_index][2]]
+    @property
+    def bg_color(self) -> QColor:
+        if self.graphics_set.number == CLOUDY_GRAPHICS_SET:
+            return NESPalette[self.palette[2]]
         else:
-            self.bg_color = NESPalette[palette_group[self.palette_index][0]]
+            return NESPalette[self.palette[0]]
 
-        self._render()
+    @property
+    def _block_id(self) -> BlockId:
+        # the colors are part of the id, so that images with outdated colors are not reused after a palette change
+        return self.index, self.palette_group.object_set, bytes(self.palette), self.graphics_set.number
 
     def _render(self):
-        if self.graphics_set.anim_frame in self.images:
+        if self.graphics_set.anim_frame in self.color_indices:
             return
 
-        # can't hash list, so turn it into a string instead
-        self._block_id: BlockId = (
-            self.index,
-            str(self.palette_group),
-            self.graphics_set.number,
-        )
-
         lu = self.tsa_data[TSA_BANK_0 + self.index]
         ld = self.tsa_data[TSA_BANK_1 + self.index]
         ru = self.tsa_data[TSA_BANK_2 + self.index]
         rd = self.tsa_data[TSA_BANK_3 + self.index]
 
-        self.lu_tile = get_tile(lu, self.palette_group, self.palette_index, self.graphics_set)
-        self.ld_tile = get_tile(ld, self.palette_group, self.palette_index, self.graphics_set)
+        anim_frame = self.graphics_set.anim_frame
+
+        self.lu_tile = get_tile(lu, self.palette_group, self.palette_index, self.graphics_set, False, anim_frame)
+        self.ld_tile = get_tile(ld, self.palette_group, self.palette_index, self.graphics_set, False, anim_frame)
 
         if self.mirrored:
-            self.ru_tile = get_tile(
-                lu,
-                self.palette_group,
-                self.palette_index,
-                self.graphics_set,
-                mirrored=True,
-            )
-            self.rd_tile = get_tile(
-                ld,
-                self.palette_group,
-                self.palette_index,
-                self.graphics_set,
-                mirrored=True,
-            )
+            self.ru_tile = get_tile(lu, self.palette_group, self.palette_index, self.graphics_set, True, anim_frame)
+            self.rd_tile = get_tile(ld, self.palette_group, self.palette_index, self.graphics_set, True, anim_frame)
         else:
-            self.ru_tile = get_tile(ru, self.palette_group, self.palette_index, self.graphics_set)
-            self.rd_tile = get_tile(rd, self.palette_group, self.palette_index, self.graphics_set)
+            self.ru_tile = get_tile(ru, self.palette_group, self.palette_index, self.graphics_set, False, anim_frame)
+            self.rd_tile = get_tile(rd, self.palette_group, self.palette_index, self.graphics_set, False, anim_frame)
 
-        image = QImage(Block.WIDTH, Block.HEIGHT, QImage.Format_RGB888)
+        color_indices = bytearray(Block.PIXEL_COUNT)
 
-        painter = QPainter(image)
+        for tile, tile_x, tile_y in [
+            (self.lu_tile, 0, 0),
+            (self.ru_tile, Tile.WIDTH, 0),
+            (self.ld_tile, 0, Tile.HEIGHT),
+            (self.rd_tile, Tile.WIDTH, Tile.HEIGHT),
+        ]:
+            for row in range(Tile.HEIGHT):
+                tile_row = tile.color_indices[row * Tile.WIDTH : (row + 1) * Tile.WIDTH]
+                block_start = (tile_y + row) * Block.WIDTH + tile_x
 
-        painter.drawImage(QPoint(0, 0), self.lu_tile.as_image())
-        painter.drawImage(QPoint(Tile.WIDTH, 0), self.ru_tile.as_image())
-        painter.drawImage(QPoint(0, Tile.HEIGHT), self.ld_tile.as_image())
-        painter.drawImage(QPoint(Tile.WIDTH, Tile.HEIGHT), self.rd_tile.as_image())
+                color_indices[block_start : block_start + Tile.WIDTH] = tile_row
 
-        painter.end()
+        self._whole_block_is_transparent = color_indices.count(self.lu_tile.background_color_index) == Block.PIXEL_COUNT
 
-        if _image_only_one_color(image) and image.pixelColor(0, 0) == QColor(*MASK_COLOR):
-            self._whole_block_is_transparent = True
-        else:
-            self._whole_block_is_transparent = False
-
-        self.images[self.graphics_set.anim_frame] = image
+        self.color_indices[anim_frame] = bytes(color_indices)
 
     def rerender(self):
         self._render()
 
+    def as_image(self) -> QImage:
+        """
+        Applies the current colors of the palette to the color indices of the current animation frame.
+
+        :return: An RGB image of the block, with the background color replaced by the mask color.
+        """
+        self._render()
+
+        image = QImage(
+            self.color_indices[self.graphics_set.anim_frame],
+            Block.WIDTH,
+            Block.HEIGHT,
+            Block.WIDTH,
+            QImage.Format_Indexed8,
+        )
+        image.setColorTable(self.lu_tile.color_table())
+
+        return image.convertToFormat(QImage.Format_RGB888)
+
     def draw(self, painter: QPainter, x, y, block_length, selected=False, transparent=False):
         block_attributes = (
             self._block_id,
@@ -155,9 +170,10 @@ class Block:
             self.graphics_set.anim_frame,
         )
 
-        if block_attributes not in Block._block_cache:
-            self.rerender()
-            image = self.images[self.graphics_set.anim_frame].copy()
+        image = Block._block_cache.get(block_attributes)
+
+        if image is None:
+            image = self.as_image()
 
             if block_length != Block.WIDTH:
                 image = image.scaled(block_length, block_length)
@@ -174,7 +190,7 @@ class Block:
 
             Block._block_cache[block_attributes] = image
 
-        painter.drawImage(x, y, Block._block_cache[block_attributes])
+        painter.drawImage(x, y, image)
 
     def _replace_transparent_with_background(self, image):
         # draw image on background layer, to fill transparent pixels
@@ -186,11 +202,3 @@ class Block:
         _painter.end()
 
         return background
-
-
-def _image_only_one_color(image):
-    copy = image.copy()
-
-    copy.convertTo(QImage.Format_Indexed8)
-
-    return copy.colorCount() == 1
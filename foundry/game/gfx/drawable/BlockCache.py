@@ -0,0 +1,161 @@
+from collections import Counter, OrderedDict
+from typing import Hashable, Optional
+
+from PySide6.QtGui import QImage
+
+BlockCacheKey = tuple[tuple[int, int, bytes, int], int, bool, bool, int]
+"""(block id, block length, selected, transparent, animation frame), see Block.draw."""
+
+KEY_DIMENSIONS = (
+    "block_index",
+    "object_set",
+    "palette",
+    "graphics_set",
+    "block_length",
+    "selected",
+    "transparent",
+    "anim_frame",
+)
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+def _key_values(key: BlockCacheKey) -> tuple[Hashable, ...]:
+    block_id, *rest = key
+
+    return *block_id, *rest
+
+
+class BlockCache:
+    """
+    A size bounded least recently used cache for the finished images of blocks.
+
+    The images are accounted for by the bytes they take up. When adding an image would go over the byte budget, the
+    least recently used images are evicted, until it fits again. Hits and misses are counted in total and for every
+    value of every dimension of the key, so that it is visible, which zoom levels or palettes cause the most images
+    to be created.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size_in_bytes = 0
+
+        self._images: OrderedDict[BlockCacheKey, QImage] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._hits_by_key: Counter[BlockCacheKey] = Counter()
+        self._misses_by_key: Counter[BlockCacheKey] = Counter()
+
+        self.reset_statistics()
+
+    def get(self, key: BlockCacheKey) -> Optional[QImage]:
+        image = self._images.get(key, None)
+
+        if image is None:
+            self.misses += 1
+            self._misses_by_key[key] += 1
+        else:
+            self.hits += 1
+            self._hits_by_key[key] += 1
+
+            self._images.move_to_end(key)
+
+        return image
+
+    def __getitem__(self, key: BlockCacheKey) -> QImage:
+        image = self.get(key)
+
+        if image is None:
+            raise KeyError(key)
+
+        return image
+
+    def __setitem__(self, key: BlockCacheKey, image: QImage):
+        if key in self._images:
+            self.size_in_bytes -= self._images.pop(key).sizeInBytes()
+
+        self._images[key] = image
+        self.size_in_bytes += image.sizeInBytes()
+
+        self._evict()
+
+    def __contains__(self, key) -> bool:
+        return key in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def clear(self):
+        """Removes all images from the cache. The statistics are kept."""
+        self._images.clear()
+        self.size_in_bytes = 0
+
+    def reset_statistics(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._hits_by_key.clear()
+        self._misses_by_key.clear()
+
+    @property
+    def hits_by_dimension(self) -> dict[str, Counter]:
+        return self._by_dimension(self._hits_by_key)
+
+    @property
+    def misses_by_dimension(self) -> dict[str, Counter]:
+        return self._by_dimension(self._misses_by_key)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / lookups
+
+    def summary(self) -> str:
+        lines = [
+            f"Images: {len(self)}",
+            f"Memory: {self.size_in_bytes / 2**20:.2f} of {self.max_bytes / 2**20:.2f} MiB",
+            f"Hits: {self.hits}, Misses: {self.misses}, Hit Rate: {self.hit_rate:.1%}",
+            f"Evictions: {self.evictions}",
+        ]
+
+        hits_by_dimension = self.hits_by_dimension
+        misses_by_dimension = self.misses_by_dimension
+
+        for dimension in ["block_length", "selected", "transparent", "anim_frame", "graphics_set"]:
+            values = sorted(set(hits_by_dimension[dimension]) | set(misses_by_dimension[dimension]))
+
+            counts = ", ".join(
+                f"{value}: {hits_by_dimension[dimension][value]}/{misses_by_dimension[dimension][value]}"
+                for value in values
+            )
+
+            lines.append(f"Hits/Misses by {dimension}: {counts or '-'}")
+
+        return "\n".join(lines)
+
+    def _evict(self):
+        # always keep the last added image, even if it alone is over budget
+        while self.size_in_bytes > self.max_bytes and len(self._images) > 1:
+            _, image = self._images.popitem(last=False)
+
+            self.size_in_bytes -= image.sizeInBytes()
+            self.evictions += 1
+
+    @staticmethod
+    def _by_dimension(counts_by_key: Counter[BlockCacheKey]) -> dict[str, Counter]:
+        # lookups only count their whole key, since splitting it up for every block drawn is too slow
+        counters: dict[str, Counter] = {dimension: Counter() for dimension in KEY_DIMENSIONS}
+
+        for key, count in counts_by_key.items():
+            for dimension, value in zip(KEY_DIMENSIONS, _key_values(key)):
+                counters[dimension][value] += count
+
+        return counters
@@ -1,12 +1,10 @@
-from PySide6.QtGui import QImage
+from PySide6.QtGui import QColor, QImage
 
 from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import NESPalette, PaletteGroup
-from foundry.game.gfx.drawable import MASK_COLOR, bit_reverse
+from foundry.game.gfx.drawable import MASK_COLOR
 from smb3parse.objects.object_set import CLOUDY_GRAPHICS_SET
 
-PIXEL_OFFSET = 8  # both bits describing the color of a pixel are in separate 8 byte chunks at the same index
-
 BACKGROUND_COLOR_INDEX = 0
 
 
@@ -25,65 +23,41 @@ class Tile:
         palette_index: int,
         graphics_set: GraphicsSet,
         mirrored=False,
+        anim_frame=0,
     ):
         self.tile_index = object_index
 
-        start = object_index * Tile.SIZE
-
-        self.cached_tiles: dict[int, QImage] = dict()
-
-        self.palette = palette_group[palette_index]
+        start = object_index * Tile.PIXEL_COUNT
 
-        self.data = bytearray()
-        self.pixels = bytearray()
-        self.mask_pixels = bytearray()
+        self.palette_group = palette_group
+        self.palette_index = palette_index
 
-        self.data = graphics_set.data[start : start + Tile.SIZE]
+        self.color_indices = graphics_set.color_indices(mirrored, anim_frame)[start : start + Tile.PIXEL_COUNT]
 
         if graphics_set.number == CLOUDY_GRAPHICS_SET:
             self.background_color_index = 2
         else:
             self.background_color_index = 0
 
-        if mirrored:
-            self._mirror()
-
-        for i in range(Tile.PIXEL_COUNT):
-            byte_index = i // Tile.HEIGHT
-            bit_index = 2 ** (7 - (i % Tile.WIDTH))
-
-            left_bit = right_bit = 0
-
-            if self.data[byte_index] & bit_index:
-                left_bit = 1
-
-            if self.data[PIXEL_OFFSET + byte_index] & bit_index:
-                right_bit = 1
-
-            color_index = (right_bit << 1) | left_bit
-
-            color = self.palette[color_index]
-
-            # add alpha values
-            if color_index == self.background_color_index:
-                self.pixels.extend(MASK_COLOR)
-            else:
-                self.pixels.extend(NESPalette[color].toTuple()[:3])
-
-        assert len(self.pixels) == 3 * Tile.PIXEL_COUNT
-
-    def as_image(self, tile_length=8):
-        if True or tile_length not in self.cached_tiles.keys():
-            width = height = tile_length
+        assert len(self.color_indices) == Tile.PIXEL_COUNT
 
-            image = QImage(self.pixels, self.WIDTH, self.HEIGHT, QImage.Format_RGB888)
+    @property
+    def palette(self) -> bytearray:
+        # looked up every time, so that changes to the palette group are picked up without decoding the tile again
+        return self.palette_group[self.palette_index]
 
-            image = image.scaled(width, height)
+    def color_table(self) -> list[int]:
+        """
+        The colors of the current palette, with the background color replaced by the mask color. Meant to be used as
+        the color table of images made from the color indices of this tile.
+        """
+        color_table = [NESPalette[color].rgb() for color in self.palette]
+        color_table[self.background_color_index] = QColor(*MASK_COLOR).rgb()
 
-            self.cached_tiles[tile_length] = image
+        return color_table
 
-        return self.cached_tiles[tile_length]
+    def as_image(self, tile_length=8) -> QImage:
+        image = QImage(self.color_indices, self.WIDTH, self.HEIGHT, self.WIDTH, QImage.Format_Indexed8)
+        image.setColorTable(self.color_table())
 
-    def _mirror(self):
-        for byte in range(len(self.data)):
-            self.data[byte] = bit_reverse[self.data[byte]]
+        return image.scaled(tile_length, tile_length)
@@ -299,3 +299,56 @@ def apply_selection_overlay(image, mask):
     _painter = QPainter(image)
     _painter.drawImage(QPoint(), overlay)
     _painter.end()
+
+
+TILE_SIZE = 16  # bytes, 2 bit planes of 8 bytes each
+TILE_PIXEL_COUNT = 8 * 8
+
+_BIT_REVERSE_TABLE = bytes(bit_reverse)
+
+
+def _spread_bits(byte: int) -> int:
+    """
+    Moves every bit of the byte into its own byte of a 64 bit integer, so that the most significant bit ends up in the
+    most significant byte. Read out in big endian, this gives the 8 pixels of a tile row from left to right.
+    """
+    spread = 0
+
+    for bit in range(8):
+        if byte & (1 << bit):
+            spread |= 1 << (8 * bit)
+
+    return spread
+
+
+_SPREAD_BITS = [_spread_bits(byte) for byte in range(256)]
+
+
+def decode_chr(data: bytes | bytearray, mirrored=False) -> bytes:
+    """
+    Decodes a buffer of NES CHR data into the 2 bit color indices of its pixels.
+
+    Every 16 bytes of the buffer describe one 8x8 tile, with the low bits of its color indices in the first 8 bytes and
+    the high bits in the second 8 bytes. Instead of testing every bit of every pixel, whole rows are decoded at once,
+    by spreading the bits of both planes into 8 bytes each and combining them.
+
+    :param data: The CHR data to decode. Trailing bytes, that do not make up a whole tile, are ignored.
+    :param mirrored: Whether to mirror all tiles horizontally.
+
+    :return: The color indices of all tiles, in rows of 8, one byte per pixel. Tile N starts at N * TILE_PIXEL_COUNT.
+    """
+    if mirrored:
+        data = bytes(data).translate(_BIT_REVERSE_TABLE)
+
+    tile_data_length = len(data) - len(data) % TILE_SIZE
+
+    color_indices = bytearray()
+
+    for tile_start in range(0, tile_data_length, TILE_SIZE):
+        low_plane = data[tile_start : tile_start + 8]
+        high_plane = data[tile_start + 8 : tile_start + TILE_SIZE]
+
+        for low_byte, high_byte in zip(low_plane, high_plane):
+            color_indices += (_SPREAD_BITS[low_byte] | _SPREAD_BITS[high_byte] << 1).to_bytes(8, "big")
+
+    return bytes(color_indices)
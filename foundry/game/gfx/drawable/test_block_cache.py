@@ -0,0 +1,69 @@
+from PySide6.QtGui import QImage
+
+from foundry.game.gfx.drawable.BlockCache import BlockCache
+
+
+def _key(block_index: int, block_length: int = 16, anim_frame: int = 0):
+    return (block_index, 1, bytes(4), 1), block_length, False, True, anim_frame
+
+
+def _image(block_length: int = 16) -> QImage:
+    return QImage(block_length, block_length, QImage.Format_ARGB32)
+
+
+def test_least_recently_used_is_evicted():
+    # GIVEN a cache, that has room for exactly two images
+    cache = BlockCache(max_bytes=2 * _image().sizeInBytes())
+
+    cache[_key(1)] = _image()
+    cache[_key(2)] = _image()
+
+    # WHEN the first image is used and a third one is added
+    assert cache.get(_key(1)) is not None
+
+    cache[_key(3)] = _image()
+
+    # THEN the second image, which was not used recently, was evicted
+    assert _key(1) in cache
+    assert _key(2) not in cache
+    assert _key(3) in cache
+
+    assert cache.evictions == 1
+    assert cache.size_in_bytes == 2 * _image().sizeInBytes()
+
+
+def test_hits_and_misses_are_counted_by_dimension():
+    # GIVEN an empty cache
+    cache = BlockCache()
+
+    # WHEN an image is looked up before and after it was added, at two different zoom levels
+    for block_length in [16, 32]:
+        assert cache.get(_key(5, block_length)) is None
+
+        cache[_key(5, block_length)] = _image(block_length)
+
+        assert cache.get(_key(5, block_length)) is not None
+
+    # THEN all lookups are counted in total and per value of the key
+    assert cache.hits == cache.misses == 2
+    assert cache.hit_rate == 0.5
+
+    assert cache.hits_by_dimension["block_length"] == {16: 1, 32: 1}
+    assert cache.misses_by_dimension["block_index"] == {5: 2}
+
+
+def test_clear_frees_all_memory():
+    # GIVEN a cache with images in it
+    cache = BlockCache()
+
+    for block_index in range(10):
+        cache[_key(block_index)] = _image()
+
+    assert cache.size_in_bytes == 10 * _image().sizeInBytes()
+
+    # WHEN it is cleared
+    cache.clear()
+
+    # THEN no images or memory are accounted for anymore
+    assert len(cache) == 0
+    assert cache.size_in_bytes == 0
@@ -0,0 +1,53 @@
+import pytest
+
+from foundry.game.gfx.drawable import TILE_PIXEL_COUNT, TILE_SIZE, bit_reverse, decode_chr
+
+
+def _decode_tile_bit_by_bit(tile_data: bytes) -> bytes:
+    color_indices = bytearray()
+
+    for i in range(TILE_PIXEL_COUNT):
+        byte_index = i // 8
+        bit_index = 2 ** (7 - (i % 8))
+
+        low_bit = int(bool(tile_data[byte_index] & bit_index))
+        high_bit = int(bool(tile_data[8 + byte_index] & bit_index))
+
+        color_indices.append((high_bit << 1) | low_bit)
+
+    return bytes(color_indices)
+
+
+def test_decode_known_tile():
+    # GIVEN a tile with a filled top row of color 1 and a single pixel of color 3 in the bottom right corner
+    tile_data = bytes([0xFF, 0, 0, 0, 0, 0, 0, 0x01, 0, 0, 0, 0, 0, 0, 0, 0x01])
+
+    # WHEN it is decoded
+    color_indices = decode_chr(tile_data)
+
+    # THEN only those pixels have a color index
+    assert color_indices[:8] == bytes([1] * 8)
+    assert color_indices[8:-1] == bytes(TILE_PIXEL_COUNT - 9)
+    assert color_indices[-1] == 3
+
+
+@pytest.mark.parametrize("mirrored", [False, True])
+def test_decode_matches_bitwise_decoding(mirrored):
+    # GIVEN a buffer of multiple tiles, with every possible byte value in both bit planes
+    chr_data = bytes(range(256)) + bytes(reversed(range(256)))
+
+    # WHEN the whole buffer is decoded at once
+    color_indices = decode_chr(chr_data, mirrored)
+
+    # THEN every tile equals the tile decoded pixel by pixel
+    assert len(color_indices) == len(chr_data) // TILE_SIZE * TILE_PIXEL_COUNT
+
+    for tile_index in range(len(chr_data) // TILE_SIZE):
+        tile_data = chr_data[tile_index * TILE_SIZE : (tile_index + 1) * TILE_SIZE]
+
+        if mirrored:
+            tile_data = bytes(bit_reverse[byte] for byte in tile_data)
+
+        start = tile_index * TILE_PIXEL_COUNT
+
+        assert color_indices[start : start + TILE_PIXEL_COUNT] == _decode_tile_bit_by_bit(tile_data)
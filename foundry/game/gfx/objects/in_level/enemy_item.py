@@ -16,7 +16,23 @@ from smb3parse.constants import OBJ_AUTOSCROLL, OBJ_BOOMBOOM, OBJ_FLYING_BOOMBOO
 from smb3parse.objects.object_set import ENEMY_ITEM_GRAPHICS_SET, ENEMY_ITEM_OBJECT_SET
 
 
+_block_images: dict[tuple[int, int], list[QImage]] = {}
+"""The block images of every type of enemy or item, by the sprite sheet they were cut out of. Shared by all of them."""
+
+
 class EnemyItem(InLevelObject):
+    __slots__ = (
+        "is_fixed",
+        "length",
+        "lock_index",
+        "auto_scroll_type",
+        "graphics_set",
+        "png_data",
+        "width",
+        "height",
+        "blocks",
+    )
+
     def __init__(self, data, png_data, palette_group: PaletteGroup):
         super(EnemyItem, self).__init__()
 
@@ -78,16 +94,21 @@ class EnemyItem(InLevelObject):
 
         self._render(obj_def)
 
+        self._rect_changed()
+
     def _render(self, obj_def):
-        self.blocks = []
+        key = (self.png_data.cacheKey(), self.obj_index)
+
+        if key not in _block_images:
+            _block_images[key] = []
 
-        block_ids = obj_def.object_design
+            for block_id in obj_def.object_design:
+                x = (block_id % 64) * Block.WIDTH
+                y = (block_id // 64) * Block.WIDTH
 
-        for block_id in block_ids:
-            x = (block_id % 64) * Block.WIDTH
-            y = (block_id // 64) * Block.WIDTH
+                _block_images[key].append(self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT)))
 
-            self.blocks.append(self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT)))
+        self.blocks = _block_images[key]
 
     def copy(self):
         return EnemyItem(self.to_bytes(), self.png_data, self.palette_group)
@@ -10,6 +10,19 @@ ENEMY_ITEM_SPRITE_SHEET = QImage(str(data_dir.joinpath("gfx.png")))
 
 ENEMY_ITEM_SPRITE_SHEET.convertTo(QImage.Format_RGB888)
 
+_ROWS_PER_OBJECT_SET = 256 // 64
+_ENEMY_ITEM_Y_OFFSET = 12 * _ROWS_PER_OBJECT_SET * Block.HEIGHT
+
+ENEMY_ITEM_GRAPHICS = ENEMY_ITEM_SPRITE_SHEET.copy(
+    QRect(
+        0,
+        _ENEMY_ITEM_Y_OFFSET,
+        ENEMY_ITEM_SPRITE_SHEET.width(),
+        ENEMY_ITEM_SPRITE_SHEET.height() - _ENEMY_ITEM_Y_OFFSET,
+    )
+)
+"""Cut out once, so that all enemies and items can share the block images cut out of it."""
+
 
 class EnemyItemFactory:
     object_set: int
@@ -18,18 +31,7 @@ class EnemyItemFactory:
     definitions: list = []
 
     def __init__(self, object_set: int, palette_index: int):
-        rows_per_object_set = 256 // 64
-
-        y_offset = 12 * rows_per_object_set * Block.HEIGHT
-
-        self.png_data = ENEMY_ITEM_SPRITE_SHEET.copy(
-            QRect(
-                0,
-                y_offset,
-                ENEMY_ITEM_SPRITE_SHEET.width(),
-                ENEMY_ITEM_SPRITE_SHEET.height() - y_offset,
-            )
-        )
+        self.png_data = ENEMY_ITEM_GRAPHICS
 
         self.palette_group = load_palette_group(object_set, palette_index)
 
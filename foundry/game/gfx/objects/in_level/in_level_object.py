@@ -11,6 +11,18 @@ from foundry.game.gfx.objects.object_like import ObjectLike
 
 
 class InLevelObject(ObjectLike, abc.ABC):
+    __slots__ = (
+        "object_set",
+        "palette_group",
+        "_obj_index",
+        "domain",
+        "is_4byte",
+        "data",
+        "rendered_height",
+        "rendered_width",
+        "anim_frame",
+    )
+
     object_set: ObjectSet
     palette_group: PaletteGroup
 
@@ -23,11 +35,13 @@ class InLevelObject(ObjectLike, abc.ABC):
     rendered_height: int
     rendered_width: int
 
-    anim_frame: int = 0
+    anim_frame: int
 
     def __init__(self):
         super(InLevelObject, self).__init__()
 
+        self.anim_frame = 0
+
         # TODO base this on Position, like MapObjects do
         self.x_position = 0
         self.y_position = 0
@@ -49,6 +63,8 @@ class InLevelObject(ObjectLike, abc.ABC):
     def obj_index(self, value):
         self._obj_index = value
 
+        self._rect_changed()
+
     @abc.abstractmethod
     def render(self):
         pass
@@ -7,6 +7,8 @@ from smb3parse.levels import LEVEL_SCREEN_HEIGHT, LEVEL_SCREEN_WIDTH
 
 
 class Jump(InLevelObject):
+    __slots__ = ("blocks", "screen_index", "exit_vertical", "exit_action", "exit_horizontal")
+
     POINTER_DOMAIN = 0b111
 
     SIZE = 3  # bytes
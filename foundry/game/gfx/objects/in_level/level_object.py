@@ -1,3 +1,4 @@
+from typing import Iterator, Optional
 from warnings import warn
 
 from PySide6.QtCore import QRect, QSize
@@ -18,6 +19,7 @@ from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import PaletteGroup, bg_color_for_object_set
 from foundry.game.gfx.drawable.Block import Block, get_block
 from foundry.game.gfx.objects.in_level.in_level_object import InLevelObject
+from foundry.game.level.SpatialIndex import objects_intersecting, position_in
 from smb3parse.levels import (
     LEVEL_SCREEN_HEIGHT,
     LEVEL_SCREEN_WIDTH,
@@ -59,6 +61,31 @@ class LevelObjectRenderWarning(UserWarning):
 
 
 class LevelObject(InLevelObject):
+    __slots__ = (
+        "graphics_set",
+        "tsa_data",
+        "rendered_base_x",
+        "rendered_base_y",
+        "rendered_blocks",
+        "is_fixed",
+        "index_in_level",
+        "objects_ref",
+        "vertical_level",
+        "size_minimal",
+        "ground_level",
+        "_length",
+        "secondary_length",
+        "_last_render_inputs",
+        "original_x",
+        "original_y",
+        "width",
+        "height",
+        "orientation",
+        "ending",
+        "blocks",
+        "rect",
+    )
+
     def __init__(
         self,
         data: bytearray,
@@ -102,6 +129,8 @@ class LevelObject(InLevelObject):
         self._length = 0
         self.secondary_length = 0
 
+        self._last_render_inputs: Optional[tuple] = None
+
         self._setup()
 
     def _setup(self):
@@ -137,9 +166,8 @@ class LevelObject(InLevelObject):
         self.ending = EndType(object_data.ending)
         self.name = object_data.description
 
-        self.blocks = [int(block) for block in object_data.rom_object_design]
-
-        self.block_cache = {}
+        # shared by all objects of this type, so it must not be changed
+        self.blocks = object_data.rom_object_design
 
         self.is_4byte = object_data.is_4byte
 
@@ -213,7 +241,47 @@ class LevelObject(InLevelObject):
             self.length = self.data[3]
 
     def render(self):
-        self._render()
+        """Renders the object, unless nothing its rendered blocks depend on has changed, since it was last rendered."""
+        self._update_index_in_level()
+
+        if self._render_inputs() != self._last_render_inputs:
+            self._render()
+
+    def _render_inputs(self) -> tuple:
+        inputs: tuple = (
+            self.x_position,
+            self.y_position,
+            self.domain,
+            self.obj_index,
+            bytes(self.data),
+            self.length,
+            self.secondary_length,
+            self.ground_level,
+        )
+
+        if not (area := self._to_the_ground_area()).isNull():
+            # the objects before this one, that might stop it from extending to the ground
+            inputs += tuple(obj.get_rect() for obj in objects_intersecting(self.objects_ref, area, self.index_in_level))
+
+        return inputs
+
+    def _update_index_in_level(self):
+        # if the object has not been added yet, stick with the one given in the constructor
+        if (index_in_level := position_in(self.objects_ref, self)) is not None:
+            self.index_in_level = index_in_level
+
+    def _to_the_ground_area(self) -> QRect:
+        """The area, in which objects before this one can stop it from extending to the ground, if it does that."""
+        max_height = self.ground_level - self.y_position
+
+        if self.orientation == GeneratorType.HORIZ_TO_GROUND:
+            return QRect(self.x_position, self.y_position, self.length + 1, max_height)
+
+        elif self.orientation in [GeneratorType.PYRAMID_TO_GROUND, GeneratorType.PYRAMID_2]:
+            # pyramids grow from their tip, one block to the right of their position
+            return QRect(self.x_position + 1, self.y_position, 2 * max_height, max_height)
+
+        return QRect()
 
     def _render(self):
         self.rendered_base_x = base_x = self.x_position
@@ -222,9 +290,7 @@ class LevelObject(InLevelObject):
         self.rendered_width = new_width = self.width
         self.rendered_height = new_height = self.height
 
-        # if the object has not been added yet, stick with the one given in the constructor
-        if self in self.objects_ref:
-            self.index_in_level = self.objects_ref.index(self)
+        self._update_index_in_level()
 
         blocks_to_draw = []
 
@@ -395,18 +461,15 @@ class LevelObject(InLevelObject):
 
             base_x += 1  # set the new base_x to the tip of the pyramid
 
+            rects_by_top = self._rects_of_objects_before(self._to_the_ground_area())
+
             for y in range(base_y, self.ground_level):
                 new_height = y - base_y
                 new_width = 2 * new_height
 
-                bottom_row = QRect(base_x, y, new_width, 1)
+                row_rect = QRect(base_x, y, new_width, 1)
 
-                if any(
-                    [
-                        bottom_row.intersects(obj.get_rect()) and y == obj.get_rect().top()
-                        for obj in self.objects_ref[0 : self.index_in_level]
-                    ]
-                ):
+                if any(row_rect.intersects(rect) for rect in rects_by_top.get(y, [])):
                     break
 
             base_x = base_x - (new_width // 2)
@@ -546,15 +609,12 @@ class LevelObject(InLevelObject):
 
             if self.orientation == GeneratorType.HORIZ_TO_GROUND:
                 # to the ground only, until it hits something
+                rects_by_top = self._rects_of_objects_before(self._to_the_ground_area())
+
                 for y in range(base_y, self.ground_level):
-                    bottom_row = QRect(base_x, y, new_width, 1)
+                    row_rect = QRect(base_x, y, new_width, 1)
 
-                    if any(
-                        [
-                            bottom_row.intersects(obj.get_rect()) and y == obj.get_rect().top()
-                            for obj in self.objects_ref[0 : self.index_in_level]
-                        ]
-                    ):
+                    if any(row_rect.intersects(rect) for rect in rects_by_top.get(y, [])):
                         new_height = y - base_y
                         break
                 else:
@@ -727,8 +787,33 @@ class LevelObject(InLevelObject):
             self.rendered_height,
         )
 
+        self._rect_changed()
+
+        self._last_render_inputs = self._render_inputs()
+
+    def _rects_of_objects_before(self, area: QRect) -> dict[int, list[QRect]]:
+        """
+        Returns the rects of the objects, that come before this one in the level and intersect the given area, by the
+        row their top edge is in.
+        """
+        rects_by_top: dict[int, list[QRect]] = {}
+
+        for obj in objects_intersecting(self.objects_ref, area, self.index_in_level):
+            rect = obj.get_rect()
+
+            rects_by_top.setdefault(rect.top(), []).append(rect)
+
+        return rects_by_top
+
     def draw(self, painter: QPainter, block_length, transparent):
-        for index, block_index in enumerate(self.rendered_blocks):
+        visible_blocks: Iterator[tuple[int, int]]
+
+        if not painter.hasClipping():
+            visible_blocks = enumerate(self.rendered_blocks)
+        else:
+            visible_blocks = self._blocks_in(painter.clipBoundingRect().toAlignedRect(), block_length)
+
+        for index, block_index in visible_blocks:
             if block_index == BLANK:
                 continue
 
@@ -737,12 +822,27 @@ class LevelObject(InLevelObject):
 
             self._draw_block(painter, block_index, x, y, block_length, transparent)
 
+    def _blocks_in(self, pixel_rect: QRect, block_length: int) -> Iterator[tuple[int, int]]:
+        """Yields the indexes and values of the rendered blocks, that are inside the given rect of the level."""
+        row_count = -(-len(self.rendered_blocks) // self.rendered_width)
+
+        first_column = max(0, pixel_rect.left() // block_length - self.rendered_base_x)
+        last_column = min(self.rendered_width - 1, pixel_rect.right() // block_length - self.rendered_base_x)
+
+        first_row = max(0, pixel_rect.top() // block_length - self.rendered_base_y)
+        last_row = min(row_count - 1, pixel_rect.bottom() // block_length - self.rendered_base_y)
+
+        for row in range(first_row, last_row + 1):
+            row_start = row * self.rendered_width
+
+            for index in range(row_start + first_column, min(row_start + last_column + 1, len(self.rendered_blocks))):
+                yield index, self.rendered_blocks[index]
+
     def _draw_block(self, painter: QPainter, block_index, x, y, block_length, transparent):
-        if block_index not in self.block_cache:
-            self.block_cache[block_index] = get_block(block_index, self.palette_group, self.graphics_set, self.tsa_data)
+        block = get_block(block_index, self.palette_group, self.graphics_set, self.tsa_data)
 
-        self.block_cache[block_index].graphics_set.anim_frame = self.anim_frame
-        self.block_cache[block_index].draw(
+        block.graphics_set.anim_frame = self.anim_frame
+        block.draw(
             painter,
             x * block_length,
             y * block_length,
@@ -962,6 +1062,9 @@ class LevelObject(InLevelObject):
 
         self.draw(painter, Block.SIDE_LENGTH, True)
 
+        # the rendered position was changed for the image, so the next call to render has to restore it
+        self._last_render_inputs = None
+
         return image
 
     def to_bytes(self) -> bytearray:
@@ -1,10 +1,14 @@
 import abc
+from typing import Callable, Optional
 
 from PySide6.QtCore import QRect
 from PySide6.QtGui import QPainter
 
 
 class ObjectLike(abc.ABC):
+    # levels can have hundreds of objects, so don't give every one of them a __dict__
+    __slots__ = ("rect_listener", "selected", "_name", "_type", "_x_position", "_y_position")
+
     # TODO too ambiguous to be part of an API?
     # This whole thing with everything needing to be a property to be type consistent kinda blows...
     selected: bool
@@ -12,6 +16,9 @@ class ObjectLike(abc.ABC):
     rect: QRect
 
     def __init__(self):
+        self.rect_listener: Optional[Callable[["ObjectLike"], None]] = None
+        """Called, whenever the rect of the object might have changed. Used by the SpatialIndex of the level."""
+
         self.selected = False
         self._name = ""
         self._type = 0
@@ -35,6 +42,8 @@ class ObjectLike(abc.ABC):
     def x_position(self, value):
         self._x_position = value
 
+        self._rect_changed()
+
     @property
     def y_position(self):
         return self._y_position
@@ -43,6 +52,8 @@ class ObjectLike(abc.ABC):
     def y_position(self, value):
         self._y_position = value
 
+        self._rect_changed()
+
     @property
     def type(self):
         return self._type
@@ -51,6 +62,10 @@ class ObjectLike(abc.ABC):
     def type(self, value):
         self._type = value
 
+    def _rect_changed(self):
+        if self.rect_listener is not None:
+            self.rect_listener(self)
+
     @abc.abstractmethod
     def draw(self, painter: QPainter, block_length, transparent):
         pass
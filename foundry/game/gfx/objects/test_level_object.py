@@ -226,3 +226,18 @@ def test_all_minimal_objects(factory, domain, obj_id, qtbot):
         pytest.skip("MSG_CRASH")
 
     _test_object_against_reference(get_minimal_icon_object(level_object), qtbot, minimal=True)
+
+
+def test_objects_share_type_data():
+    # GIVEN two objects of the same type
+    object_factory = LevelObjectFactory(HILLY_OBJECT_SET, HILLY_GRAPHICS_SET, 0, [], False)
+
+    first_object = object_factory.from_properties(0, 0x30, 0, 0, None, 0)
+    second_object = object_factory.from_properties(0, 0x30, 5, 5, None, 1)
+
+    # THEN they don't each hold a copy of the data, that all objects of that type have in common
+    assert first_object.blocks is second_object.blocks
+    assert first_object.tsa_data is second_object.tsa_data
+
+    # THEN they don't carry an attribute dictionary around
+    assert not hasattr(first_object, "__dict__")
@@ -1,4 +1,4 @@
-from typing import Optional, cast
+from typing import Generator, Optional, cast
 
 from PySide6.QtCore import QObject, QPoint, QRect, QSize, Signal, SignalInstance
 
@@ -15,12 +15,14 @@ from foundry.game.gfx.objects import (
 from foundry.game.gfx.objects.in_level.in_level_object import InLevelObject
 from foundry.game.gfx.objects.object_like import ObjectLike
 from foundry.game.level import (
+    ByteStream,
     EnemyItemData,
     LevelByteData,
     ObjectData,
     _load_level_offsets,
 )
 from foundry.game.level.LevelLike import LevelLike
+from foundry.game.level.SpatialIndex import IndexedList
 from foundry.gui.asm import bytes_to_asm
 from smb3parse import OFFSET_BY_OBJECT_SET_A000
 from smb3parse.constants import BASE_OFFSET, ENEMY_SIZE, OFFSET_SIZE
@@ -78,18 +80,20 @@ class Level(LevelLike):
         self.object_offset = self.header_offset + HEADER_LENGTH
         self.enemy_offset = enemy_data_offset
 
-        self.objects: list[LevelObject] = []
+        self._objects: IndexedList[LevelObject] = IndexedList()
         self.header_bytes: bytearray = bytearray()
         self.jumps: list[Jump] = []
-        self.enemies: list[EnemyItem] = []
+        self._enemies: IndexedList[EnemyItem] = IndexedList()
         self.first_enemy_byte = 0x00
 
+        self.object_factory: Optional[LevelObjectFactory] = None
+        self._enemy_item_factory_inputs: Optional[tuple[int, int]] = None
+
         if self.layout_address == self.enemy_offset == 0:
             # probably loaded to become an m3l
             self.size = (0, 0)
             self.header_bytes = bytearray(9)
             self.header = LevelHeader(ROM(), self.header_bytes, self.object_set.number)
-            self.object_factory: Optional[LevelObjectFactory] = None
             self.enemy_factory: Optional[EnemyItemFactory] = None
             return
 
@@ -98,18 +102,28 @@ class Level(LevelLike):
         self.header_bytes = rom.read(self.header_offset, HEADER_LENGTH)
         self._parse_header()
 
-        object_data = ROM.rom_data[self.object_offset :]
+        # read the object and enemy data directly out of the ROM, instead of copying everything after their start
+        with memoryview(ROM.rom_data) as rom_data:
+            object_data = rom_data[self.object_offset :]
 
-        if self.enemy_offset == 0x0:
-            enemy_data = bytearray()
-        else:
-            enemy_data = ROM.rom_data[self.enemy_offset :]
+            if self.enemy_offset == 0x0:
+                enemy_data = rom_data[0:0]
+            else:
+                enemy_data = rom_data[self.enemy_offset :]
 
-        self._load_level_data(object_data, enemy_data)
+            # release the views right away, since the ROM data can't be resized, as long as they exist
+            with object_data, enemy_data:
+                self._load_level_data(object_data, enemy_data)
 
-    def _load_level_data(self, object_data: bytearray, enemy_data: bytearray, new_level: bool = True):
-        self._load_objects(object_data)
-        self._load_enemies(enemy_data)
+    def _load_level_data(self, object_data: ByteStream, enemy_data: ByteStream, new_level: bool = True):
+        for _ in self._gen_load_level_data(object_data, enemy_data, new_level):
+            pass
+
+    def _gen_load_level_data(
+        self, object_data: ByteStream, enemy_data: ByteStream, new_level: bool = True
+    ) -> Generator[None, None, None]:
+        yield from self._gen_load_objects(object_data)
+        yield from self._gen_load_enemies(enemy_data)
 
         if new_level:
             self._update_level_size()
@@ -131,6 +145,23 @@ class Level(LevelLike):
     def detach_from_rom(self):
         self.header_offset = self.enemy_offset = 0
 
+    @property
+    def objects(self) -> IndexedList[LevelObject]:
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects: list[LevelObject]):
+        # keep the same list, since the object factory and the objects themselves hold a reference to it
+        self._objects[:] = objects
+
+    @property
+    def enemies(self) -> IndexedList[EnemyItem]:
+        return self._enemies
+
+    @enemies.setter
+    def enemies(self, enemies: list[EnemyItem]):
+        self._enemies[:] = enemies
+
     @property
     def width(self):
         return self.size[0]
@@ -162,6 +193,10 @@ class Level(LevelLike):
 
         object_data = header_and_object_data[HEADER_LENGTH:]
 
+        # make new factories, in case the graphics or palettes they hold were read in again
+        self.object_factory = None
+        self._enemy_item_factory_inputs = None
+
         self._parse_header()
         self._load_level_data(object_data, enemy_data, new_level=False)
 
@@ -186,71 +221,112 @@ class Level(LevelLike):
     def _parse_header(self, should_emit=True):
         self.header = LevelHeader(ROM(), self.header_bytes, self.object_set_number)
 
-        self.object_factory = LevelObjectFactory(
-            self.object_set_number,
-            self.header.graphic_set_index,
-            self.header.object_palette_index,
-            self.objects,
-            bool(self.header.is_vertical),
-        )
-        self.enemy_item_factory = EnemyItemFactory(self.object_set_number, self.header.enemy_palette_index)
+        self._update_factories()
 
         self.size = self.header.width, self.header.height
 
         if should_emit:
             self.data_changed.emit()
 
-    def _load_enemies(self, data: bytearray):
+    def _update_factories(self):
+        """
+        Makes the factories fit the header. Since they read in graphics and palettes, they are only changed, when the
+        fields they depend on change, so that changing the time or music of a level doesn't have to wait for them.
+        """
+        is_vertical = bool(self.header.is_vertical)
+
+        if (
+            self.object_factory is None
+            or self.object_factory.object_set != self.object_set_number
+            or self.object_factory.vertical_level != is_vertical
+        ):
+            self.object_factory = LevelObjectFactory(
+                self.object_set_number,
+                self.header.graphic_set_index,
+                self.header.object_palette_index,
+                self.objects,
+                is_vertical,
+            )
+        elif (self.object_factory.graphic_set, self.object_factory.palette_group_index) != (
+            self.header.graphic_set_index,
+            self.header.object_palette_index,
+        ):
+            self.object_factory.set_graphic_set(self.header.graphic_set_index)
+            self.object_factory.set_palette_group_index(self.header.object_palette_index)
+
+            self._update_object_graphics()
+
+        enemy_item_factory_inputs = (self.object_set_number, self.header.enemy_palette_index)
+
+        if enemy_item_factory_inputs != self._enemy_item_factory_inputs:
+            self.enemy_item_factory = EnemyItemFactory(*enemy_item_factory_inputs)
+            self._enemy_item_factory_inputs = enemy_item_factory_inputs
+
+    def _update_object_graphics(self):
+        """Gives the existing objects the graphics and palettes of the object factory, instead of loading them again."""
+        assert self.object_factory is not None
+        assert self.object_factory.graphics_set is not None
+
+        for level_object in self.objects:
+            level_object.graphics_set = self.object_factory.graphics_set
+            level_object.palette_group = self.object_factory.palette_group
+
+    def _load_enemies(self, data: ByteStream):
+        for _ in self._gen_load_enemies(data):
+            pass
+
+    def _gen_load_enemies(self, data: ByteStream) -> Generator[None, None, None]:
+        """Loads the enemies and items, yielding after every one of them."""
         if not data:
             return
 
         self.enemies.clear()
 
-        def data_left(_data: bytearray):
-            # the commented out code seems to hold for the stock ROM, but if the ROM was already edited with another
-            # editor, it might not, since they only wrote the 0xFF to end the enemy data
-
-            return _data and not _data[0] == 0xFF  # and _data[1] in [0x00, 0x01]
-
         self.first_enemy_byte = data[0]
-        data = data[1:]
+        position = 1
+
+        # the enemy data ends with 0xFF. the stock ROM also seems to have 0x00 or 0x01 in the second byte of every
+        # enemy, but if the ROM was already edited with another editor, it might not, since they only wrote the 0xFF
+        while position < len(data) and data[position] != 0xFF:
+            enemy_data = bytearray(data[position : position + ENEMY_SIZE])
 
-        enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+            self.enemies.append(self.enemy_item_factory.from_data(enemy_data, 0))
 
-        while data_left(enemy_data):
-            enemy = self.enemy_item_factory.from_data(enemy_data, 0)
+            position += ENEMY_SIZE
 
-            self.enemies.append(enemy)
+            yield
 
-            enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+    def _load_objects(self, data: ByteStream):
+        for _ in self._gen_load_objects(data):
+            pass
 
-    def _load_objects(self, data: bytearray):
+    def _gen_load_objects(self, data: ByteStream) -> Generator[None, None, None]:
+        """Loads the objects and jumps, yielding after every one of them."""
         if self.object_factory is None:
             return
 
         self.objects.clear()
         self.jumps.clear()
 
-        if not data or data[0] == 0xFF:
-            return
+        position = 0
 
-        while True:
-            potential_obj_data = data[0:4]
+        while position < len(data) and data[position] != 0xFF:
+            # give the object 4 bytes, it will drop the last one, if it is only a 3 byte object
+            potential_obj_data = bytearray(data[position : position + 4])
 
             level_object = self.object_factory.from_data(potential_obj_data, len(self.objects))
 
-            data = data[3:]
-
             if level_object.is_4byte:
-                data.pop(0)
+                position += 4
+            else:
+                position += 3
 
             if isinstance(level_object, LevelObject):
                 self.objects.append(level_object)
             elif isinstance(level_object, Jump):
                 self.jumps.append(level_object)
 
-            if data[0] == 0xFF:
-                break
+            yield
 
     def _update_level_size(self):
         self.object_size_on_disk = self.current_object_size()
@@ -398,8 +474,6 @@ class Level(LevelLike):
 
         self._parse_header()
 
-        self.reload()
-
     @property
     def pipe_ends_level(self):
         return self.header.pipe_ends_level
@@ -484,8 +558,6 @@ class Level(LevelLike):
 
         self._parse_header()
 
-        self.reload()
-
     @property
     def time_index(self):
         return self.header.time_index
@@ -529,11 +601,20 @@ class Level(LevelLike):
         return cast("list[InLevelObject]", self.objects) + cast("list[InLevelObject]", self.enemies)
 
     def object_at(self, x: int, y: int) -> Optional[InLevelObject]:
-        for obj in reversed(self.get_all_objects()):
-            if obj.point_in(x, y):
-                return obj
-        else:
-            return None
+        # enemies are drawn in front of level objects
+        if enemies_at_point := self.enemies.at(x, y):
+            return enemies_at_point[-1]
+
+        if objects_at_point := self.objects.at(x, y):
+            return objects_at_point[-1]
+
+        return None
+
+    def get_objects_in(self, rect: QRect) -> list[InLevelObject]:
+        """Returns all objects and enemies, that intersect the given rect, in the order of get_all_objects."""
+        return cast("list[InLevelObject]", self.objects.intersecting(rect)) + cast(
+            "list[InLevelObject]", self.enemies.intersecting(rect)
+        )
 
     def bring_to_foreground(self, objects: list[InLevelObject]):
         for obj in objects:
@@ -591,17 +672,13 @@ class Level(LevelLike):
         :return:
         """
         if isinstance(obj, LevelObject):
-            objects_to_check = cast("list[InLevelObject]", self.objects)
+            objects_to_check = cast("IndexedList[InLevelObject]", self.objects)
         elif isinstance(obj, EnemyItem):
-            objects_to_check = cast("list[InLevelObject]", self.enemies)
+            objects_to_check = cast("IndexedList[InLevelObject]", self.enemies)
         else:
             raise TypeError()
 
-        intersecting_objects: list[InLevelObject] = [
-            other_object for other_object in objects_to_check if obj.get_rect().intersects(other_object.get_rect())
-        ]
-
-        return intersecting_objects
+        return objects_to_check.intersecting(obj.get_rect())
 
     def draw(self, *_):
         pass
@@ -875,6 +952,16 @@ class Level(LevelLike):
         return (self.header_offset, data), (self.enemy_offset, enemies)
 
     def from_bytes(self, object_data: ObjectData, enemy_data: EnemyItemData, new_level=True):
+        for _ in self.gen_from_bytes(object_data, enemy_data, new_level):
+            pass
+
+    def gen_from_bytes(
+        self, object_data: ObjectData, enemy_data: EnemyItemData, new_level=True
+    ) -> Generator[None, None, None]:
+        """
+        Same as from_bytes, but yields after every loaded object and enemy, so that loading a big level can be spread
+        over multiple turns of the GUI thread.
+        """
         self.header_offset, object_bytes = object_data
         self.enemy_offset, enemies = enemy_data
 
@@ -882,4 +969,4 @@ class Level(LevelLike):
         objects = object_bytes[HEADER_LENGTH:]
 
         self._parse_header(should_emit=False)
-        self._load_level_data(objects, enemies, new_level)
+        yield from self._gen_load_level_data(objects, enemies, new_level)
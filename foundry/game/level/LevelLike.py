@@ -23,6 +23,10 @@ class LevelLike(LevelBase, abc.ABC):
     def get_all_objects(self):
         pass
 
+    @abc.abstractmethod
+    def get_objects_in(self, rect):
+        pass
+
     @abc.abstractmethod
     def draw(self, dc, block_length, transparency, show_expansion):
         pass
@@ -14,6 +14,8 @@ class LevelRef(QObject):
     data_changed: SignalInstance = cast(SignalInstance, Signal())
     jumps_changed: SignalInstance = cast(SignalInstance, Signal())
     palette_changed: SignalInstance = cast(SignalInstance, Signal())
+    selection_changed: SignalInstance = cast(SignalInstance, Signal(list))
+    """Sends the objects, that were selected or deselected."""
 
     def __init__(self):
         super(LevelRef, self).__init__()
@@ -63,16 +65,26 @@ class LevelRef(QObject):
 
     @selected_objects.setter
     def selected_objects(self, selected_objects):
-        if selected_objects == self.selected_objects:
-            return
-
         if self._internal_level is None:
             return
 
+        # compare by identity, since objects compare equal by serializing themselves
+        selected_ids = {id(obj) for obj in selected_objects}
+
+        changed_objects = []
+
         for obj in self._internal_level.get_all_objects():
-            obj.selected = obj in selected_objects
+            if obj.selected != (id(obj) in selected_ids):
+                obj.selected = not obj.selected
 
-        self.data_changed.emit()
+                changed_objects.append(obj)
+
+        if changed_objects:
+            self.selection_changed.emit(changed_objects)
+
+    def selection_is(self, objects) -> bool:
+        """Whether exactly the given objects are selected, regardless of their order."""
+        return {id(obj) for obj in objects} == {id(obj) for obj in self.selected_objects}
 
     def __getattr__(self, item: str):
         if self._internal_level is None:
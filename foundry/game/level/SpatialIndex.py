@@ -0,0 +1,299 @@
+from array import array
+from collections import defaultdict
+from typing import Callable, Iterable, Optional, Sequence, SupportsIndex, TypeVar
+
+from PySide6.QtCore import QRect
+
+from foundry.game.gfx.objects.object_like import ObjectLike
+
+CELL_SIZE = 16
+"""Width and height of a cell of the grid in blocks. Equal to the width of a level screen."""
+
+ObjectType = TypeVar("ObjectType", bound=ObjectLike)
+
+
+def _cells_of(rect: QRect) -> list[tuple[int, int]]:
+    if rect.isNull():
+        return []
+
+    # QRect.intersects also considers rects without a width or a height, so sort the edges instead of skipping those
+    left, right = sorted((rect.left(), rect.right()))
+    top, bottom = sorted((rect.top(), rect.bottom()))
+
+    columns = range(left // CELL_SIZE, right // CELL_SIZE + 1)
+    rows = range(top // CELL_SIZE, bottom // CELL_SIZE + 1)
+
+    return [(column, row) for column in columns for row in rows]
+
+
+class SpatialIndex:
+    """
+    A uniform grid over the rects of objects in a level. Every object is put into all cells its rect touches, so that
+    looking up the objects in an area or at a point only has to check the objects in the cells of that area, instead
+    of all objects of the level.
+
+    Objects notify the index themselves, when their rect changes, see ObjectLike.rect_listener.
+    """
+
+    def __init__(self, on_update: Optional[Callable[[ObjectLike], None]] = None):
+        self.on_update = on_update
+        """Called with every indexed object, that notified the index, even if its rect stayed the same."""
+
+        self._cells: defaultdict[tuple[int, int], set[int]] = defaultdict(set)
+
+        self._objects: dict[int, ObjectLike] = {}
+        self._rects: dict[int, tuple[int, int, int, int]] = {}
+
+    def add(self, obj: ObjectLike):
+        self._objects[id(obj)] = obj
+        obj.rect_listener = self.update
+
+        self.update(obj)
+
+    def discard(self, obj: ObjectLike):
+        if self._objects.pop(id(obj), None) is None:
+            return
+
+        if obj.rect_listener == self.update:
+            obj.rect_listener = None
+
+        for cell in _cells_of(QRect(*self._rects.pop(id(obj)))):
+            self._cells[cell].discard(id(obj))
+
+    def update(self, obj: ObjectLike):
+        """Moves the object into the cells of its current rect, if it changed since the last update."""
+        if self._objects.get(id(obj)) is not obj:
+            # a stale listener, for example of a copy of an indexed object, must not put unknown ids into the cells
+            return
+
+        if self.on_update is not None:
+            self.on_update(obj)
+
+        rect = obj.get_rect()
+        rect_tuple = rect.x(), rect.y(), rect.width(), rect.height()
+
+        old_rect_tuple = self._rects.get(id(obj), None)
+
+        if rect_tuple == old_rect_tuple:
+            return
+
+        if old_rect_tuple is not None:
+            for cell in _cells_of(QRect(*old_rect_tuple)):
+                self._cells[cell].discard(id(obj))
+
+        for cell in _cells_of(rect):
+            self._cells[cell].add(id(obj))
+
+        self._rects[id(obj)] = rect_tuple
+
+    def objects(self) -> list[ObjectLike]:
+        return list(self._objects.values())
+
+    def clear(self):
+        for obj in self.objects():
+            self.discard(obj)
+
+    def intersecting(self, rect: QRect) -> list[ObjectLike]:
+        """Returns all objects, whose rect intersects the given one, in no particular order."""
+        object_ids: set[int] = set()
+
+        for cell in _cells_of(rect):
+            object_ids.update(self._cells.get(cell, ()))
+
+        return [self._objects[object_id] for object_id in object_ids if rect.intersects(QRect(*self._rects[object_id]))]
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+class IndexedList(list[ObjectType]):
+    """
+    A list of objects, that keeps a SpatialIndex of them up to date, whenever objects are added or removed, and
+    remembers the position of every object in the list. Queries return objects in the order of the list, meaning back
+    to front.
+
+    The type and the position in the level of every object are also kept in arrays parallel to the list, so that they
+    can be searched without going through the objects themselves. They are updated, whenever an object notifies the
+    spatial index.
+
+    Objects are identified by identity, not equality.
+    """
+
+    def __init__(self, objects: Iterable[ObjectType] = ()):
+        super(IndexedList, self).__init__(objects)
+
+        self.spatial_index = SpatialIndex(on_update=self._update_columns)
+        self._positions: dict[int, int] = {}
+
+        self.types = array("H")
+        self.x_positions = array("i")
+        self.y_positions = array("i")
+
+        self._sync()
+
+    def position_of(self, obj: ObjectType) -> Optional[int]:
+        return self._positions.get(id(obj), None)
+
+    def positions_of_type(self, type_: int) -> list[int]:
+        """Returns the positions in the list of all objects of the given type, in order."""
+        positions: list[int] = []
+
+        try:
+            while True:
+                positions.append(self.types.index(type_, positions[-1] + 1 if positions else 0))
+        except ValueError:
+            return positions
+
+    def of_type(self, type_: int) -> list[ObjectType]:
+        """Returns all objects of the given type, in the order of the list."""
+        return [self[position] for position in self.positions_of_type(type_)]
+
+    def intersecting(self, rect: QRect, end: Optional[int] = None) -> list[ObjectType]:
+        """
+        Returns all objects, whose rect intersects the given rect, in the order of the list.
+
+        :param rect: The area to look for objects in, in blocks.
+        :param end: If given, only objects before this position in the list are returned.
+        """
+        objects: list[tuple[int, ObjectType]] = []
+
+        for obj in self.spatial_index.intersecting(rect):
+            position = self._positions[id(obj)]
+
+            if end is None or position < end:
+                objects.append((position, obj))  # type: ignore[arg-type]
+
+        return [obj for _, obj in sorted(objects, key=lambda position_and_object: position_and_object[0])]
+
+    def at(self, x: int, y: int) -> list[ObjectType]:
+        """Returns all objects, that contain the given point, in the order of the list."""
+        return [obj for obj in self.intersecting(QRect(x, y, 1, 1)) if obj.point_in(x, y)]
+
+    def _update_columns(self, obj: ObjectLike):
+        position = self._positions[id(obj)]
+
+        self.types[position] = obj.type
+        self.x_positions[position], self.y_positions[position] = obj.get_position()
+
+    def _sync(self):
+        """Brings the positions, the columns and the spatial index up to date, after the content of the list changed."""
+        self._positions = {id(obj): position for position, obj in enumerate(self)}
+
+        self.types = array("H", (obj.type for obj in self))
+        self.x_positions = array("i", (obj.get_position()[0] for obj in self))
+        self.y_positions = array("i", (obj.get_position()[1] for obj in self))
+
+        for obj in self.spatial_index.objects():
+            if id(obj) not in self._positions:
+                self.spatial_index.discard(obj)
+
+        for obj in self:
+            if obj not in self.spatial_index:
+                self.spatial_index.add(obj)
+
+    # list methods, that change the content
+
+    def append(self, obj: ObjectType):
+        super(IndexedList, self).append(obj)
+
+        # the most common change by far, when loading a level, so no full sync necessary
+        self._positions[id(obj)] = len(self) - 1
+
+        x, y = obj.get_position()
+
+        self.types.append(obj.type)
+        self.x_positions.append(x)
+        self.y_positions.append(y)
+
+        self.spatial_index.add(obj)
+
+    def insert(self, index: SupportsIndex, obj: ObjectType):
+        super(IndexedList, self).insert(index, obj)
+        self._sync()
+
+    def extend(self, objects: Iterable[ObjectType]):
+        super(IndexedList, self).extend(objects)
+        self._sync()
+
+    def remove(self, obj: ObjectType):
+        super(IndexedList, self).remove(obj)
+        self._sync()
+
+    def pop(self, index: SupportsIndex = -1) -> ObjectType:
+        obj = super(IndexedList, self).pop(index)
+        self._sync()
+
+        return obj
+
+    def clear(self):
+        super(IndexedList, self).clear()
+
+        self._positions.clear()
+        self.spatial_index.clear()
+
+        del self.types[:]
+        del self.x_positions[:]
+        del self.y_positions[:]
+
+    def sort(self, *args, **kwargs):
+        super(IndexedList, self).sort(*args, **kwargs)
+        self._sync()
+
+    def reverse(self):
+        super(IndexedList, self).reverse()
+        self._sync()
+
+    def __setitem__(self, index, value):
+        super(IndexedList, self).__setitem__(index, value)
+        self._sync()
+
+    def __delitem__(self, index):
+        super(IndexedList, self).__delitem__(index)
+        self._sync()
+
+    def __iadd__(self, objects: Iterable[ObjectType]):  # type: ignore[override, misc]
+        self.extend(objects)
+
+        return self
+
+
+def objects_intersecting(objects: Sequence[ObjectType], rect: QRect, end: Optional[int] = None) -> list[ObjectType]:
+    """
+    Returns the objects, whose rect intersects the given rect, in the order of the sequence. Uses the spatial index,
+    if the sequence has one.
+    """
+    if isinstance(objects, IndexedList):
+        return objects.intersecting(rect, end)
+
+    return [obj for obj in objects[0:end] if rect.intersects(obj.get_rect())]
+
+
+def move_objects_by(objects: Iterable[ObjectLike], dx: int, dy: int):
+    """
+    Moves all the objects. Every object notifies its listener only once, when it was moved, instead of for every
+    coordinate and the rendering, that moving it changes.
+    """
+    for obj in objects:
+        rect_listener, obj.rect_listener = obj.rect_listener, None
+
+        try:
+            obj.move_by(dx, dy)
+        finally:
+            obj.rect_listener = rect_listener
+
+        if rect_listener is not None:
+            rect_listener(obj)
+
+
+def position_in(objects: Sequence[ObjectType], obj: ObjectType) -> Optional[int]:
+    """Returns the position of the object in the sequence, or None, if it isn't part of it."""
+    if isinstance(objects, IndexedList):
+        return objects.position_of(obj)
+
+    if obj in objects:
+        return objects.index(obj)
+
+    return None
@@ -192,6 +192,9 @@ class WorldMap(LevelLike):
     def get_all_objects(self):
         return self.objects
 
+    def get_objects_in(self, rect: QRect):
+        return [obj for obj in self.objects if rect.intersects(obj.get_rect())]
+
     def object_at(self, x, y):
         point = QPoint(x, y)
 
@@ -10,6 +10,9 @@ ObjectData: TypeAlias = tuple[LevelAddress, bytearray]
 EnemyItemData: TypeAlias = tuple[EnemyItemAddress, bytearray]
 LevelByteData: TypeAlias = tuple[ObjectData, EnemyItemData]
 
+ByteStream: TypeAlias = bytes | bytearray | memoryview
+"""Object or enemy data, that is read from the start up to its 0xFF delimiter. Anything after that is ignored."""
+
 EMPTY_OBJECT_DATA: ObjectData = (-1, bytearray())
 EMPTY_ENEMY_DATA: EnemyItemData = (-1, bytearray())
 
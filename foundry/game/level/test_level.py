@@ -5,6 +5,7 @@ from foundry.game.gfx.objects import EnemyItem, Jump, LevelObject
 from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT
 from foundry.gui.asm import asm_to_bytes
 from smb3parse.data_points import Position
+from smb3parse.levels import HEADER_LENGTH
 
 
 @pytest.mark.parametrize(
@@ -108,3 +109,73 @@ def test_to_asm(level):
 
     assert level_bytes + bytearray([0xFF]) == asm_to_bytes(level_asm)
     assert enemy_bytes == asm_to_bytes(enemy_asm)
+
+
+def test_load_level_data_stops_at_delimiters(level):
+    # GIVEN the object and enemy data of a level, followed by data, that does not belong to the level
+    (_, level_bytes), (__, enemy_bytes) = level.to_bytes()
+
+    object_bytes = level_bytes[HEADER_LENGTH:] + bytearray([0xFF])
+    trailing_bytes = bytes(range(0x100))
+
+    # WHEN the level is loaded from views of that data
+    level._load_level_data(
+        memoryview(object_bytes + trailing_bytes), memoryview(enemy_bytes + trailing_bytes), new_level=False
+    )
+
+    # THEN the level stays the same and the objects own their data
+    assert level.to_bytes()[0][1] == level_bytes
+    assert level.to_bytes()[1][1] == enemy_bytes
+
+    assert all(isinstance(obj.data, bytearray) for obj in level.objects + level.enemies)
+
+
+def test_render_only_changed_objects(level, monkeypatch):
+    # GIVEN a level, whose objects were all rendered
+    for level_object in level.objects:
+        level_object.render()
+
+    rendered_objects = []
+    original_render = LevelObject._render
+
+    def _render(self):
+        rendered_objects.append(self)
+        original_render(self)
+
+    monkeypatch.setattr(LevelObject, "_render", _render)
+
+    # WHEN nothing changed
+    for level_object in level.objects:
+        level_object.render()
+
+    # THEN no object is rendered again
+    assert not rendered_objects
+
+    # WHEN the last object is changed, without rendering it directly
+    last_object = level.objects[-1]
+    last_object.y_position += 1
+
+    for level_object in level.objects:
+        level_object.render()
+
+    # THEN only that object is rendered again, since no other object depends on it
+    assert rendered_objects == [last_object]
+
+
+def test_header_changes_keep_factories(level):
+    # GIVEN a level and its object factory
+    object_factory = level.object_factory
+
+    # WHEN header fields change, that have nothing to do with the objects
+    level.time_index = (level.time_index + 1) % 4
+    level.music_index = (level.music_index + 1) % 16
+
+    # THEN the factory is kept
+    assert level.object_factory is object_factory
+
+    # WHEN the object palette changes
+    level.object_palette_index = (level.object_palette_index + 1) % 8
+
+    # THEN the objects use the new palette, without the level being loaded again
+    assert level.object_factory.palette_group_index == level.object_palette_index
+    assert all(obj.palette_group is level.object_factory.palette_group for obj in level.objects)
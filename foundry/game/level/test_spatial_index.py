@@ -0,0 +1,143 @@
+from copy import copy
+
+from PySide6.QtCore import QRect
+
+from foundry.game.gfx.objects.object_like import ObjectLike
+from foundry.game.level.SpatialIndex import CELL_SIZE, IndexedList, move_objects_by
+
+
+class _RectObject(ObjectLike):
+    def __init__(self, x: int, y: int, width: int, height: int, type_: int = 0):
+        super(_RectObject, self).__init__()
+
+        self.type = type_
+        self.width = width
+        self.height = height
+
+        self.set_position(x, y)
+
+    def _rect_changed(self):
+        self.rect = QRect(self.x_position, self.y_position, self.width, self.height)
+
+        super(_RectObject, self)._rect_changed()
+
+    def draw(self, painter, block_length, transparent):
+        pass
+
+    def change_type(self, new_type):
+        pass
+
+
+def test_query_returns_objects_in_list_order():
+    # GIVEN a list of objects, some of them spanning multiple cells of the grid
+    objects = IndexedList(
+        [
+            _RectObject(0, 0, 2 * CELL_SIZE, 1),
+            _RectObject(CELL_SIZE + 1, 0, 1, 1),
+            _RectObject(3 * CELL_SIZE, 3 * CELL_SIZE, 1, 1),
+            _RectObject(CELL_SIZE, 0, 4, 4),
+        ]
+    )
+
+    # WHEN the area of the second object is queried
+    intersecting_objects = objects.intersecting(QRect(CELL_SIZE + 1, 0, 1, 1))
+
+    # THEN all overlapping objects are returned, back to front
+    assert intersecting_objects == [objects[0], objects[1], objects[3]]
+
+    # and only those before a given position, if asked for
+    assert objects.intersecting(QRect(CELL_SIZE + 1, 0, 1, 1), end=1) == [objects[0]]
+
+
+def test_moved_objects_are_found_at_their_new_position():
+    # GIVEN an object in an indexed list
+    obj = _RectObject(0, 0, 1, 1)
+    objects = IndexedList([obj])
+
+    assert objects.at(0, 0) == [obj]
+
+    # WHEN it is moved into another cell of the grid
+    obj.move_by(5 * CELL_SIZE, 2 * CELL_SIZE)
+
+    # THEN it is only found at the new position
+    assert objects.at(0, 0) == []
+    assert objects.at(5 * CELL_SIZE, 2 * CELL_SIZE) == [obj]
+
+
+def test_list_changes_update_the_index():
+    # GIVEN an indexed list of overlapping objects
+    first, second, third = _RectObject(0, 0, 2, 2), _RectObject(1, 1, 2, 2), _RectObject(1, 1, 1, 1)
+
+    objects = IndexedList([first, second])
+
+    # WHEN objects are removed, inserted and reordered
+    objects.remove(first)
+    objects.insert(0, third)
+    objects[:] = [second, third]
+
+    # THEN the removed object is not found anymore and the order follows the list
+    assert objects.at(1, 1) == [second, third]
+    assert objects.position_of(first) is None
+
+    # and the removed object doesn't report to the index anymore
+    assert first.rect_listener is None
+
+
+def test_objects_outside_the_index_are_not_added_by_their_listener():
+    # GIVEN a copy of an indexed object, that still reports to the index
+    obj = _RectObject(0, 0, 1, 1)
+    objects = IndexedList([obj])
+
+    stale_copy = copy(obj)
+    assert stale_copy.rect_listener is not None
+
+    # WHEN the copy moves
+    stale_copy.move_by(1, 1)
+
+    # THEN the index doesn't know about it
+    assert objects.at(1, 1) == []
+
+
+def test_objects_are_found_by_type():
+    # GIVEN an indexed list of objects of different types
+    first, second, third = _RectObject(0, 0, 1, 1, 1), _RectObject(1, 0, 1, 1, 2), _RectObject(2, 0, 1, 1, 1)
+
+    objects = IndexedList([first, second])
+    objects.append(third)
+
+    assert objects.of_type(1) == [first, third]
+
+    # WHEN the list is reordered and an object changes its type
+    objects.reverse()
+
+    second.type = 1
+    second.move_by(0, 0)
+
+    # THEN the objects of the type are returned in their new order
+    assert objects.of_type(1) == [third, second, first]
+    assert objects.positions_of_type(2) == []
+
+
+def test_moving_objects_updates_their_positions_once():
+    # GIVEN indexed objects, whose updates are counted
+    objects = IndexedList([_RectObject(0, 0, 1, 1), _RectObject(CELL_SIZE, 0, 1, 1)])
+
+    updates = []
+    update_columns = objects.spatial_index.on_update
+    assert update_columns is not None
+
+    def count_update(obj):
+        updates.append(obj)
+        update_columns(obj)
+
+    objects.spatial_index.on_update = count_update
+
+    # WHEN they are all moved at once
+    move_objects_by(objects, 1, 2)
+
+    # THEN each of them notified the index once and is found at its new position
+    assert updates == list(objects)
+
+    assert list(objects.x_positions) == [1, CELL_SIZE + 1]
+    assert list(objects.y_positions) == [2, 2]
+    assert objects.at(CELL_SIZE + 1, 2) == [objects[1]]
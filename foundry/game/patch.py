@@ -0,0 +1,114 @@
+from typing import Iterable
+from zlib import crc32
+
+IPS_HEADER = b"PATCH"
+IPS_FOOTER = b"EOF"
+
+_IPS_EOF_OFFSET = int.from_bytes(IPS_FOOTER, "big")
+"""A record at this offset would be read as the end of the patch."""
+_IPS_MAX_OFFSET = 0xFFFFFF
+_IPS_MAX_RECORD_LENGTH = 0xFFFF
+
+BPS_HEADER = b"BPS1"
+
+_BPS_SOURCE_READ = 0
+_BPS_TARGET_READ = 1
+
+
+def create_ips_patch(source: bytes, target: bytes, ranges: Iterable[tuple[int, int]]) -> bytes:
+    """
+    Creates an IPS patch, that turns the source into the target, by replacing the given ranges with the target's bytes.
+
+    :param ranges: Start and end offsets of all ranges, in which source and target differ, in ascending order.
+    """
+    _check_lengths(source, target)
+
+    patch = bytearray(IPS_HEADER)
+
+    for start, end in ranges:
+        offset = start
+
+        while offset < end:
+            if offset == _IPS_EOF_OFFSET:
+                # writing the byte before it again is harmless
+                offset -= 1
+
+            # only limit the length after moving the offset, so the record doesn't grow too long
+            record_end = min(end, offset + _IPS_MAX_RECORD_LENGTH)
+
+            if record_end - 1 > _IPS_MAX_OFFSET:
+                raise ValueError(f"IPS patches can't change data beyond offset 0x{_IPS_MAX_OFFSET:X}.")
+
+            patch.extend(offset.to_bytes(3, "big"))
+            patch.extend((record_end - offset).to_bytes(2, "big"))
+            patch.extend(target[offset:record_end])
+
+            offset = record_end
+
+    patch.extend(IPS_FOOTER)
+
+    return bytes(patch)
+
+
+def create_bps_patch(source: bytes, target: bytes, ranges: Iterable[tuple[int, int]]) -> bytes:
+    """
+    Creates a BPS patch, that turns the source into the target. Bytes outside the given ranges are read from the
+    source, the ones inside them are stored in the patch.
+
+    :param ranges: Start and end offsets of all ranges, in which source and target differ, in ascending order.
+    """
+    _check_lengths(source, target)
+
+    patch = bytearray(BPS_HEADER)
+
+    patch.extend(_bps_number(len(source)))
+    patch.extend(_bps_number(len(target)))
+    patch.extend(_bps_number(0))  # no metadata
+
+    output_offset = 0
+
+    for start, end in ranges:
+        if start > output_offset:
+            patch.extend(_bps_action(_BPS_SOURCE_READ, start - output_offset))
+
+        patch.extend(_bps_action(_BPS_TARGET_READ, end - start))
+        patch.extend(target[start:end])
+
+        output_offset = end
+
+    if output_offset < len(target):
+        patch.extend(_bps_action(_BPS_SOURCE_READ, len(target) - output_offset))
+
+    patch.extend(crc32(source).to_bytes(4, "little"))
+    patch.extend(crc32(target).to_bytes(4, "little"))
+    patch.extend(crc32(patch).to_bytes(4, "little"))
+
+    return bytes(patch)
+
+
+def _check_lengths(source: bytes, target: bytes):
+    if len(source) != len(target):
+        raise ValueError(
+            f"Patches can only be made between ROMs of the same size, not {len(source)} and {len(target)}."
+        )
+
+
+def _bps_action(action: int, length: int) -> bytes:
+    return _bps_number(((length - 1) << 2) | action)
+
+
+def _bps_number(number: int) -> bytes:
+    """Encodes the number in the variable length format used by BPS patches."""
+    data = bytearray()
+
+    while True:
+        low_bits = number & 0x7F
+        number >>= 7
+
+        if number == 0:
+            data.append(0x80 | low_bits)
+
+            return bytes(data)
+
+        data.append(low_bits)
+        number -= 1
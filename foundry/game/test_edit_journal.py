@@ -0,0 +1,60 @@
+from foundry.game.EditJournal import COMPACTION_SIZE, EditJournal
+
+BASE = bytes(range(256)) * 64
+
+
+def test_replay():
+    # GIVEN a journal, that recorded some changes
+    journal = EditJournal(BASE)
+    journal_file = journal.to_bytes()
+
+    data = bytearray(BASE)
+
+    for offset in range(0, 1000, 100):
+        data[offset] = 0xFF
+
+        journal.record(data)
+        journal_file += journal.take_records()
+
+    # WHEN it is replayed onto the base, including a record, that was cut short
+    rom_data = bytearray(BASE)
+
+    assert EditJournal.replay(journal_file + b"\x00\x00", rom_data)
+
+    # THEN all recorded changes were applied
+    assert rom_data == data
+
+    # WHEN it is replayed onto different data
+    different_rom_data = bytearray(data)
+
+    # THEN nothing happens
+    assert not EditJournal.replay(journal_file, different_rom_data)
+    assert different_rom_data == data
+
+
+def test_compaction():
+    # GIVEN a journal, in which the same bytes were changed over and over again
+    journal = EditJournal(BASE)
+    journal_size = len(journal.to_bytes())
+
+    data = bytearray(BASE)
+
+    while not journal.needs_compaction:
+        data[500:600] = bytes([(data[500] + 1) % 0x100]) * 100
+
+        journal.record(data)
+        journal_size += len(journal.take_records())
+
+    assert journal_size > COMPACTION_SIZE
+
+    # WHEN it is compacted
+    compacted_journal = journal.to_bytes()
+
+    # THEN only the last change remains
+    assert len(compacted_journal) < 200
+    assert not journal.needs_compaction
+
+    rom_data = bytearray(BASE)
+    EditJournal.replay(compacted_journal, rom_data)
+
+    assert rom_data == data
@@ -3,6 +3,8 @@ import tempfile
 import pytest
 
 from foundry.game.File import ROM
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+from smb3parse.types import NormalizedAddress
 from smb3parse.util.parser import FoundLevel
 
 
@@ -26,3 +28,63 @@ def test_load_additional_data_from_rom(rom):
     ROM.path = old_rom_path
 
     assert rom.additional_data
+
+
+def test_save_only_dirty_ranges(rom, tmp_path):
+    # GIVEN a ROM, that was saved to a file
+    rom_path = tmp_path / "rom.nes"
+
+    ROM.save_to_file(rom_path)
+
+    # WHEN a byte is changed
+    rom.write(0x10, rom.int(0x10) ^ 0xFF)
+
+    # THEN only that byte needs to be written to the file
+    assert list(rom.dirty_ranges) == [(0x10, 0x11)]
+    assert ROM._can_save_incrementally(rom_path, ROM._trailer())
+
+    ROM.save_to_file(rom_path)
+
+    assert rom_path.read_bytes() == ROM.to_bytes()
+    assert not rom.dirty_ranges
+
+    # WHEN the additional data changes
+    rom.additional_data.managed_level_positions = True
+
+    # THEN the whole file has to be written again
+    assert not ROM._can_save_incrementally(rom_path, ROM._trailer())
+
+    ROM.save_to_file(rom_path)
+
+    assert rom_path.read_bytes() == ROM.to_bytes()
+
+    # WHEN the ROM data grows
+    rom.write(NormalizedAddress(len(ROM.rom_data)), bytes(0x10))
+
+    # THEN it can't just be written over the additional data in the file
+    assert not ROM._can_save_incrementally(rom_path, ROM._trailer())
+
+    ROM.save_to_file(rom_path)
+
+    assert rom_path.read_bytes() == ROM.to_bytes()
+
+
+def test_tsa_data_is_shared_until_written(rom):
+    # GIVEN the TSA data of an object set
+    tsa_data = ROM.get_tsa_data(PLAINS_OBJECT_SET)
+
+    # WHEN it is requested again
+    # THEN the same data is returned, without reading it again
+    assert ROM.get_tsa_data(PLAINS_OBJECT_SET) is tsa_data
+
+    # WHEN a different part of the ROM is written to
+    rom.write(rom.tsa_offset_for_object_set(PLAINS_OBJECT_SET) - 1, bytes(1))
+
+    # THEN the data is still shared
+    assert ROM.get_tsa_data(PLAINS_OBJECT_SET) is tsa_data
+
+    # WHEN the TSA data itself is written to
+    rom.write(rom.tsa_offset_for_object_set(PLAINS_OBJECT_SET), bytes([tsa_data[0] ^ 0xFF]))
+
+    # THEN the changed data is read in again
+    assert ROM.get_tsa_data(PLAINS_OBJECT_SET)[0] == tsa_data[0] ^ 0xFF
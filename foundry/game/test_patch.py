@@ -0,0 +1,99 @@
+from zlib import crc32
+
+from foundry.game.patch import BPS_HEADER, IPS_FOOTER, IPS_HEADER, create_bps_patch, create_ips_patch
+from smb3parse.util.rom import changed_ranges
+
+SOURCE = bytes(range(256)) * 0x4700  # large enough to reach past the offset, that spells EOF
+
+EOF_OFFSET = 0x454F46
+
+
+def _target() -> bytes:
+    target = bytearray(SOURCE)
+
+    target[0x10:0x14] = b"\xde\xad\xbe\xef"
+    # a change, that starts at the offset spelling EOF and is too long for a single IPS record
+    target[EOF_OFFSET : EOF_OFFSET + 0x10000] = bytes((value + 1) % 0x100 for value in SOURCE[EOF_OFFSET:][:0x10000])
+    target[0x20000:0x30000] = bytes(0x10000)  # longer than an IPS record
+
+    return bytes(target)
+
+
+def _apply_ips(patch: bytes, data: bytearray):
+    position = len(IPS_HEADER)
+
+    while patch[position : position + 3] != IPS_FOOTER:
+        offset = int.from_bytes(patch[position : position + 3], "big")
+        length = int.from_bytes(patch[position + 3 : position + 5], "big")
+        position += 5
+
+        data[offset : offset + length] = patch[position : position + length]
+        position += length
+
+
+def _read_bps_number(patch: bytes, position: int) -> tuple[int, int]:
+    number, shift = 0, 1
+
+    while True:
+        byte = patch[position]
+        position += 1
+
+        number += (byte & 0x7F) * shift
+
+        if byte & 0x80:
+            return number, position
+
+        shift <<= 7
+        number += shift
+
+
+def _apply_bps(patch: bytes, source: bytes) -> bytes:
+    position = len(BPS_HEADER)
+
+    _, position = _read_bps_number(patch, position)
+    _, position = _read_bps_number(patch, position)
+    _, position = _read_bps_number(patch, position)
+
+    target = bytearray()
+
+    while position < len(patch) - 12:
+        data, position = _read_bps_number(patch, position)
+        action, length = data & 0b11, (data >> 2) + 1
+
+        if action == 0:
+            target.extend(source[len(target) : len(target) + length])
+        else:
+            target.extend(patch[position : position + length])
+            position += length
+
+    return bytes(target)
+
+
+def test_ips_patch():
+    # GIVEN a ROM with changes in various places
+    target = _target()
+
+    # WHEN an IPS patch is made of them
+    patch = create_ips_patch(SOURCE, target, changed_ranges(SOURCE, target))
+
+    # THEN applying it to the original ROM gives the changed ROM
+    patched = bytearray(SOURCE)
+    _apply_ips(patch, patched)
+
+    assert patched == target
+
+
+def test_bps_patch():
+    # GIVEN a ROM with changes in various places
+    target = _target()
+
+    # WHEN a BPS patch is made of them
+    patch = create_bps_patch(SOURCE, target, changed_ranges(SOURCE, target))
+
+    # THEN applying it to the original ROM gives the changed ROM
+    assert _apply_bps(patch, SOURCE) == target
+
+    # THEN the checksums are correct
+    assert patch[-12:-8] == crc32(SOURCE).to_bytes(4, "little")
+    assert patch[-8:-4] == crc32(target).to_bytes(4, "little")
+    assert patch[-4:] == crc32(patch[:-4]).to_bytes(4, "little")
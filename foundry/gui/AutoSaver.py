@@ -0,0 +1,162 @@
+import logging
+from hashlib import sha1
+from pathlib import Path
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer
+
+from foundry.game.EditJournal import EditJournal
+from foundry.game.File import ROM
+from smb3parse.util import write_atomically
+
+AUTO_SAVE_DELAY = 500  # ms
+"""Changes made within this time of each other are saved together."""
+
+
+class _WriteTask(QRunnable):
+    def __init__(self, path: Path, data: bytes):
+        super(_WriteTask, self).__init__()
+
+        self.path = path
+        self.data = data
+
+    def run(self):
+        try:
+            write_atomically(self.path, self.data)
+        except OSError:
+            # a failed auto save shouldn't take down the editor
+            logging.exception(f"Auto saving to {self.path} failed.")
+
+
+class _AppendTask(QRunnable):
+    def __init__(self, path: Path, data: bytes):
+        super(_AppendTask, self).__init__()
+
+        self.path = path
+        self.data = data
+
+    def run(self):
+        try:
+            with self.path.open("ab") as file:
+                file.write(self.data)
+        except OSError:
+            logging.exception(f"Appending to {self.path} failed.")
+
+
+class AutoSaver(QObject):
+    """
+    Writes the auto save files in a background thread, so that editing never has to wait for the disk.
+
+    Level data is collected AUTO_SAVE_DELAY ms after the first change, together with all changes made in the meantime,
+    so that dragging objects or scrubbing a spinner isn't saved for every single step. Data, that is the same as what
+    was last written to a file, is not written again.
+
+    Changes to the ROM are recorded in an edit journal, which only stores the bytes, that changed, since the ROM was
+    auto saved. Replaying it onto the auto saved ROM recovers all changes of the session.
+    """
+
+    def __init__(
+        self,
+        level_data_path: Optional[Path] = None,
+        level_data: Callable[[], Optional[bytes]] = lambda: None,
+        parent: Optional[QObject] = None,
+    ):
+        super(AutoSaver, self).__init__(parent)
+
+        self.level_data_path = level_data_path
+        self.level_data = level_data
+        """Returns the current level data to save, or None, if there is nothing to save."""
+
+        self._last_written: dict[Path, bytes] = {}
+        """Hashes of the data last written to the auto save files."""
+
+        self.journal: Optional[EditJournal] = None
+        self.journal_path = Path()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(AUTO_SAVE_DELAY)
+        self._timer.timeout.connect(self.save_level_data)
+
+        # the files have to be written in the order they were requested, so use only a single thread
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+
+    def level_data_changed(self):
+        # don't restart an active timer, so continuous changes are still saved once per interval
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def save_level_data(self):
+        self._timer.stop()
+
+        if self.level_data_path is not None and (data := self.level_data()) is not None:
+            self.write(self.level_data_path, data)
+
+    def write(self, path: Path, data: bytes):
+        """Writes the data to the path in the background, unless it is the same as the last time."""
+        data_hash = sha1(data).digest()
+
+        if self._last_written.get(path) == data_hash:
+            return
+
+        self._last_written[path] = data_hash
+
+        self._thread_pool.start(_WriteTask(path, data))
+
+    def start_journal(self, rom_path: Path, journal_path: Path):
+        """Auto saves the ROM, as it is now, and starts a new edit journal for all changes made to it from now on."""
+        self.write(rom_path, ROM.to_bytes())
+
+        self.journal = EditJournal(ROM.rom_data)
+        self.journal_path = journal_path
+
+        self.write(journal_path, self.journal.to_bytes())
+
+    def journal_changes(self, rom_data: bytes | bytearray):
+        """
+        Appends the changes between the given ROM data and the last recorded ROM data to the edit journal.
+
+        :param rom_data: The ROM data, with all unsaved changes of the editor applied.
+        """
+        if self.journal is None:
+            return
+
+        self.journal.record(rom_data)
+
+        if self.journal.needs_compaction:
+            self.write(self.journal_path, self.journal.to_bytes())
+
+        elif records := self.journal.take_records():
+            # the journal file is no longer, what was last written to it
+            self._last_written.pop(self.journal_path, None)
+
+            self._thread_pool.start(_AppendTask(self.journal_path, records))
+
+    @staticmethod
+    def replay_journal(journal_path: Path) -> bool:
+        """Applies the edit journal to the loaded ROM, if it is the ROM, that the journal was started with."""
+        if not journal_path.exists() or not EditJournal.replay(journal_path.read_bytes(), ROM.rom_data):
+            return False
+
+        # the data was changed without going through the ROM, so tell the caches to check it again
+        ROM.revision += 1
+        ROM.reset_graphics()
+
+        return True
+
+    def flush(self):
+        """Saves pending changes to the level data right away and waits until all files are written."""
+        if self._timer.isActive():
+            self.save_level_data()
+
+        self._thread_pool.waitForDone()
+
+    def remove_files(self, *paths: Path):
+        """Removes the given auto save files, after all pending writes are done, so they don't come back."""
+        self._timer.stop()
+        self._thread_pool.waitForDone()
+
+        for path in paths:
+            path.unlink(missing_ok=True)
+            self._last_written.pop(path, None)
@@ -33,6 +33,7 @@ from PySide6.QtWidgets import (
 
 from foundry import (
     ROM_FILE_FILTER,
+    auto_save_journal_path,
     auto_save_level_data_path,
     auto_save_m3l_path,
     auto_save_rom_path,
@@ -47,6 +48,7 @@ from foundry.game.gfx.objects.in_level.in_level_object import InLevelObject
 from foundry.game.level import EnemyItemAddress, LevelAddress
 from foundry.game.level.Level import Level, world_and_level_for_level_address
 from foundry.game.level.WorldMap import WorldMap
+from foundry.gui.AutoSaver import AutoSaver
 from foundry.gui.ContextMenu import LevelContextMenu
 from foundry.gui.EnemySizeBar import EnemySizeBar
 from foundry.gui.dialogs.HeaderEditor import HeaderEditor
@@ -120,12 +122,15 @@ class FoundryMainWindow(MainWindow):
         self.undo_stack = QUndoStack(self)
         self.undo_stack.setObjectName("undo_stack")
 
+        self.auto_saver = AutoSaver(auto_save_level_data_path, self._auto_save_data, self)
+
         self.file_menu = FileMenu(self.level_ref, self.settings)
 
         self.file_menu.open_rom_action.triggered.connect(self.on_open_rom)
         self.file_menu.open_m3l_action.triggered.connect(self.on_open_m3l)
         self.file_menu.save_rom_action.triggered.connect(self.on_save_rom)
         self.file_menu.save_rom_as_action.triggered.connect(self.on_save_rom_as)
+        self.file_menu.export_patch_action.triggered.connect(self.on_export_patch)
         self.file_menu.import_enemy_asm_action.triggered.connect(self.on_import_enemies_from_asm)
         self.file_menu.settings_action.triggered.connect(self._on_show_settings)
         self.file_menu.exit_action.triggered.connect(lambda _: self.close())
@@ -402,18 +407,29 @@ class FoundryMainWindow(MainWindow):
 
         self.jump_destination_action.setEnabled(bool(self.level_ref.level and self.level_ref.level.has_next_area))
 
-        self._save_auto_data()
+        self.auto_saver.level_data_changed()
+
+        self._journal_changes()
+
+    def _write_unsaved_changes(self, rom: SMB3Rom):
+        level = self.level_ref.level
+
+        if isinstance(level, WorldMap) and self.level_ref:
+            level.save_to_rom(rom)
+
+        # a level, that grew, will be moved on save, so only the level data auto save can recover it
+        elif isinstance(level, Level) and self.level_ref and level.attached_to_rom and not level.is_too_big():
+            for offset, data in level.to_bytes():
+                rom.write(offset, data)
+
+        save_all_palette_groups(rom)
 
     def _on_show_settings(self):
         SettingsDialog(self.settings, self).exec()
 
-    @staticmethod
-    def _save_auto_rom():
-        ROM.save_to_file(auto_save_rom_path, set_new_path=False)
-
-    def _save_auto_data(self):
+    def _auto_save_data(self) -> Optional[bytes]:
         if not self.level_ref:
-            return
+            return None
 
         (object_offset, object_bytes), (
             enemy_offset,
@@ -433,7 +449,7 @@ class FoundryMainWindow(MainWindow):
             "enemy_data": enemy_data,
         }
 
-        Path(auto_save_level_data_path).write_text(json.dumps(data_dict))
+        return json.dumps(data_dict).encode()
 
     def _load_auto_save(self):
         # rom already loaded
@@ -489,18 +505,14 @@ class FoundryMainWindow(MainWindow):
 
         super(FoundryMainWindow, self).on_play(temp_dir)
 
-    def _save_changes_to_instaplay_rom(self, path_to_temp_rom) -> bool:
-        temp_rom = ROM.from_file(path_to_temp_rom)
-
-        if not self._put_current_level_to_level_1_1(temp_rom):
+    def _apply_changes_to_instaplay_rom(self, rom: SMB3Rom) -> bool:
+        if not self._put_current_level_to_level_1_1(rom):
             return False
 
-        if not self._set_default_powerup(temp_rom):
+        if not self._set_default_powerup(rom):
             return False
 
-        save_all_palette_groups(temp_rom)
-
-        temp_rom.save_to(path_to_temp_rom)
+        save_all_palette_groups(rom)
 
         return True
 
@@ -646,14 +658,21 @@ class FoundryMainWindow(MainWindow):
         try:
             ROM.load_from_file(path_to_rom)
 
+            is_auto_save = path_to_rom == auto_save_rom_path
+
+            if is_auto_save:
+                self.auto_saver.replay_journal(auto_save_journal_path)
+
             self.close_level()
 
             self._ask_for_level_management()
 
-            if path_to_rom == auto_save_rom_path:
+            # the recovered changes are part of the new auto save
+            self.auto_saver.start_journal(auto_save_rom_path, auto_save_journal_path)
+
+            if is_auto_save:
                 self._load_auto_save()
             else:
-                self._save_auto_rom()
                 if not self.open_level_selector(None):
                     self._on_new_level(dont_check=True)
 
@@ -857,7 +876,7 @@ class FoundryMainWindow(MainWindow):
     def _save_current_changes_to_file(self, pathname: str, set_new_path: bool):
         super(FoundryMainWindow, self)._save_current_changes_to_file(pathname, set_new_path)
 
-        self._save_auto_rom()
+        self.auto_saver.start_journal(auto_save_rom_path, auto_save_journal_path)
 
     def on_menu(self, action: QAction):
         pos = self.level_view.mapFromGlobal(self.context_menu.get_position())
@@ -1096,6 +1115,7 @@ class FoundryMainWindow(MainWindow):
             self.file_menu.open_level_asm_action,
             self.file_menu.save_rom_action,
             self.file_menu.save_rom_as_action,
+            self.file_menu.export_patch_action,
             # entry in level menu
             self.select_level_action,
         ]
@@ -1191,6 +1211,9 @@ class FoundryMainWindow(MainWindow):
     def closeEvent(self, event: QCloseEvent):
         super(FoundryMainWindow, self).closeEvent(event)
 
-        auto_save_rom_path.unlink(missing_ok=True)
-        auto_save_m3l_path.unlink(missing_ok=True)
-        auto_save_level_data_path.unlink(missing_ok=True)
+        if not event.isAccepted():
+            return
+
+        self.auto_saver.remove_files(
+            auto_save_rom_path, auto_save_journal_path, auto_save_m3l_path, auto_save_level_data_path
+        )
@@ -102,7 +102,19 @@ class LevelDrawer:
         self.settings = Settings("mchlnix", "level drawer")
         self.anim_frame = 0
 
+        self.visible_rect = QRect()
+        """The part of the level, in pixels, that needs to be drawn. Everything outside of it is skipped."""
+
     def draw(self, painter: QPainter, level: Level):
+        """
+        Draws the level. If the painter has a clip set, for example to the exposed area of a paint event, only the
+        objects, overlays and lines inside of it are drawn.
+        """
+        if painter.hasClipping():
+            self.visible_rect = painter.clipBoundingRect().toAlignedRect() & level.get_rect(self.block_length)
+        else:
+            self.visible_rect = level.get_rect(self.block_length)
+
         self._draw_background(painter, level)
 
         if self.settings.value("level view/special_background"):
@@ -142,22 +154,39 @@ class LevelDrawer:
         else:
             bg_color = bg_color_for_object_set(level.object_set_number, level.header.object_palette_index)
 
-        painter.fillRect(level.get_rect(self.block_length), bg_color)
+        painter.fillRect(self.visible_rect, bg_color)
 
         painter.restore()
 
+    @property
+    def _visible_columns(self) -> range:
+        return range(
+            self.visible_rect.left() // self.block_length,
+            self.visible_rect.right() // self.block_length + 1,
+        )
+
+    @property
+    def _visible_rows(self) -> range:
+        return range(
+            self.visible_rect.top() // self.block_length,
+            self.visible_rect.bottom() // self.block_length + 1,
+        )
+
+    def _is_visible(self, rect: QRect) -> bool:
+        return self.visible_rect.intersects(rect)
+
     def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level):
         # draw_background
         bg_block = _block_from_index(140, level)
 
-        for x, y in product(range(level.width), range(level.height)):
+        for x, y in product(self._visible_columns, self._visible_rows):
             bg_block.graphics_set.anim_frame = self.anim_frame
             bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
 
         # draw ceiling
         ceiling_block = _block_from_index(139, level)
 
-        for x in range(level.width):
+        for x in self._visible_columns:
             ceiling_block.graphics_set.anim_frame = self.anim_frame
             ceiling_block.draw(painter, x * self.block_length, 0, self.block_length)
 
@@ -174,7 +203,7 @@ class LevelDrawer:
         upper_y = (GROUND - 2) * self.block_length
         lower_y = (GROUND - 1) * self.block_length
 
-        for block_x in range(level.width):
+        for block_x in self._visible_columns:
             pixel_x = block_x * self.block_length
 
             upper_floor_blocks[block_x % 2].draw(painter, pixel_x, upper_y, self.block_length)
@@ -188,14 +217,14 @@ class LevelDrawer:
 
         floor_block = _block_from_index(floor_block_index, level)
 
-        for x in range(level.width):
+        for x in self._visible_columns:
             floor_block.graphics_set.anim_frame = self.anim_frame
             floor_block.draw(painter, x * self.block_length, floor_level, self.block_length)
 
     def _draw_ice_default_graphics(self, painter: QPainter, level: Level):
         bg_block = _block_from_index(0x80, level)
 
-        for x, y in product(range(level.width), range(level.height)):
+        for x, y in product(self._visible_columns, self._visible_rows):
             bg_block.graphics_set.anim_frame = self.anim_frame
             bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
 
@@ -212,13 +241,15 @@ class LevelDrawer:
                 width = LEVEL_MAX_LENGTH
                 height = GROUND - level_object.y_position
 
-                blocks_to_draw = [level_object.blocks[0]] * width * height
+                columns = range(level_object.x_position, level_object.x_position + width)
+                rows = range(level_object.y_position, level_object.y_position + height)
+
+                for x, y in product(_overlap(columns, self._visible_columns), _overlap(rows, self._visible_rows)):
+                    level_object._draw_block(painter, level_object.blocks[0], x, y, self.block_length, False)
 
-                for index, block_index in enumerate(blocks_to_draw):
-                    x = level_object.x_position + index % width
-                    y = level_object.y_position + index // width
+            elif not self._is_visible(level_object.get_rect(self.block_length)):
+                continue
 
-                    level_object._draw_block(painter, block_index, x, y, self.block_length, False)
             else:
                 level_object.anim_frame = self.anim_frame
                 level_object.draw(
@@ -248,6 +279,12 @@ class LevelDrawer:
             pos = level_object.get_rect(self.block_length).topLeft()
             rect = level_object.get_rect(self.block_length)
 
+            # overlays are drawn up to one block outside the object
+            overlay_margin = self.block_length
+
+            if not self._is_visible(rect.adjusted(-overlay_margin, -overlay_margin, overlay_margin, overlay_margin)):
+                continue
+
             # invisible coins, for example, expand and need to have multiple overlays drawn onto them
             # set true by default, since for most overlays it doesn't matter
             fill_object = True
@@ -398,6 +435,9 @@ class LevelDrawer:
 
     def _draw_expansions(self, painter: QPainter, level: Level):
         for level_object in level.get_all_objects():
+            if not self._is_visible(level_object.get_rect(self.block_length)):
+                continue
+
             if level_object.selected:
                 painter.drawRect(level_object.get_rect(self.block_length))
 
@@ -430,36 +470,54 @@ class LevelDrawer:
 
     def _draw_jumps(self, painter: QPainter, level: Level):
         for jump in level.jumps:
+            jump_rect = jump.get_rect(self.block_length, level.is_vertical)
+
+            if not self._is_visible(jump_rect):
+                continue
+
             painter.setBrush(QBrush(QColor(0xFF, 0x00, 0x00), Qt.BrushStyle.FDiagPattern))
 
-            painter.drawRect(jump.get_rect(self.block_length, level.is_vertical))
+            painter.drawRect(jump_rect)
 
     def _draw_grid(self, painter: QPainter, level: Level):
         panel_width, panel_height = level.get_rect(self.block_length).size().toTuple()
 
+        # only draw lines through the visible area, but keep them on the same grid as the whole level
+        left = self.visible_rect.left()
+        top = self.visible_rect.top()
+        right = self.visible_rect.right()
+        bottom = self.visible_rect.bottom()
+
+        first_x = left - left % self.block_length
+        first_y = top - top % self.block_length
+
         painter.setPen(self.grid_pen)
 
-        for x in range(0, panel_width, self.block_length):
-            painter.drawLine(x, 0, x, panel_height)
-        for y in range(0, panel_height, self.block_length):
-            painter.drawLine(0, y, panel_width, y)
+        for x in range(first_x, min(right + 1, panel_width), self.block_length):
+            painter.drawLine(x, top, x, bottom + 1)
+        for y in range(first_y, min(bottom + 1, panel_height), self.block_length):
+            painter.drawLine(left, y, right + 1, y)
 
         painter.setPen(self.screen_pen)
 
         if level.is_vertical:
             for y in range(0, panel_height, self.block_length * LEVEL_SCREEN_HEIGHT):
-                painter.drawLine(0, self.block_length + y, panel_width, self.block_length + y)
+                if top <= self.block_length + y <= bottom:
+                    painter.drawLine(left, self.block_length + y, right + 1, self.block_length + y)
         else:
-            for x in range(0, panel_width, self.block_length * LEVEL_SCREEN_WIDTH):
-                painter.drawLine(x, 0, x, panel_height)
+            screen_width = self.block_length * LEVEL_SCREEN_WIDTH
+
+            for x in range(left - left % screen_width, min(right + 1, panel_width), screen_width):
+                painter.drawLine(x, top, x, bottom + 1)
 
     def _draw_auto_scroll(self, painter: QPainter, level: Level):
-        for item in level.enemies:
-            if item.obj_index == OBJ_AUTOSCROLL:
-                break
-        else:
+        if not (auto_scroll_items := level.enemies.of_type(OBJ_AUTOSCROLL)):
             return
 
-        drawer = AutoScrollDrawer(item.auto_scroll_type, level)
+        drawer = AutoScrollDrawer(auto_scroll_items[0].auto_scroll_type, level)
 
         drawer.draw(painter, self.block_length)
+
+
+def _overlap(range_1: range, range_2: range) -> range:
+    return range(max(range_1.start, range_2.start), min(range_1.stop, range_2.stop))
@@ -2,9 +2,11 @@ from collections import defaultdict
 
 from PySide6.QtWidgets import QApplication, QProgressDialog
 
+from foundry import found_levels_cache_path
 from foundry.game.File import ROM
 from smb3parse.levels import WORLD_COUNT
 from smb3parse.util.parser import FoundLevel, gen_levels_in_rom
+from smb3parse.util.parser.cache import FoundLevelCache
 
 
 class LevelParseProgressDialog(QProgressDialog):
@@ -25,7 +27,7 @@ class LevelParseProgressDialog(QProgressDialog):
         self._get_all_levels()
 
     def _get_all_levels(self):
-        level_gen = gen_levels_in_rom(ROM())
+        level_gen = gen_levels_in_rom(ROM(), parallel=True, cache=FoundLevelCache(found_levels_cache_path))
 
         try:
             world_number, levels_in_world = next(level_gen)
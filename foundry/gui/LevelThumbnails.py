@@ -0,0 +1,317 @@
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Generator, Optional, cast
+
+from PySide6.QtCore import QBuffer, QIODevice, QObject, QRect, QRunnable, QThreadPool, QTimer, Signal, SignalInstance
+from PySide6.QtGui import QImage, QImageWriter, QPainter
+
+from foundry.game.File import ROM
+from foundry.game.gfx.Palette import load_palette_group
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.settings import Settings
+from smb3parse.levels import HEADER_LENGTH, LEVEL_SCREEN_WIDTH
+from smb3parse.objects.object_set import DESERT_OBJECT_SET
+
+ThumbnailKey = tuple[int, int, int]
+"""Object set, layout address and enemy address of a level."""
+
+THUMBNAIL_ZOOM = 1 / 4
+"""Same as zooming out twice in a LevelView."""
+
+STRIP_SCREENS = 2
+"""How many screens of a level are drawn at once."""
+RENDER_SLICE_DURATION = 0.01
+"""Seconds, that rendering thumbnails may keep the GUI thread busy, before other events get handled again."""
+PARSE_STEPS = 32
+"""How many objects and enemies of a level are loaded at once."""
+
+
+@dataclass
+class LevelThumbnail:
+    image_data: str
+    """The base64 encoded PNG of the level, ready to be put into a tooltip."""
+
+    revision: int
+    """The revision of the ROM, that the thumbnail was last known to be up-to-date with."""
+
+    data_ranges: list[tuple[int, int]]
+    """Offsets and lengths of the level's header, object and enemy data in the ROM."""
+    data: bytes
+
+    palette_groups: list[tuple[int, int]]
+    """Object set and index of the palette groups used by the level's objects and enemies."""
+    palette_data: bytes
+
+
+def _read_ranges(data_ranges: list[tuple[int, int]]) -> bytes:
+    rom = ROM()
+
+    return b"".join(rom.read(offset, length) for offset, length in data_ranges)
+
+
+def _palette_data(palette_groups: list[tuple[int, int]]) -> bytes:
+    # palettes are edited in their cache and only written to the ROM on save, so check them there
+    return b"".join(
+        bytes(palette) for group_key in palette_groups for palette in load_palette_group(*group_key).palettes
+    )
+
+
+def _encode_png(image: QImage) -> str:
+    """Returns the image as a base64 encoded PNG, or an empty string, if it couldn't be encoded."""
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+
+    # QImage.save only takes the format as a str, but its type hints only allow bytes
+    writer = QImageWriter(buffer, b"PNG")
+    writer.setQuality(100)
+
+    if not writer.write(image):
+        return ""
+
+    return buffer.data().toBase64().data().decode()
+
+
+@lru_cache(1)
+def _thumbnail_settings() -> Settings:
+    # the default settings are reset to their default values and never written to disk
+    return Settings()
+
+
+class _ThumbnailRender:
+    """
+    Loads a level and draws it into an image in small steps, so that the work can be spread over multiple turns of the
+    GUI thread.
+
+    Loading and drawing happen in the GUI thread, because the block and tile caches and the animation frames of the
+    graphics sets are shared with the views of the editor.
+    """
+
+    def __init__(self, object_set: int, layout_address: int, enemy_address: int):
+        self.object_set = object_set
+        self.revision = ROM.revision
+
+        # remember what the level looked like, when it was requested, even if it is changed, while it is rendered
+        self._rom_data = bytes(ROM.rom_data)
+
+        self.level = Level("", 0, 0, object_set)
+
+        self.drawer = LevelDrawer()
+        self.drawer.settings = _thumbnail_settings()
+        self.drawer.block_length = int(Block.SIDE_LENGTH * THUMBNAIL_ZOOM)
+
+        self.image = QImage()
+
+        self.data_ranges: list[tuple[int, int]] = []
+        self.data = b""
+
+        self.palette_groups: list[tuple[int, int]] = []
+        self.palette_data = b""
+
+        self._steps = self._gen_steps(layout_address, enemy_address)
+        self.is_done = False
+
+    def step(self):
+        """Loads the next few objects and enemies of the level, or draws the next strip of it."""
+        try:
+            next(self._steps)
+        except StopIteration:
+            self.is_done = True
+
+    def _gen_steps(self, layout_address: int, enemy_address: int) -> Generator[None, None, None]:
+        object_data = bytearray(self._rom_data[layout_address:])
+        enemy_data = bytearray(self._rom_data[enemy_address:]) if enemy_address else bytearray()
+
+        parse_steps = self.level.gen_from_bytes((layout_address, object_data), (enemy_address, enemy_data))
+
+        for index, _ in enumerate(parse_steps, 1):
+            if index % PARSE_STEPS == 0:
+                yield
+
+        self.data_ranges = [
+            # header, objects and delimiter
+            (self.level.header_offset, HEADER_LENGTH + self.level.object_size_on_disk + 1),
+            # first byte, enemies and delimiter
+            (self.level.enemy_offset, 1 + self.level.enemy_size_on_disk + 1),
+        ]
+
+        self.data = b"".join(self._rom_data[offset : offset + length] for offset, length in self.data_ranges)
+
+        self.palette_groups = [
+            (self.object_set, self.level.header.object_palette_index),
+            (self.object_set, self.level.header.enemy_palette_index),
+        ]
+        self.palette_data = _palette_data(self.palette_groups)
+
+        self.image = QImage(self.level.get_rect(self.drawer.block_length).size(), QImage.Format.Format_RGB32)
+
+        yield from self._gen_draw_strips()
+
+    def _gen_draw_strips(self) -> Generator[None, None, None]:
+        """Draws the level in strips along its longer side, so vertical levels are split up as well."""
+        strip_length = STRIP_SCREENS * LEVEL_SCREEN_WIDTH * self.drawer.block_length
+
+        for strip_start in range(0, max(self.image.width(), self.image.height()), strip_length):
+            if self.image.width() >= self.image.height():
+                strip = QRect(strip_start, 0, strip_length, self.image.height())
+            else:
+                strip = QRect(0, strip_start, self.image.width(), strip_length)
+
+            # the settings are shared, so other renders could have set it in the meantime
+            self.drawer.settings.setValue("level view/block_transparency", self.object_set != DESERT_OBJECT_SET)
+
+            painter = QPainter(self.image)
+            painter.setClipRect(strip)
+            self.drawer.draw(painter, self.level)
+            painter.end()
+
+            yield
+
+    def to_thumbnail(self, image_data: str) -> LevelThumbnail:
+        return LevelThumbnail(
+            image_data, self.revision, self.data_ranges, self.data, self.palette_groups, self.palette_data
+        )
+
+
+class _EncodeTask(QRunnable):
+    def __init__(self, key: ThumbnailKey, image: QImage, on_done: Callable[[ThumbnailKey, str], None]):
+        super(_EncodeTask, self).__init__()
+
+        self.key = key
+        self.image = image
+        self.on_done = on_done
+
+    def run(self):
+        self.on_done(self.key, _encode_png(self.image))
+
+
+def render_level_thumbnail(object_set: int, layout_address: int, enemy_address: int) -> LevelThumbnail:
+    """Renders the whole level at once, without creating any widgets."""
+    render = _ThumbnailRender(object_set, layout_address, enemy_address)
+
+    while not render.is_done:
+        render.step()
+
+    return render.to_thumbnail(_encode_png(render.image))
+
+
+class LevelThumbnails(QObject):
+    """
+    Renders thumbnails of levels, whenever the GUI thread has nothing else to do, and remembers them. Levels are loaded
+    and drawn in short slices of time, so that the editor stays responsive, and the finished images are encoded in a
+    background thread. The level, that was asked for last, is rendered first, so that moving the mouse over a lot of
+    levels doesn't leave the one under it waiting behind all the others.
+
+    A thumbnail stays valid, until the bytes of its level or the palettes it was drawn with change. Other changes to the
+    ROM only mean, that those bytes have to be compared again, the next time the thumbnail is asked for.
+    """
+
+    thumbnail_ready: SignalInstance = cast(SignalInstance, Signal(tuple))
+
+    _encoded: SignalInstance = cast(SignalInstance, Signal(tuple, str))
+    """Emitted from the thread pool, so the finished thumbnail gets handled back in the GUI thread."""
+
+    def __init__(self):
+        super(LevelThumbnails, self).__init__()
+
+        self._thumbnails: dict[ThumbnailKey, LevelThumbnail] = {}
+        self._failed: dict[ThumbnailKey, int] = {}
+        """Levels, that couldn't be rendered, and the ROM revision at the time. Only tried again after a change."""
+
+        self._pending: dict[ThumbnailKey, Optional[_ThumbnailRender]] = {}
+        """Levels to render and their render, once it was started, in the order they were last asked for."""
+        self._encoding: dict[ThumbnailKey, _ThumbnailRender] = {}
+
+        self._thread_pool = QThreadPool(self)
+        self._encoded.connect(self._finish)
+
+        # a timer without an interval fires, once all other events are handled
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_slice)
+
+    def get(self, object_set: int, layout_address: int, enemy_address: int) -> Optional[str]:
+        """
+        Returns the base64 encoded PNG of the level, if an up-to-date one is available. Otherwise, it is rendered in the
+        background and thumbnail_ready is emitted with its key, once it is done, or failed.
+        """
+        key = object_set, layout_address, enemy_address
+
+        thumbnail = self._thumbnails.get(key)
+
+        if thumbnail is not None and self._is_up_to_date(thumbnail):
+            return thumbnail.image_data
+
+        if key in self._encoding or self.could_not_render(*key):
+            return None
+
+        # move the level to the end, so it is rendered next, keeping what was already done for it
+        self._pending[key] = self._pending.pop(key, None)
+        self._render_timer.start()
+
+        return None
+
+    def could_not_render(self, object_set: int, layout_address: int, enemy_address: int) -> bool:
+        """Whether rendering the level failed and won't be tried again, until the ROM changes."""
+        return self._failed.get((object_set, layout_address, enemy_address)) == ROM.revision
+
+    @staticmethod
+    def _is_up_to_date(thumbnail: LevelThumbnail) -> bool:
+        if thumbnail.revision != ROM.revision:
+            if _read_ranges(thumbnail.data_ranges) != thumbnail.data:
+                return False
+
+            thumbnail.revision = ROM.revision
+
+        return _palette_data(thumbnail.palette_groups) == thumbnail.palette_data
+
+    def _render_slice(self):
+        slice_end = time.perf_counter() + RENDER_SLICE_DURATION
+
+        # always take at least one step, even if the slice is shorter than that
+        while self._pending:
+            key, render = next(reversed(self._pending.items()))
+
+            try:
+                if render is None:
+                    self._pending[key] = _ThumbnailRender(*key)
+                elif not render.is_done:
+                    render.step()
+                else:
+                    del self._pending[key]
+
+                    self._encoding[key] = render
+                    self._thread_pool.start(_EncodeTask(key, render.image, self._encoded.emit))
+            except Exception:
+                # invalid level addresses are common on world maps of hacks; they just don't get a thumbnail
+                self._pending.pop(key, None)
+                self._fail(key)
+
+            if time.perf_counter() >= slice_end:
+                return
+
+        self._render_timer.stop()
+
+    def _finish(self, key: ThumbnailKey, image_data: str):
+        render = self._encoding.pop(key)
+
+        if not image_data:
+            self._fail(key)
+            return
+
+        self._thumbnails[key] = render.to_thumbnail(image_data)
+
+        self.thumbnail_ready.emit(key)
+
+    def _fail(self, key: ThumbnailKey):
+        self._failed[key] = ROM.revision
+
+        self.thumbnail_ready.emit(key)
+
+
+@lru_cache(1)
+def level_thumbnails() -> LevelThumbnails:
+    """The thumbnails shared by all views. Created on first use, so that it lives in the GUI thread."""
+    return LevelThumbnails()
@@ -8,11 +8,11 @@ from PySide6.QtWidgets import QScrollArea, QToolTip, QWidget
 from foundry import ctrl_is_pressed
 from foundry.game import EXPANDS_BOTH, EXPANDS_HORIZ, EXPANDS_VERT
 from foundry.game.File import ROM
-from foundry.game.gfx.drawable.Block import get_tile
 from foundry.game.gfx.objects import EnemyItem, LevelObject
 from foundry.game.gfx.objects.in_level.in_level_object import InLevelObject
 from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
+from foundry.game.level.SpatialIndex import move_objects_by
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import LevelContextMenu
 from foundry.gui.LevelDrawer import LevelDrawer
@@ -89,7 +89,6 @@ class LevelView(MainView):
     def next_anim_step(self):
         self.drawer.anim_frame += 1
         self.drawer.anim_frame %= 4
-        get_tile.cache_clear()
 
         self.repaint()
 
@@ -100,7 +99,6 @@ class LevelView(MainView):
         if self.redraw_timer is not None:
             self.redraw_timer.stop()
             self.drawer.anim_frame = 0
-            get_tile.cache_clear()
 
         if self.settings.value("level view/block_animation"):
             self.redraw_timer = QTimer(self)
@@ -203,7 +201,7 @@ class LevelView(MainView):
 
             # scrolling through the level could unintentionally change objects, if the cursor would wander onto them.
             # this is annoying (to me) so only change already selected objects
-            if obj_under_cursor not in self.level_ref.selected_objects:
+            if not obj_under_cursor.selected:
                 return False
 
             self._change_object_on_mouse_wheel(pos, event.angleDelta().y())
@@ -393,10 +391,7 @@ class LevelView(MainView):
 
         self.last_mouse_position = level_pos
 
-        selected_objects = self.get_selected_objects()
-
-        for obj in selected_objects:
-            obj.move_by(dx, dy)
+        move_objects_by(self.get_selected_objects(), dx, dy)
 
         self.update()
 
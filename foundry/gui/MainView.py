@@ -57,6 +57,7 @@ class MainView(QWidget):
 
         self.level_ref: LevelRef = level
         self.level_ref.data_changed.connect(self.update)
+        self.level_ref.selection_changed.connect(self.update)
         self.level_ref.needs_redraw.connect(self.update)
 
         self.settings = settings
@@ -107,18 +108,14 @@ class MainView(QWidget):
 
         clicked_on_background = clicked_object is None
 
-        if clicked_on_background:
+        if clicked_object is None:
             self._select_object(None)
         else:
             if event.button() & Qt.MouseButton.LeftButton:
                 self.mouse_mode = MODE_DRAG
 
-            selected_objects = self.get_selected_objects()
-
-            nothing_selected = not selected_objects
-
             # selected objects are handled on click release
-            if nothing_selected or clicked_object not in selected_objects:
+            if not clicked_object.selected:
                 self._select_object(clicked_object)
                 self._object_was_selected_on_last_click = True
 
@@ -185,15 +182,11 @@ class MainView(QWidget):
             self.select_objects([])
 
     def _set_selected_objects(self, objects, replace_selection=False):
-        if self.level_ref.selected_objects == objects:
+        if self.level_ref.selection_is(objects):
             return
 
         if ctrl_is_pressed() and not replace_selection:
-            selected_items = self.level_ref.selected_objects.copy()
-
-            for level_object in objects:
-                if level_object not in selected_items:
-                    selected_items.append(level_object)
+            selected_items = self.level_ref.selected_objects + [obj for obj in objects if not obj.selected]
         else:
             selected_items = objects
 
@@ -321,9 +314,9 @@ class MainView(QWidget):
 
         sel_rect = self.selection_square.get_adjusted_rect(self.block_length, self.block_length)
 
-        touched_objects = [obj for obj in self.level_ref.get_all_objects() if sel_rect.intersects(obj.get_rect())]
+        touched_objects = self.level_ref.get_objects_in(sel_rect)
 
-        if touched_objects != self.level_ref.selected_objects:
+        if not self.level_ref.selection_is(touched_objects):
             self._set_selected_objects(
                 touched_objects,
                 not event.modifiers() & Qt.KeyboardModifier.ShiftModifier,
@@ -344,6 +337,9 @@ class MainView(QWidget):
 
         self.drawer.block_length = self.block_length
 
+        # only draw, what was exposed; inside the scroll area, this is at most the visible part of the level
+        painter.setClipRect(event.rect())
+
         self.drawer.draw(painter, self.level_ref.level)
 
         self.selection_square.draw(painter)
@@ -3,10 +3,10 @@ import subprocess
 from pathlib import Path
 
 from PySide6.QtGui import QCloseEvent, QUndoStack, Qt
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QPushButton
+from PySide6.QtWidgets import QFileDialog, QMainWindow, QMessageBox, QPushButton
 
 from foundry import (
-    Settings,
+    PATCH_FILE_FILTER,
     check_for_update,
     get_current_version_name,
     icon,
@@ -15,12 +15,18 @@ from foundry import (
 )
 from foundry.game.File import ROM
 from foundry.game.level.LevelRef import LevelRef
+from foundry.game.patch import create_bps_patch, create_ips_patch
+from foundry.gui.AutoSaver import AutoSaver
+from foundry.gui.settings import Settings
 from foundry.gui.util import center_widget
+from smb3parse.types import NormalizedAddress
+from smb3parse.util.rom import Rom
 
 
 class MainWindow(QMainWindow):
     undo_stack: QUndoStack
     settings: Settings
+    auto_saver: AutoSaver
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -126,12 +132,19 @@ class MainWindow(QMainWindow):
 
         path_to_temp_rom = temp_dir / "instaplay.nes"
 
-        ROM().save_to(path_to_temp_rom)
+        # put the ROM together in memory, so it only has to be written once
+        instaplay_rom = Rom(bytearray(ROM.rom_data), ROM.header)
 
-        if not self._save_changes_to_instaplay_rom(path_to_temp_rom):
+        if not self._apply_changes_to_instaplay_rom(instaplay_rom):
             QMessageBox.critical(self, "File Error", "Couldn't save changes to temporary Rom.")
             return
 
+        try:
+            instaplay_rom.save_to(path_to_temp_rom)
+        except IOError as exp:
+            QMessageBox.critical(self, type(exp).__name__, f"Cannot save temporary Rom to '{path_to_temp_rom}'.")
+            return
+
         arguments = self.settings.value("editor/instaplay_arguments").replace("%f", str(path_to_temp_rom))
         arguments = shlex.split(arguments, posix=False)
 
@@ -159,9 +172,50 @@ class MainWindow(QMainWindow):
                 f"Check it under File > Settings.\n{e}",
             )
 
-    def _save_changes_to_instaplay_rom(self, path_to_temp_rom) -> bool:
+    def _apply_changes_to_instaplay_rom(self, rom: Rom) -> bool:
         return False
 
+    def _write_unsaved_changes(self, rom: Rom):
+        """Writes the changes, that are only in the editor so far, like those to the current level, into the ROM."""
+        pass
+
+    def _journal_changes(self):
+        if self.auto_saver.journal is None:
+            return
+
+        rom_data = bytearray(ROM.rom_data)
+        self._write_unsaved_changes(Rom(rom_data, ROM.header))
+
+        self.auto_saver.journal_changes(rom_data)
+
+    def on_export_patch(self):
+        """Exports all changes made to the ROM, since it was opened, including unsaved ones, as an IPS or BPS patch."""
+        suggested_file = f"{self.settings.value('editor/default dir path')}/{Path(ROM.name).stem}.bps"
+
+        pathname, _ = QFileDialog.getSaveFileName(
+            self, caption="Export Patch", dir=suggested_file, filter=PATCH_FILE_FILTER
+        )
+
+        if not pathname:
+            return
+
+        # the dirty ranges of a ROM, that starts out as the original, are the changes to put into the patch
+        rom_data = bytearray(ROM.original_data)
+        patched_rom = Rom(rom_data, ROM.header)
+
+        patched_rom.write(NormalizedAddress(0), bytes(ROM.rom_data))
+        self._write_unsaved_changes(patched_rom)
+
+        if Path(pathname).suffix.lower() == ".ips":
+            create_patch = create_ips_patch
+        else:
+            create_patch = create_bps_patch
+
+        try:
+            Path(pathname).write_bytes(create_patch(ROM.original_data, bytes(rom_data), patched_rom.dirty_ranges))
+        except (IOError, ValueError) as exp:
+            QMessageBox.warning(self, type(exp).__name__, f"Cannot export patch to '{pathname}'.\n{exp}")
+
     def _save_current_changes_to_file(self, pathname: str, set_new_path: bool):
         try:
             if self.level_ref:
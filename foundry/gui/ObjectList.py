@@ -15,6 +15,7 @@ class ObjectList(QListWidget):
 
         self.level_ref: LevelRef = level_ref
         self.level_ref.data_changed.connect(self.update_content)
+        self.level_ref.selection_changed.connect(self._update_selection)
 
         self.context_menu = context_menu
 
@@ -90,13 +91,28 @@ class ObjectList(QListWidget):
         if self.selectedIndexes():
             self.scrollTo(self.selectedIndexes()[-1])
 
+    def _update_selection(self, changed_objects: list):
+        """Only updates the items of the objects, that were selected or deselected, instead of the whole list."""
+        rows = {id(level_object): row for row, level_object in enumerate(self.level_ref.get_all_objects())}
+
+        self.blockSignals(True)
+
+        for level_object in changed_objects:
+            if (item := self.item(rows.get(id(level_object), -1))) is not None:
+                item.setSelected(level_object.selected)
+
+        self.blockSignals(False)
+
+        if self.selectedIndexes():
+            self.scrollTo(self.selectedIndexes()[-1])
+
     def selected_objects(self):
         return [self.item(index.row()).data(Qt.ItemDataRole.UserRole) for index in self.selectedIndexes()]
 
     def on_selection_changed(self):
         selected_objects = self.selected_objects()
 
-        selection_not_changed = selected_objects == self.level_ref.selected_objects
+        selection_not_changed = self.level_ref.selection_is(selected_objects)
 
         if selection_not_changed:
             return
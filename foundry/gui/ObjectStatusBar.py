@@ -10,6 +10,7 @@ class ObjectStatusBar(QStatusBar):
 
         self.level_ref = level_ref
         self.level_ref.data_changed.connect(self.update)
+        self.level_ref.selection_changed.connect(self.update)
 
     def clear(self):
         self.clearMessage()
@@ -91,22 +91,21 @@ class WarningList(QWidget):
                     )
 
         # autoscroll objects
-        for item in level.enemies:
-            if item.obj_index == OBJ_AUTOSCROLL:
-                if item.y_position >= 0x60:
-                    self.warn(
-                        f"{item}'s y-position is too low. Maximum is 95 or 0x5F.",
-                        [item],
-                    )
+        autoscroll_items = level.enemies.of_type(OBJ_AUTOSCROLL)
 
-                if level.header.scroll_type_index != 0:
-                    self.warn(
-                        f"Level has auto scrolling enabled, but the scrolling type in the level header is not "
-                        f"'{CAMERA_MOVEMENTS[0]}. This might not work as expected.",
-                        [],
-                    )
+        for item in autoscroll_items:
+            if item.y_position >= 0x60:
+                self.warn(
+                    f"{item}'s y-position is too low. Maximum is 95 or 0x5F.",
+                    [item],
+                )
 
-        autoscroll_items = [item for item in level.enemies if item.obj_index == OBJ_AUTOSCROLL]
+            if level.header.scroll_type_index != 0:
+                self.warn(
+                    f"Level has auto scrolling enabled, but the scrolling type in the level header is not "
+                    f"'{CAMERA_MOVEMENTS[0]}. This might not work as expected.",
+                    [],
+                )
 
         if len(autoscroll_items) > 1:
             self.warn(
@@ -213,7 +212,7 @@ class WarningList(QWidget):
         self.warnings_updated.emit(bool(self.warnings))
 
     def _find_enemies_in_level(self, enemy_id: int) -> list[EnemyItem]:
-        return [enemy for enemy in self.level_ref.level.enemies if enemy.type == enemy_id]
+        return self.level_ref.level.enemies.of_type(enemy_id)
 
     def _build_enemy_clan_dict(self):
         with open("data/enemy_data.json", "r") as enemy_data_file:
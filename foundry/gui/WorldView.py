@@ -13,14 +13,14 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QToolTip, QWidget
 
-from foundry import get_level_thumbnail
 from foundry.game.gfx import get_block
 from foundry.game.gfx.Palette import load_palette_group
-from foundry.game.gfx.drawable.Block import get_tile, get_worldmap_tile
+from foundry.game.gfx.drawable.Block import get_worldmap_tile
 from foundry.game.gfx.objects import LevelObject, MapTile
 from foundry.game.gfx.objects.world_map.map_object import MapObject
 from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.WorldMap import WorldMap
+from foundry.gui.LevelThumbnails import ThumbnailKey, level_thumbnails
 from foundry.gui.MainView import (
     MODE_DRAG,
     MODE_FREE,
@@ -73,6 +73,11 @@ class WorldView(MainView):
 
         self.update_anim_timer()
 
+        self._hovered_level: Optional[ThumbnailKey] = None
+        self._hovered_level_description = ""
+
+        level_thumbnails().thumbnail_ready.connect(self._on_thumbnail_ready)
+
         self._tile_to_put: int = WORLD_MAP_BLANK_TILE_ID
 
         self.mouse_mode = MODE_FREE
@@ -105,9 +110,6 @@ class WorldView(MainView):
         self.drawer.anim_frame += 1
         self.drawer.anim_frame %= 4
 
-        # to get the tiles for the next animation step
-        get_tile.cache_clear()
-
         self.repaint()
 
     def update_anim_timer(self):
@@ -118,9 +120,6 @@ class WorldView(MainView):
             self.redraw_timer.stop()
             self.drawer.anim_frame = 0
 
-            # to get the tiles for the next animation step
-            get_tile.cache_clear()
-
         if self.world.data.frame_tick_count and self.settings.value("world view/animated tiles"):
             self.redraw_timer = QTimer(self)
             self.redraw_timer.setInterval(1000 / 60 * self.world.data.frame_tick_count)
@@ -207,6 +206,8 @@ class WorldView(MainView):
 
         if not should_display_level or not self._set_level_thumbnail(event):
             # clear tooltip if supposed to show one, but no level thumbnail was available (e.g. no level there)
+            self._hovered_level = None
+
             if self.cursor().shape() == Qt.PointingHandCursor:
                 self.setCursor(Qt.ArrowCursor)
 
@@ -263,24 +264,47 @@ class WorldView(MainView):
 
             object_set_name = OBJECT_SET_NAMES[level_pointer.data.object_set]
 
-            image_data = get_level_thumbnail(
+            self._hovered_level = (
                 level_pointer.data.object_set,
                 level_pointer.data.level_address,
                 level_pointer.data.enemy_address,
             )
 
-            self.setToolTip(
+            self._hovered_level_description = (
                 f"<b>{level_name}</b><br/>"
                 f"<u>Type:</u> {object_set_name} "
                 f"<u>Objects:</u> {level_pointer.data.level_address:#x} "
                 f"<u>Enemies:</u> {level_pointer.data.enemy_address:#x}<br/>"
-                f"<img src='data:image/png;base64,{image_data}'>"
             )
 
+            self._update_level_tooltip()
+
             return True
         except ValueError:
             return False
 
+    def _update_level_tooltip(self):
+        assert self._hovered_level is not None
+
+        # rendered in the background, if it isn't cached yet, so moving the mouse doesn't stutter
+        image_data = level_thumbnails().get(*self._hovered_level)
+
+        if image_data is not None:
+            self.setToolTip(f"{self._hovered_level_description}<img src='data:image/png;base64,{image_data}'>")
+        elif level_thumbnails().could_not_render(*self._hovered_level):
+            self.setToolTip(self._hovered_level_description)
+        else:
+            self.setToolTip(f"{self._hovered_level_description}<i>Rendering preview...</i>")
+
+    def _on_thumbnail_ready(self, key: ThumbnailKey):
+        if key != self._hovered_level:
+            return
+
+        self._update_level_tooltip()
+
+        if QToolTip.isVisible():
+            QToolTip.showText(QCursor.pos(), self.toolTip(), self)
+
     def _on_right_mouse_button_up(self, event):
         if not self.mouse_mode == MODE_FREE:
             self.set_mouse_mode(MODE_FREE, event)
@@ -0,0 +1,260 @@
+"""
+Renders levels and world maps of a ROM to PNG files, without creating any widgets.
+
+    python -m foundry.gui.batch_render SMB3.nes screenshots --zoom 2
+
+By default all levels of data/levels.dat are rendered, together with all levels, that can be found by following the
+world maps of the ROM. The levels are drawn by a LevelDrawer or WorldDrawer onto a QImage, in a pool of processes.
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QGuiApplication, QImage, QPainter
+
+from foundry import found_levels_cache_path
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.Level import Level
+from foundry.game.level.WorldMap import WorldMap
+from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.MainView import HIGHEST_ZOOM_LEVEL, LOWEST_ZOOM_LEVEL
+from foundry.gui.WorldDrawer import WorldDrawer
+from foundry.gui.settings import Settings
+from smb3parse.levels import HEADER_LENGTH
+from smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+from smb3parse.util.parser import gen_levels_in_rom
+from smb3parse.util.parser.cache import FoundLevelCache
+from smb3parse.util.process_pool import map_in_pool
+
+BORDER_ROWS = 3
+"""Rows a world map gets taller, when its border is drawn. See WorldView.sizeHint."""
+
+
+@dataclass
+class RenderJob:
+    name: str
+    object_set: int
+    layout_address: int
+    enemy_address: int
+
+    @property
+    def file_name(self) -> str:
+        name = "".join(char if char.isalnum() or char in " -" else "_" for char in self.name)
+
+        return f"{self.object_set:02d}_{self.layout_address:05X} {name}.png"
+
+
+def jobs_from_levels_dat() -> list[RenderJob]:
+    jobs = []
+
+    for level in Level.offsets[1:]:
+        if level.real_obj_set == WORLD_MAP_OBJECT_SET:
+            jobs.append(RenderJob(level.name, WORLD_MAP_OBJECT_SET, level.rom_level_offset, 0))
+            continue
+
+        # same as in the LevelSelector
+        jobs.append(
+            RenderJob(
+                f"{level.game_world}-{level.level_in_world} {level.name}",
+                level.real_obj_set,
+                level.rom_level_offset - HEADER_LENGTH,
+                level.enemy_offset - 1,
+            )
+        )
+
+    return jobs
+
+
+def jobs_from_world_maps(rom: ROM) -> list[RenderJob]:
+    level_gen = gen_levels_in_rom(rom, parallel=True, cache=FoundLevelCache(found_levels_cache_path))
+
+    # keep the output of the level parser separate from the results
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            next(level_gen)
+
+            while True:
+                level_gen.send(False)
+
+        except StopIteration as si:
+            _, levels_by_address = si.value
+
+    return [
+        RenderJob(
+            f"{found_level.world_number}-Found",
+            found_level.object_set_number,
+            found_level.level_offset,
+            found_level.enemy_offset,
+        )
+        for _, found_level in sorted(levels_by_address.items())
+    ]
+
+
+@dataclass
+class _RenderWorker:
+    level_drawer: LevelDrawer
+    world_drawer: WorldDrawer
+
+    output_dir: Path
+
+
+def _create_application():
+    # fonts and images need an application, but without a display server it has to be offscreen
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if QGuiApplication.instance() is None:
+        QGuiApplication([])
+
+
+def _set_up_render_process(rom_path: Path, output_dir: Path, zoom: float) -> _RenderWorker:
+    """Sets up a freshly started worker process, so it can render the levels of the ROM at the path."""
+    _create_application()
+
+    ROM.load_from_file(rom_path)
+
+    return _create_render_worker(output_dir, zoom)
+
+
+def _create_render_worker(output_dir: Path, zoom: float) -> _RenderWorker:
+    settings = Settings()
+
+    level_drawer = LevelDrawer()
+    level_drawer.settings = settings
+    level_drawer.block_length = int(Block.SIDE_LENGTH * zoom)
+
+    world_drawer = WorldDrawer()
+    world_drawer.settings = settings
+    world_drawer.block_length = int(Block.SIDE_LENGTH * zoom)
+
+    return _RenderWorker(level_drawer, world_drawer, output_dir)
+
+
+def _render_level(level_drawer: LevelDrawer, level: Level) -> QImage:
+    image = QImage(level.get_rect(level_drawer.block_length).size(), QImage.Format.Format_RGB32)
+
+    painter = QPainter(image)
+    level_drawer.draw(painter, level)
+    painter.end()
+
+    return image
+
+
+def _render_world(world_drawer: WorldDrawer, world: WorldMap) -> QImage:
+    size = world.get_rect(world_drawer.block_length).size()
+
+    if world_drawer.settings.value("world view/show border"):
+        size += QSize(0, BORDER_ROWS) * world_drawer.block_length
+
+    image = QImage(size, QImage.Format.Format_RGB32)
+
+    painter = QPainter(image)
+    world_drawer.draw(painter, world)
+    painter.end()
+
+    return image
+
+
+def _render(worker: _RenderWorker, job: RenderJob) -> tuple[RenderJob, Optional[str]]:
+    """Renders the level of the job into a PNG. Returns the job and an error message, if it failed."""
+    try:
+        if job.object_set == WORLD_MAP_OBJECT_SET:
+            image = _render_world(worker.world_drawer, WorldMap(job.layout_address))
+        else:
+            level = Level(job.name, job.layout_address, job.enemy_address, job.object_set)
+            image = _render_level(worker.level_drawer, level)
+
+        if not image.save(str(worker.output_dir / job.file_name)):
+            return job, "Could not write the image."
+
+    except Exception as e:
+        # a broken level in a hack shouldn't stop the others from being rendered
+        return job, f"{type(e).__name__}: {e}"
+
+    return job, None
+
+
+def render_levels(
+    rom_path: Path, jobs: list[RenderJob], output_dir: Path, zoom: float, workers: int
+) -> Iterator[tuple[RenderJob, Optional[str]]]:
+    """
+    Renders the levels in a pool of processes and yields every job, together with an error message if it failed. With
+    only one worker, the levels are rendered in the calling process, which needs to have the ROM at the path loaded and
+    a QGuiApplication.
+    """
+    if workers == 1:
+        # render in this process, with the ROM and application it already has, instead of replacing them
+        if not ROM.is_loaded() or not os.path.samefile(ROM.path, rom_path):
+            raise ValueError(f"Rendering without worker processes needs {rom_path} to be loaded already.")
+
+        worker = _create_render_worker(output_dir, zoom)
+
+        yield from (_render(worker, job) for job in jobs)
+        return
+
+    # the workers are spawned as fresh interpreters, because Qt doesn't cope well with being forked
+    yield from map_in_pool(_render, _set_up_render_process, (rom_path, output_dir, zoom), jobs, workers, chunksize=4)
+
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("rom", type=Path, help="The ROM to render the levels of.")
+    parser.add_argument("output", type=Path, help="The directory to put the images in.")
+    parser.add_argument("-z", "--zoom", type=float, default=1, help="Zoom level, like in the editor. Defaults to 1.")
+    parser.add_argument(
+        "--levels",
+        choices=["all", "levels.dat", "found"],
+        default="all",
+        help="Render the levels of data/levels.dat, the levels found on the world maps, or both.",
+    )
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+
+    parsed_args = parser.parse_args(args)
+
+    if not LOWEST_ZOOM_LEVEL <= parsed_args.zoom <= HIGHEST_ZOOM_LEVEL:
+        parser.error(f"Zoom has to be between {LOWEST_ZOOM_LEVEL} and {HIGHEST_ZOOM_LEVEL}.")
+
+    ROM.load_from_file(parsed_args.rom)
+
+    if parsed_args.workers == 1:
+        _create_application()
+
+    jobs: list[RenderJob] = []
+
+    if parsed_args.levels in ["all", "levels.dat"]:
+        jobs.extend(jobs_from_levels_dat())
+
+    if parsed_args.levels in ["all", "found"]:
+        known_levels = {(job.object_set, job.layout_address) for job in jobs}
+
+        jobs.extend(
+            job for job in jobs_from_world_maps(ROM()) if (job.object_set, job.layout_address) not in known_levels
+        )
+
+    parsed_args.output.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    failed = 0
+
+    for job, error in render_levels(parsed_args.rom, jobs, parsed_args.output, parsed_args.zoom, parsed_args.workers):
+        if error is not None:
+            failed += 1
+            print(f"{job.name} at 0x{job.layout_address:X}: {error}", file=sys.stderr)
+
+    duration = time.perf_counter() - start
+
+    print(
+        f"Rendered {len(jobs) - failed} of {len(jobs)} levels in {duration:.2f}s, "
+        f"{len(jobs) / duration:.2f} levels per second."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -152,7 +152,7 @@ class UpdatePalette(QUndoCommand):
             self.old_color_index,
         )
 
-        self.level.reload()
+        self.level.data_changed.emit()
         PaletteGroup.changed = self.palette_was_changed
 
     def redo(self):
@@ -163,7 +163,7 @@ class UpdatePalette(QUndoCommand):
             self.new_color_index,
         )
 
-        self.level.reload()
+        self.level.data_changed.emit()
         PaletteGroup.changed = True
 
 
@@ -290,7 +290,7 @@ class SidePalette(QWidget):
                 index_in_nes_color_table,
             )
 
-            self.level_ref.level.reload()
+            self.level_ref.data_changed.emit()
 
         return actual_changer
 
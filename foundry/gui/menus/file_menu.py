@@ -33,6 +33,9 @@ class FileMenu(QMenu):
         self.save_rom_as_action = self.addAction("Save ROM as ...")
         self.save_rom_as_action.setIcon(icon("save.svg"))
 
+        self.export_patch_action = self.addAction("Export Patch ...")
+        self.export_patch_action.setIcon(icon("download.svg"))
+
         self.addSeparator()
 
         m3l_menu = QMenu("M3L")
@@ -1,8 +1,9 @@
 from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QFileDialog, QMenu
+from PySide6.QtWidgets import QFileDialog, QMenu, QMessageBox
 
 from foundry import IMG_FILE_FILTER, icon
 from foundry.game.File import ROM
+from foundry.game.gfx import block_image_cache
 
 
 class ViewMenu(QMenu):
@@ -67,6 +68,9 @@ class ViewMenu(QMenu):
         self._screen_shot_action = self.addAction("Save &Screenshot of Level")
         self._screen_shot_action.setIcon(icon("image.svg"))
 
+        self.addSeparator()
+        self._block_cache_action = self.addAction("Block Image Cache")
+
     @property
     def settings(self):
         return self._level_view.settings
@@ -100,6 +104,9 @@ class ViewMenu(QMenu):
         elif action is self._screen_shot_action:
             self._on_screenshot()
             return
+        elif action is self._block_cache_action:
+            self._on_block_cache()
+            return
 
         self._level_view.update()
 
@@ -121,3 +128,18 @@ class ViewMenu(QMenu):
             return
 
         self._level_view.make_screenshot().save(pathname)
+
+    def _on_block_cache(self):
+        cache = block_image_cache()
+
+        message_box = QMessageBox(QMessageBox.Information, "Block Image Cache", cache.summary(), parent=self)
+        flush_button = message_box.addButton("Flush", QMessageBox.ResetRole)
+        message_box.addButton(QMessageBox.Close)
+
+        message_box.exec()
+
+        if message_box.clickedButton() is flush_button:
+            cache.clear()
+            cache.reset_statistics()
+
+            self._level_view.update()
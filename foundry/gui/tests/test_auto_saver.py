@@ -0,0 +1,74 @@
+from foundry.gui.AutoSaver import AUTO_SAVE_DELAY, AutoSaver
+
+
+def test_changes_are_coalesced(tmp_path, qtbot):
+    # GIVEN an auto saver for some level data
+    collected_data = []
+
+    def level_data():
+        collected_data.append(b"level data")
+
+        return collected_data[-1]
+
+    auto_saver = AutoSaver(tmp_path / "level_data.json", level_data)
+
+    # WHEN the level data changes many times in quick succession
+    for _ in range(100):
+        auto_saver.level_data_changed()
+
+    qtbot.wait(AUTO_SAVE_DELAY * 2)
+    auto_saver.flush()
+
+    # THEN the level data was only collected and written once
+    assert len(collected_data) == 1
+    assert (tmp_path / "level_data.json").read_bytes() == b"level data"
+    assert not (tmp_path / "level_data.json.tmp").exists()
+
+
+def test_unchanged_data_is_not_written(tmp_path, qtbot):
+    # GIVEN a file, that was auto saved
+    auto_saver = AutoSaver(tmp_path / "level_data.json", lambda: None)
+
+    auto_saver.write(tmp_path / "auto_save.nes", b"rom data")
+    auto_saver.flush()
+
+    # WHEN the file is removed externally and the same data is saved again
+    (tmp_path / "auto_save.nes").unlink()
+
+    auto_saver.write(tmp_path / "auto_save.nes", b"rom data")
+    auto_saver.flush()
+
+    # THEN it wasn't written again
+    assert not (tmp_path / "auto_save.nes").exists()
+
+    # WHEN different data is saved
+    auto_saver.write(tmp_path / "auto_save.nes", b"new rom data")
+    auto_saver.flush()
+
+    # THEN it is written
+    assert (tmp_path / "auto_save.nes").read_bytes() == b"new rom data"
+
+
+def test_journal_recovers_changes(rom, tmp_path, qtbot):
+    # GIVEN an auto saved ROM with a journal
+    rom_path = tmp_path / "auto_save.nes"
+    journal_path = tmp_path / "auto_save.journal"
+
+    auto_saver = AutoSaver()
+    auto_saver.start_journal(rom_path, journal_path)
+
+    # WHEN changes to the ROM are journaled
+    rom_data = bytearray(rom.rom_data)
+
+    for offset in range(0x10, 0x1000, 0x100):
+        rom_data[offset] ^= 0xFF
+
+        auto_saver.journal_changes(rom_data)
+
+    auto_saver.flush()
+
+    # THEN they are recovered, after loading the auto saved ROM and replaying the journal
+    rom.load_from_file(rom_path)
+
+    assert auto_saver.replay_journal(journal_path)
+    assert rom.rom_data == rom_data
@@ -0,0 +1,28 @@
+from PySide6.QtGui import QImage
+
+from foundry.conftest import (
+    level_1_1_enemy_address,
+    level_1_1_object_address,
+    test_rom_path,
+)
+from foundry.game.gfx.drawable.Block import Block
+from foundry.gui.batch_render import RenderJob, render_levels
+from smb3parse.levels import DEFAULT_HORIZONTAL_HEIGHT
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET, WORLD_MAP_OBJECT_SET
+
+
+def test_render_levels(rom, tmp_path, qtbot):
+    # GIVEN a level and a world map of the loaded ROM
+    level_job = RenderJob("Level 1-1", PLAINS_OBJECT_SET, level_1_1_object_address, level_1_1_enemy_address)
+    world_job = RenderJob("World 1", WORLD_MAP_OBJECT_SET, 0x185BA, 0)
+
+    # WHEN they are rendered in this process
+    results = list(render_levels(test_rom_path, [level_job, world_job], tmp_path, 2, workers=1))
+
+    # THEN both were rendered without errors in the chosen zoom
+    assert results == [(level_job, None), (world_job, None)]
+
+    level_image = QImage(str(tmp_path / level_job.file_name))
+
+    assert not level_image.isNull()
+    assert level_image.height() == DEFAULT_HORIZONTAL_HEIGHT * Block.SIDE_LENGTH * 2
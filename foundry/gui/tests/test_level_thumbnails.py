@@ -0,0 +1,88 @@
+from PySide6.QtCore import QCoreApplication
+
+from foundry.conftest import (
+    level_1_1_enemy_address,
+    level_1_1_object_address,
+    level_1_2_enemy_address,
+    level_1_2_object_address,
+)
+from foundry.gui import LevelThumbnails as level_thumbnails_module
+from foundry.gui.LevelThumbnails import LevelThumbnails, ThumbnailKey
+from smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+LEVEL_1_1 = PLAINS_OBJECT_SET, level_1_1_object_address, level_1_1_enemy_address
+LEVEL_1_2 = PLAINS_OBJECT_SET, level_1_2_object_address, level_1_2_enemy_address
+
+
+def test_thumbnails_are_rendered_in_the_background(rom, qtbot):
+    thumbnails = LevelThumbnails()
+
+    # WHEN a thumbnail is requested for the first time
+    with qtbot.waitSignal(thumbnails.thumbnail_ready) as blocker:
+        assert thumbnails.get(*LEVEL_1_1) is None
+
+    # THEN it is available, once it was rendered
+    assert blocker.args == [LEVEL_1_1]
+    assert thumbnails.get(*LEVEL_1_1)
+
+
+def test_thumbnails_invalidated_by_level_data_only(rom, qtbot):
+    # GIVEN a rendered thumbnail of a level
+    thumbnails = LevelThumbnails()
+
+    with qtbot.waitSignal(thumbnails.thumbnail_ready):
+        thumbnails.get(*LEVEL_1_1)
+
+    # WHEN a part of the ROM is changed, that has nothing to do with the level
+    rom.write(level_1_1_enemy_address + 0x100, rom.int(level_1_1_enemy_address + 0x100) ^ 0xFF)
+
+    # THEN the thumbnail is still valid
+    assert thumbnails.get(*LEVEL_1_1)
+
+    # WHEN the level itself is changed
+    rom.write(level_1_1_object_address, rom.int(level_1_1_object_address) ^ 0xFF)
+
+    # THEN it has to be rendered again
+    with qtbot.waitSignal(thumbnails.thumbnail_ready):
+        assert thumbnails.get(*LEVEL_1_1) is None
+
+
+def test_thumbnails_are_rendered_in_steps(rom, qtbot, monkeypatch):
+    # GIVEN thumbnails, that only take a single step of rendering at a time
+    monkeypatch.setattr(level_thumbnails_module, "RENDER_SLICE_DURATION", 0)
+
+    thumbnails = LevelThumbnails()
+
+    ready_keys: list[ThumbnailKey] = []
+    thumbnails.thumbnail_ready.connect(ready_keys.append)
+
+    # WHEN a thumbnail is requested and the waiting events are handled once
+    thumbnails.get(*LEVEL_1_1)
+    QCoreApplication.processEvents()
+
+    # THEN the GUI thread got control back, before the level was done
+    assert not ready_keys
+
+    # and it is finished after a few more turns
+    qtbot.waitUntil(lambda: ready_keys == [LEVEL_1_1])
+
+
+def test_last_requested_thumbnail_is_rendered_first(rom, qtbot, monkeypatch):
+    # GIVEN thumbnails, that only take a single step of rendering at a time
+    monkeypatch.setattr(level_thumbnails_module, "RENDER_SLICE_DURATION", 0)
+
+    thumbnails = LevelThumbnails()
+
+    ready_keys: list[ThumbnailKey] = []
+    thumbnails.thumbnail_ready.connect(ready_keys.append)
+
+    # WHEN a level is requested, while another one is still being rendered
+    thumbnails.get(*LEVEL_1_1)
+    QCoreApplication.processEvents()
+
+    thumbnails.get(*LEVEL_1_2)
+
+    # THEN the level, that was requested last, is done first, before the other one is finished
+    qtbot.waitUntil(lambda: len(ready_keys) == 2)
+
+    assert ready_keys == [LEVEL_1_2, LEVEL_1_1]
@@ -133,3 +133,28 @@ def test_select_one_of_same_block_on_click(level_view: LevelView, qtbot):
     qtbot.mouseClick(level_view, Qt.LeftButton, pos=level_view.from_level_point(obj_pos))
 
     assert level_view.get_selected_objects() == [obj_fg]
+
+
+def test_selection_only_notifies_about_changed_objects(level_view: LevelView, qtbot):
+    # GIVEN a level with one selected object
+    level_ref = level_view.level_ref
+    first_object, second_object = level_ref.level.objects[:2]
+
+    level_ref.selected_objects = [first_object]
+
+    changes: list[list] = []
+    level_ref.selection_changed.connect(changes.append)
+
+    # WHEN the same object is selected again
+    level_ref.selected_objects = [first_object]
+
+    # THEN nothing is reported
+    assert not changes
+
+    # WHEN the selection is replaced by another object
+    level_ref.selected_objects = [second_object]
+
+    # THEN only the deselected and the newly selected object are reported
+    assert len(changes) == 1
+    assert {id(obj) for obj in changes[0]} == {id(first_object), id(second_object)}
+    assert level_ref.selection_is([second_object])
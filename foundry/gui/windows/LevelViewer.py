@@ -3,11 +3,19 @@ from dataclasses import dataclass
 from random import randint, seed
 
 from PySide6.QtCore import QPoint, QRect, QSize
-from PySide6.QtGui import QBrush, QColor, QColorConstants, QMouseEvent, QPaintEvent, QPainter
-from PySide6.QtWidgets import QScrollArea, QSizePolicy, QTabWidget, QTreeWidget, QTreeWidgetItem, QWidget
+from PySide6.QtGui import QBrush, QColor, QColorConstants, QCursor, QMouseEvent, QPaintEvent, QPainter
+from PySide6.QtWidgets import (
+    QScrollArea,
+    QSizePolicy,
+    QTabWidget,
+    QToolTip,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QWidget,
+)
 
-from foundry import get_level_thumbnail
 from foundry.game.File import ROM
+from foundry.gui.LevelThumbnails import ThumbnailKey, level_thumbnails
 from foundry.gui.windows.CustomChildWindow import CustomChildWindow
 from smb3parse.constants import BASE_OFFSET, PAGE_A000_ByTileset
 from smb3parse.data_points import WorldMapData
@@ -261,6 +269,11 @@ class LevelBlockView(ByteView):
         self.block_height = 100  # px
         self.block_width = 170  # px
 
+        self._hovered_level: ThumbnailKey | None = None
+        self._last_mouse_position = QPoint()
+
+        level_thumbnails().thumbnail_ready.connect(self._on_thumbnail_ready)
+
     def heightForWidth(self, width):
         if not self.levels_in_order:
             return 600
@@ -356,22 +369,37 @@ class LevelBlockView(ByteView):
         block = self._get_block_at(x, y)
 
         if block is None or block.level is None:
+            self._hovered_level = None
             self.setToolTip(None)
             return
 
-        image_data = get_level_thumbnail(
-            block.level[0],
-            block.level[1],
-            0x0,
-        )
+        self._hovered_level = block.level[0], block.level[1], 0x0
+        self._last_mouse_position = QPoint(x, y)
+
+        # rendered in the background, if it isn't cached yet, so moving the mouse doesn't stutter
+        if (image_data := level_thumbnails().get(*self._hovered_level)) is not None:
+            image_tag = f"<img src='data:image/png;base64,{image_data}'>"
+        elif level_thumbnails().could_not_render(*self._hovered_level):
+            image_tag = ""
+        else:
+            image_tag = "<br/><i>Rendering preview...</i>"
 
         self.setToolTip(
             f"<b>{block.name}</b><br/>"
             f"<u>Type:</u> {OBJECT_SET_NAMES[block.level[0]]} "
             f"<u>Objects:</u> {block.level[1]:#x} "
-            f"<img src='data:image/png;base64,{image_data}'>"
+            f"{image_tag}"
         )
 
+    def _on_thumbnail_ready(self, key: ThumbnailKey):
+        if key != self._hovered_level:
+            return
+
+        self._set_thumbnail(self._last_mouse_position.x(), self._last_mouse_position.y())
+
+        if QToolTip.isVisible():
+            QToolTip.showText(QCursor.pos(), self.toolTip(), self)
+
     def _paint_block(self, painter: QPainter, pos: QPoint, block: _Block):
         rect = QRect(pos, QSize(self.block_width, self.block_height))
 
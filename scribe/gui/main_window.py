@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import QPoint, QSize
-from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QShortcut, QUndoStack, Qt
+from PySide6.QtGui import QAction, QActionGroup, QCloseEvent, QKeySequence, QShortcut, QUndoStack, Qt
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -13,8 +13,9 @@ from PySide6.QtWidgets import (
     QToolBar,
 )
 
-from foundry import ROM_FILE_FILTER, icon
+from foundry import ROM_FILE_FILTER, icon, scribe_auto_save_journal_path, scribe_auto_save_rom_path
 from foundry.game.File import ROM
+from foundry.gui.AutoSaver import AutoSaver
 from foundry.gui.MainWindow import MainWindow
 from foundry.gui.WorldView import WorldView
 from foundry.gui.settings import Settings
@@ -30,6 +31,7 @@ from smb3parse.data_points import Position
 from smb3parse.levels import WORLD_COUNT, WORLD_MAP_BLANK_TILE_ID
 from smb3parse.levels.world_map import WorldMap as SMB3WorldMap
 from smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+from smb3parse.util.rom import Rom
 
 
 class ScribeMainWindow(MainWindow):
@@ -42,6 +44,9 @@ class ScribeMainWindow(MainWindow):
 
         self.undo_stack = QUndoStack(self)
         self.undo_stack.setObjectName("undo_stack")
+        self.undo_stack.indexChanged.connect(self._journal_changes)
+
+        self.auto_saver = AutoSaver(parent=self)
 
         self.menu_toolbar = None
 
@@ -145,6 +150,9 @@ class ScribeMainWindow(MainWindow):
         self.save_as_rom_action = self.file_menu.addAction("Save ROM &As...")
         self.save_as_rom_action.setShortcut(Qt.CTRL | Qt.SHIFT | Qt.Key_S)
         self.save_as_rom_action.setIcon(icon("save.svg"))
+
+        self.export_patch_action = self.file_menu.addAction("Export &Patch...")
+        self.export_patch_action.setIcon(icon("download.svg"))
         self.file_menu.addSeparator()
 
         self.settings_action = self.file_menu.addAction("Editor Settings")
@@ -265,17 +273,14 @@ class ScribeMainWindow(MainWindow):
 
         super(ScribeMainWindow, self).on_play(temp_dir)
 
-    def _save_changes_to_instaplay_rom(self, path_to_temp_rom) -> bool:
-        temp_rom = ROM.from_file(path_to_temp_rom)
-        self.world_view.world.save_to_rom(temp_rom)
+    def _apply_changes_to_instaplay_rom(self, rom: Rom) -> bool:
+        self.world_view.world.save_to_rom(rom)
 
-        temp_rom.write(
+        rom.write(
             STARTING_WORLD_INDEX_ADDRESS,
             self.world_view.world.internal_world_map.number - 1,
         )
 
-        temp_rom.save_to(path_to_temp_rom)
-
         return True
 
     def on_open_rom(self, path_to_rom=""):
@@ -304,6 +309,15 @@ class ScribeMainWindow(MainWindow):
             QMessageBox.warning(self, type(exp).__name__, f"Cannot open file '{path_to_rom}'.")
             return
 
+        if path_to_rom == scribe_auto_save_rom_path:
+            self.auto_saver.replay_journal(scribe_auto_save_journal_path)
+
+        self.auto_saver.start_journal(scribe_auto_save_rom_path, scribe_auto_save_journal_path)
+
+    def _write_unsaved_changes(self, rom: Rom):
+        if self.level_ref:
+            self.world_view.world.save_to_rom(rom)
+
     def load_level(self, world_number: int):
         world = SMB3WorldMap.from_world_number(ROM(), world_number)
 
@@ -332,6 +346,16 @@ class ScribeMainWindow(MainWindow):
         else:
             pathname = ROM.path
 
+        if str(pathname) == str(scribe_auto_save_rom_path):
+            QMessageBox.critical(
+                self,
+                "Cannot save to auto save ROM",
+                "You can't save to the auto save ROM, as it will be deleted, when exiting the editor. Please choose "
+                "another location, or your changes will be lost.",
+            )
+
+            return
+
         self._save_current_changes_to_file(pathname, set_new_path=True)
 
         if not is_save_as:
@@ -346,6 +370,8 @@ class ScribeMainWindow(MainWindow):
             self.on_save_rom(False)
         elif action is self.save_as_rom_action:
             self.on_save_rom(True)
+        elif action is self.export_patch_action:
+            self.on_export_patch()
         elif action is self.quit_rom_action:
             self.close()
 
@@ -393,3 +419,9 @@ class ScribeMainWindow(MainWindow):
         size_hint = QSize(min(width, QApplication.primaryScreen().size().width()), height)
 
         return size_hint
+
+    def closeEvent(self, event: QCloseEvent):
+        super(ScribeMainWindow, self).closeEvent(event)
+
+        if event.isAccepted():
+            self.auto_saver.remove_files(scribe_auto_save_rom_path, scribe_auto_save_journal_path)
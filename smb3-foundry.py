@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import logging
+import multiprocessing
 import os
 import sys
 import traceback
@@ -41,6 +42,9 @@ def main(path_to_rom):
 
 
 if __name__ == "__main__":
+    # the level parsing uses a process pool, which needs this in frozen executables
+    multiprocessing.freeze_support()
+
     if len(sys.argv) > 1:
         path = sys.argv[1]
     else:
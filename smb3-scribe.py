@@ -3,8 +3,10 @@ import logging
 import os
 import sys
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 
+from foundry import scribe_auto_save_rom_path
+from foundry.gui.dialogs.AutoSaveDialog import AutoSaveDialog
 from scribe.gui.main_window import ScribeMainWindow
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,16 @@ if hasattr(sys, "_MEIPASS"):
 def main(path_to_rom):
     app = QApplication()
 
+    if scribe_auto_save_rom_path.exists():
+        result = AutoSaveDialog().exec()
+
+        if result == QMessageBox.AcceptRole:
+            path_to_rom = scribe_auto_save_rom_path
+
+            QMessageBox.information(
+                None, "Auto Save recovered", "Don't forget to save the loaded ROM under a new name!"
+            )
+
     window = ScribeMainWindow(path_to_rom)  # noqa
     app.exec()
 
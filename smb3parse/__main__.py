@@ -0,0 +1,5 @@
+# the export lives in its own module, since worker processes, that are spawned, can't import functions from __main__
+from smb3parse.export import main
+
+if __name__ == "__main__":
+    main()
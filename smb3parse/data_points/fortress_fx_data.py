@@ -94,13 +94,13 @@ class FortressFXData(_PositionMixin, _IndexedMixin, DataPoint):
         self.column, self.screen = self._rom.nibbles(self.col_and_screen_address)
 
         self.tile_indexes = self._rom.read(self.tile_indexes_address, 4)
-        self.replacement_block_index = self._rom.int(self.replacement_block_address)
+        self.replacement_block_index = self._rom.u8(self.replacement_block_address)
 
         # ignore the column value of the map completion data, because it is the same as the screen and column position
-        self.map_completion_bit_index = self._rom.int(self.map_completion_data_address + 1)
+        self.map_completion_bit_index = self._rom.u8(self.map_completion_data_address + 1)
 
-        self.v_addr_high = self._rom.int(self.v_addr_high_address)
-        self.v_addr_low = self._rom.int(self.v_addr_low_address)
+        self.v_addr_high = self._rom.u8(self.v_addr_high_address)
+        self.v_addr_low = self._rom.u8(self.v_addr_low_address)
 
     def write_back(self, rom: Optional[Rom] = None):
         if rom is None:
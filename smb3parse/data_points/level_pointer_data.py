@@ -60,12 +60,12 @@ class LevelPointerData(_PositionMixin, _IndexedMixin, DataPoint):
 
         self.level_offset_address = (
             WORLD_MAP_BASE_OFFSET
-            + self._rom.little_endian(self.world.level_offset_list_offset_address)
+            + self._rom.u16le(self.world.level_offset_list_offset_address)
             + OFFSET_SIZE * self.index
         )
         self.enemy_offset_address = (
             WORLD_MAP_BASE_OFFSET
-            + self._rom.little_endian(self.world.enemy_offset_list_offset_address)
+            + self._rom.u16le(self.world.enemy_offset_list_offset_address)
             + OFFSET_SIZE * self.index
         )
 
@@ -91,15 +91,15 @@ class LevelPointerData(_PositionMixin, _IndexedMixin, DataPoint):
         Returns the offset, based on the level pointers object set, that needs to be added to its level header offset in
         order to get the actual memory location of the level in the ROM.
         """
-        return self._rom.int(OFFSET_BY_OBJECT_SET_A000 + self.object_set) * PRG_BANK_SIZE - 0xA000
+        return self._rom.u8(OFFSET_BY_OBJECT_SET_A000 + self.object_set) * PRG_BANK_SIZE - 0xA000
 
     def read_values(self):
         self.screen, self.x = self._rom.nibbles(self.screen_address)
 
         self.y, self.object_set = self._rom.nibbles(self.y_address)
 
-        self.level_offset = self._rom.little_endian(self.level_offset_address)
-        self.enemy_offset = self._rom.little_endian(self.enemy_offset_address)
+        self.level_offset = self._rom.u16le(self.level_offset_address)
+        self.enemy_offset = self._rom.u16le(self.enemy_offset_address)
 
     def clear(self):
         self.screen = 0
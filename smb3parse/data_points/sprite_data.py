@@ -74,20 +74,20 @@ class SpriteData(_PositionMixin, _IndexedMixin, DataPoint):
         :param list_of_list_address:
         :return:
         """
-        list_offset = self._rom.little_endian(list_of_list_address + self.world.index * OFFSET_SIZE)
+        list_offset = self._rom.u16le(list_of_list_address + self.world.index * OFFSET_SIZE)
         list_address = BASE_OFFSET + PAGE_C000_OFFSET + list_offset
 
         return list_address + self.index
 
     def read_values(self):
-        self.screen = self._rom.int(self.screen_address)
+        self.screen = self._rom.u8(self.screen_address)
 
         # lower nibble is 0 and is unused
         self.x, _ = self._rom.nibbles(self._x_pos_address)
         self.y, _ = self._rom.nibbles(self._y_pos_address)
 
-        self.type = self._rom.int(self._type_address)
-        self.item = self._rom.int(self._item_address)
+        self.type = self._rom.u8(self._type_address)
+        self.item = self._rom.u8(self._item_address)
 
     def clear(self):
         self.screen = 0
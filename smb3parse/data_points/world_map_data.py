@@ -302,7 +302,7 @@ class WorldMapData(_IndexedMixin, DataPoint):
         self.airship_travel_y_set_address = Map_Airship_Dest_YSets + AIRSHIP_TRAVEL_SET_COUNT * OFFSET_SIZE * self.index
 
         self.fortress_fx_base_index_address = FortressFXBase_ByWorld + self.index
-        self.fortress_fx_base_index = self._rom.int(self.fortress_fx_base_index_address)
+        self.fortress_fx_base_index = self._rom.u8(self.fortress_fx_base_index_address)
 
         self.airship_level_offset_address = Airship_Layouts + OFFSET_SIZE * self.index
         self.airship_enemy_offset_address = Airship_Objects + OFFSET_SIZE * self.index
@@ -324,26 +324,26 @@ class WorldMapData(_IndexedMixin, DataPoint):
         self.music_index_address = World_BGM + self.index
 
     def read_values(self):
-        self.tile_data_offset = self._rom.little_endian(self.tile_data_offset_address)
+        self.tile_data_offset = self._rom.u16le(self.tile_data_offset_address)
         self.tile_data = self._rom.read_until(self.layout_address, WORLD_MAP_LAYOUT_DELIMITER)
 
-        self.palette_index = self._rom.int(self.palette_index_address)
-        self.obj_color_index = self._rom.int(self.obj_color_index_address)
+        self.palette_index = self._rom.u8(self.palette_index_address)
+        self.obj_color_index = self._rom.u8(self.obj_color_index_address)
 
-        self.bottom_border_tile = self._rom.int(self.bottom_border_tile_address)
-        self.frame_tick_count = self._rom.int(self.frame_tick_count_address)
+        self.bottom_border_tile = self._rom.u8(self.bottom_border_tile_address)
+        self.frame_tick_count = self._rom.u8(self.frame_tick_count_address)
 
-        self.structure_data_offset = self._rom.little_endian(self.structure_data_offset_address)
+        self.structure_data_offset = self._rom.u16le(self.structure_data_offset_address)
 
         self.pos_offsets_for_screen = self._rom.read(self.structure_block_address, MAX_SCREEN_COUNT)
 
-        self.y_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.little_endian(self.y_pos_list_start_address)
-        self.x_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.little_endian(self.x_pos_list_start_address)
+        self.y_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.u16le(self.y_pos_list_start_address)
+        self.x_pos_list_start = WORLD_MAP_BASE_OFFSET + self._rom.u16le(self.x_pos_list_start_address)
 
         self.level_pointers = [LevelPointerData(self, index) for index in range(self.level_count)]
 
-        self.enemy_offset_list_offset = self._rom.little_endian(self.enemy_offset_list_offset_address)
-        self.level_offset_list_offset = self._rom.little_endian(self.level_offset_list_offset_address)
+        self.enemy_offset_list_offset = self._rom.u16le(self.enemy_offset_list_offset_address)
+        self.level_offset_list_offset = self._rom.u16le(self.level_offset_list_offset_address)
 
         if self.index != WORLD_MAP_WARP_WORLD_INDEX:
             assert self.level_offset_list_offset == self.enemy_offset_list_offset + self.level_count * OFFSET_SIZE, (
@@ -351,16 +351,16 @@ class WorldMapData(_IndexedMixin, DataPoint):
                 self.level_count,
             )
 
-        self.map_start_y = self._rom.int(self.map_start_y_address)
-        self.map_scroll = self._rom.int(self.map_scroll_address)
+        self.map_start_y = self._rom.u8(self.map_start_y_address)
+        self.map_scroll = self._rom.u8(self.map_scroll_address)
 
-        self.airship_travel_base_index = self._rom.int(self.airship_travel_base_index_address)
+        self.airship_travel_base_index = self._rom.u8(self.airship_travel_base_index_address)
 
         for set_number in range(AIRSHIP_TRAVEL_SET_COUNT):
             self.airship_travel_sets[set_number].clear()
 
-            offset_x = self._rom.little_endian(self.airship_travel_x_set_address + set_number * OFFSET_SIZE)
-            offset_y = self._rom.little_endian(self.airship_travel_y_set_address + set_number * OFFSET_SIZE)
+            offset_x = self._rom.u16le(self.airship_travel_x_set_address + set_number * OFFSET_SIZE)
+            offset_y = self._rom.u16le(self.airship_travel_y_set_address + set_number * OFFSET_SIZE)
 
             for index in range(AIRSHIP_TRAVEL_SET_SIZE):
                 x, screen = self._rom.nibbles(BASE_OFFSET + 0xC000 + offset_x + index)
@@ -368,36 +368,36 @@ class WorldMapData(_IndexedMixin, DataPoint):
 
                 self.airship_travel_sets[set_number].append(Position(x, y, screen))
 
-        self.fortress_fx_base_index = self._rom.int(self.fortress_fx_base_index_address)
-        self.fortress_fx_count = self._rom.int(self.fortress_fx_base_index_address + 1) - self.fortress_fx_base_index
+        self.fortress_fx_base_index = self._rom.u8(self.fortress_fx_base_index_address)
+        self.fortress_fx_count = self._rom.u8(self.fortress_fx_base_index_address + 1) - self.fortress_fx_base_index
 
         self.fortress_fx.clear()
         self.fortress_fx_indexes.clear()
 
         for offset in range(self.fortress_fx_count):
-            index = self._rom.int(self.fortress_fx_indexes_start_address + offset)
+            index = self._rom.u8(self.fortress_fx_indexes_start_address + offset)
 
             self.fortress_fx.append(FortressFXData(self._rom, index))
             self.fortress_fx_indexes.append(index)
 
-        self.airship_level_offset = self._rom.little_endian(self.airship_level_offset_address)
-        self.airship_enemy_offset = self._rom.little_endian(self.airship_enemy_offset_address)
+        self.airship_level_offset = self._rom.u16le(self.airship_level_offset_address)
+        self.airship_enemy_offset = self._rom.u16le(self.airship_enemy_offset_address)
 
-        self.coin_ship_level_offset = self._rom.little_endian(self.coin_ship_level_offset_address)
-        self.coin_ship_enemy_offset = self._rom.little_endian(self.coin_ship_enemy_offset_address)
+        self.coin_ship_level_offset = self._rom.u16le(self.coin_ship_level_offset_address)
+        self.coin_ship_enemy_offset = self._rom.u16le(self.coin_ship_enemy_offset_address)
 
-        self.generic_exit_level_offset = self._rom.little_endian(self.generic_exit_level_offset_address)
-        self.generic_exit_enemy_offset = self._rom.little_endian(self.generic_exit_enemy_offset_address)
-        self.generic_exit_object_set = self._rom.int(self.generic_exit_object_set_address)
+        self.generic_exit_level_offset = self._rom.u16le(self.generic_exit_level_offset_address)
+        self.generic_exit_enemy_offset = self._rom.u16le(self.generic_exit_enemy_offset_address)
+        self.generic_exit_object_set = self._rom.u8(self.generic_exit_object_set_address)
 
-        self.big_q_block_level_offset = self._rom.little_endian(self.big_q_block_level_offset_address)
-        self.big_q_block_enemy_offset = self._rom.little_endian(self.big_q_block_enemy_offset_address)
-        self.big_q_block_object_set = self._rom.int(self.big_q_block_object_set_address)
+        self.big_q_block_level_offset = self._rom.u16le(self.big_q_block_level_offset_address)
+        self.big_q_block_enemy_offset = self._rom.u16le(self.big_q_block_enemy_offset_address)
+        self.big_q_block_object_set = self._rom.u8(self.big_q_block_object_set_address)
 
-        self.toad_warp_level_offset = self._rom.little_endian(self.toad_warp_level_offset_address)
-        self.toad_warp_item = self._rom.little_endian(self.toad_warp_item_address)
+        self.toad_warp_level_offset = self._rom.u16le(self.toad_warp_level_offset_address)
+        self.toad_warp_item = self._rom.u16le(self.toad_warp_item_address)
 
-        self.music_index = self._rom.int(self.music_index_address)
+        self.music_index = self._rom.u8(self.music_index_address)
 
     def write_back(self, rom: Optional[Rom] = None):
         if rom is None:
@@ -463,8 +463,8 @@ class WorldMapData(_IndexedMixin, DataPoint):
         rom.write(self.airship_travel_base_index_address, self.airship_travel_base_index)
 
         for set_number in range(AIRSHIP_TRAVEL_SET_COUNT):
-            offset_x = rom.little_endian(self.airship_travel_x_set_address + set_number * OFFSET_SIZE)
-            offset_y = rom.little_endian(self.airship_travel_y_set_address + set_number * OFFSET_SIZE)
+            offset_x = rom.u16le(self.airship_travel_x_set_address + set_number * OFFSET_SIZE)
+            offset_y = rom.u16le(self.airship_travel_y_set_address + set_number * OFFSET_SIZE)
 
             for index in range(AIRSHIP_TRAVEL_SET_SIZE):
                 pos: Position = self.airship_travel_sets[set_number][index]
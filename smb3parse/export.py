@@ -0,0 +1,270 @@
+"""
+Exports all levels of one or more ROMs as m3l and ASM files, without any GUI.
+
+    python -m smb3parse SMB3.nes hack.nes --output exported_levels
+
+For every ROM a directory of the same name is created in the output directory, containing a manifest.json, listing
+every found level, and its exported files. Levels are either found by following the world maps, like the editor does
+for managed level positions, or taken from a levels.dat file.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from smb3parse import OFFSET_BY_OBJECT_SET_A000
+from smb3parse.constants import BASE_OFFSET, OFFSET_SIZE
+from smb3parse.levels import HEADER_LENGTH
+from smb3parse.util.parser import gen_levels_in_rom
+from smb3parse.util.parser.cpu import CPUSnapshot, NesCPU
+from smb3parse.util.process_pool import map_in_pool
+from smb3parse.util.rom import Rom
+
+DEFAULT_LEVELS_DAT = Path(__file__).parent.parent / "data" / "levels.dat"
+
+FORMATS = ["m3l", "asm"]
+
+
+@dataclass
+class LevelJob:
+    world: int
+    name: str
+
+    object_set: int
+    level_address: int
+    """Address of the level header in the ROM."""
+    enemy_address: int
+
+    @property
+    def file_stem(self) -> str:
+        return f"{self.object_set:02d}_{self.level_address:05X}_{self.enemy_address:05X}"
+
+
+def levels_from_world_maps(rom: Rom, parallel: bool) -> list[LevelJob]:
+    level_gen = gen_levels_in_rom(rom, parallel)
+
+    # gen_levels_in_rom reports on stdout, which is reserved for the results
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            next(level_gen)
+
+            while True:
+                level_gen.send(False)
+
+        except StopIteration as si:
+            _, levels_by_address = si.value
+
+    return [
+        LevelJob(
+            found_level.world_number,
+            f"Level at {found_level.level_offset:#X}",
+            found_level.object_set_number,
+            found_level.level_offset,
+            found_level.enemy_offset,
+        )
+        for _, found_level in sorted(levels_by_address.items())
+    ]
+
+
+def levels_from_levels_dat(path: Path) -> list[LevelJob]:
+    level_jobs = []
+
+    for line in path.read_text().splitlines():
+        if not line:
+            continue
+
+        world, _, object_address, enemy_address, object_set, name = line.split(",", maxsplit=5)
+
+        if int(object_set, 16) == 0:
+            # world maps
+            continue
+
+        level_jobs.append(
+            LevelJob(
+                int(world),
+                name,
+                int(object_set, 16),
+                # levels.dat points to the objects after the header and to the enemies after their first byte
+                int(object_address, 16) - HEADER_LENGTH,
+                int(enemy_address, 16) - 1,
+            )
+        )
+
+    return level_jobs
+
+
+def _bytes_to_asm(data: Iterable[int]) -> str:
+    return ", ".join(f"${byte:02X}" for byte in data)
+
+
+def _to_asm(rom: Rom, job: LevelJob, header: bytes, objects: list[list[int]], enemies: list[list[int]]) -> str:
+    """Same layout as Level.to_asm in the editor, but without the names of the objects."""
+    object_set_offset = (rom.int(OFFSET_BY_OBJECT_SET_A000 + job.object_set) * OFFSET_SIZE - 10) * 0x1000
+    level_offset = (job.level_address - BASE_OFFSET - object_set_offset) & 0xFFFF
+
+    lines = [
+        f"; Original address was ${level_offset:04X}",
+        f"; {job.name}'s layout data",
+        f"\t.byte {_bytes_to_asm(header[0:2])}\t\t\t ; Next Area Layout Offset",
+        f"\t.byte {_bytes_to_asm(header[2:4])}\t\t\t ; Next Area Enemy & Item Offset",
+        f"\t.byte {_bytes_to_asm(header[4:5])}\t\t\t\t ; Level Size Index | Y-Start Index",
+        f"\t.byte {_bytes_to_asm(header[5:6])}\t\t\t\t ; BG Pal | Enemy Pal | X-Start Index | Unused",
+        f"\t.byte {_bytes_to_asm(header[6:7])}\t\t\t\t ; Pipe Ends Level | VScroll Index | Vertical Flag | "
+        "Next Area Object Set",
+        f"\t.byte {_bytes_to_asm(header[7:8])}\t\t\t\t ; Level Entry Action | Graphic Set",
+        f"\t.byte {_bytes_to_asm(header[8:9])}\t\t\t\t ; Time Index | Unused | Music Index",
+        "",
+    ]
+
+    for obj in objects:
+        indent = "" if len(obj) == 4 else "\t\t"
+        domain, obj_id, x, y = obj[0] >> 5, obj[2], obj[1], obj[0] & 0x1F
+
+        lines.append(f"\t.byte {_bytes_to_asm(obj)}{indent} ; Domain {domain}, ID ${obj_id:02X} @ {x}, {y}")
+
+    lines.append("\t.byte $FF\t\t\t\t ; delimiter")
+    lines.append("")
+    lines.append(f"; {job.name}'s enemy data")
+    lines.append(f"\t.byte {_bytes_to_asm([rom.int(job.enemy_address)])}\t\t\t; Unused byte, set to $01")
+
+    for enemy in enemies:
+        lines.append(f"\t.byte {_bytes_to_asm(enemy)}\t; ID ${enemy[0]:02X} @ {enemy[1]}, {enemy[2]}")
+
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class _ExportWorker:
+    cpu: NesCPU
+    start_state: CPUSnapshot
+
+    output_dir: Path
+    formats: list[str]
+
+
+def _set_up_export_worker(rom_data: bytes, output_dir: Path, formats: list[str]) -> _ExportWorker:
+    cpu = NesCPU(Rom(bytearray(rom_data)))
+
+    return _ExportWorker(cpu, cpu.snapshot(), output_dir, formats)
+
+
+def _export_level(worker: _ExportWorker, job: LevelJob) -> dict:
+    """Parses the level and writes its files. Returns its entry of the manifest."""
+    rom = worker.cpu.rom
+
+    entry: dict = {
+        "name": job.name,
+        "world": job.world,
+        "object_set": job.object_set,
+        "level_address": job.level_address,
+        "enemy_address": job.enemy_address,
+    }
+
+    worker.cpu.restore(worker.start_state)
+
+    try:
+        parsed_level = worker.cpu.load_from_address(job.object_set, job.level_address, job.enemy_address)
+    except Exception as e:
+        # broken levels in hacks shouldn't stop the export of the others
+        entry["error"] = f"{type(e).__name__}: {e}"
+        return entry
+
+    header = bytes(rom.read(job.level_address, HEADER_LENGTH))
+    objects = [parsed_object.obj_bytes for parsed_object in parsed_level.parsed_objects]
+    enemies = [parsed_enemy.obj_bytes for parsed_enemy in parsed_level.parsed_enemies]
+
+    entry["object_data_length"] = parsed_level.object_data_length
+    entry["enemy_data_length"] = parsed_level.enemy_data_length
+    entry["object_count"] = len(objects)
+    entry["enemy_count"] = len(enemies)
+    entry["files"] = []
+
+    if "m3l" in worker.formats:
+        m3l_bytes = bytearray([job.world, 0, job.object_set])
+        m3l_bytes.extend(header)
+
+        for obj in objects:
+            m3l_bytes.extend(obj)
+
+        m3l_bytes.append(0xFF)
+        m3l_bytes.append(rom.int(job.enemy_address))
+
+        for enemy in enemies:
+            m3l_bytes.extend(enemy)
+
+        m3l_bytes.append(0xFF)
+
+        m3l_path = worker.output_dir / f"{job.file_stem}.m3l"
+        m3l_path.write_bytes(m3l_bytes)
+        entry["files"].append(m3l_path.name)
+
+    if "asm" in worker.formats:
+        asm_path = worker.output_dir / f"{job.file_stem}.asm"
+        asm_path.write_text(_to_asm(rom, job, header, objects, enemies))
+        entry["files"].append(asm_path.name)
+
+    return entry
+
+
+def export_levels(
+    rom: Rom, level_jobs: list[LevelJob], output_dir: Path, formats: list[str], workers: int
+) -> Iterator[dict]:
+    """Exports the levels in a pool of processes and yields their manifest entries, in the order of the jobs."""
+    yield from map_in_pool(
+        _export_level, _set_up_export_worker, (rom.as_bytes(), output_dir, formats), level_jobs, workers, chunksize=8
+    )
+
+
+def export_rom(rom_path: Path, output_dir: Path, levels_dat: Optional[Path], formats: list[str], workers: int):
+    rom = Rom.from_file(rom_path)
+
+    rom_output_dir = output_dir / rom_path.stem
+    rom_output_dir.mkdir(parents=True, exist_ok=True)
+
+    if levels_dat is None:
+        level_jobs = levels_from_world_maps(rom, parallel=workers != 1)
+    else:
+        level_jobs = levels_from_levels_dat(levels_dat)
+
+    print(f"{rom_path}: exporting {len(level_jobs)} levels to {rom_output_dir}", file=sys.stderr)
+
+    # write the manifest while the levels come in, instead of keeping them all in memory
+    with (rom_output_dir / "manifest.json").open("w") as manifest:
+        manifest.write(f'{{"rom": {json.dumps(str(rom_path))}, "levels": [\n')
+
+        for index, entry in enumerate(export_levels(rom, level_jobs, rom_output_dir, formats, workers)):
+            if index > 0:
+                manifest.write(",\n")
+
+            manifest.write(json.dumps(entry))
+
+            if "error" in entry:
+                print(f"{rom_path}: {entry['name']}: {entry['error']}", file=sys.stderr)
+
+        manifest.write("\n]}\n")
+
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m smb3parse", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("roms", type=Path, nargs="+", help="The ROMs to export the levels of.")
+    parser.add_argument("-o", "--output", type=Path, default=Path("exported_levels"), help="Where to put the files.")
+    parser.add_argument(
+        "--levels-dat",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_LEVELS_DAT,
+        help="Take the levels from this levels.dat, instead of following the world maps. Without a path, the one of "
+        "the editor is used.",
+    )
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS, help="What files to export.")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+
+    parsed_args = parser.parse_args(args)
+
+    for rom_path in parsed_args.roms:
+        export_rom(rom_path, parsed_args.output, parsed_args.levels_dat, parsed_args.formats, parsed_args.workers)
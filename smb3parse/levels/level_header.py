@@ -1,3 +1,5 @@
+from typing import Optional
+
 from smb3parse.levels import (
     DEFAULT_HORIZONTAL_HEIGHT,
     DEFAULT_VERTICAL_WIDTH,
@@ -23,50 +25,110 @@ MARIO_Y_POSITIONS = [
 
 
 class LevelHeader:
+    """
+    Decodes the fields of a level header straight from its bytes, whenever they are asked for. That way changes to the
+    bytes show up right away, without having to parse the header again.
+    """
+
     def __init__(self, rom: Rom, header_bytes: bytearray, object_set_number: int):
         if len(header_bytes) != HEADER_LENGTH:
             raise ValueError(f"A level header is made up of {HEADER_LENGTH} bytes, but {len(header_bytes)} were given.")
 
         assert_valid_object_set_number(object_set_number)
 
+        self._rom = rom
         self._object_set_number = object_set_number
-        self._object_set = ObjectSet(rom, self._object_set_number)
 
         self.data = header_bytes
 
-        self.start_y_index = (self.data[4] & 0b1110_0000) >> 5
+        self._jump_object_set: Optional[ObjectSet] = None
 
-        self.screens = self.data[4] & 0b0000_1111
-        self.length = LEVEL_MIN_LENGTH + self.screens * LEVEL_LENGTH_INTERVAL
-        self.width = self.length
-        self.height = DEFAULT_HORIZONTAL_HEIGHT
+    @property
+    def start_y_index(self) -> int:
+        return (self.data[4] & 0b1110_0000) >> 5
 
-        self.start_x_index = (self.data[5] & 0b0110_0000) >> 5
+    @property
+    def screens(self) -> int:
+        return self.data[4] & 0b0000_1111
 
-        self.enemy_palette_index = (self.data[5] & 0b0001_1000) >> 3
-        self.object_palette_index = self.data[5] & 0b0000_0111
+    @property
+    def length(self) -> int:
+        return LEVEL_MIN_LENGTH + self.screens * LEVEL_LENGTH_INTERVAL
 
-        self.pipe_ends_level = not (self.data[6] & 0b1000_0000)
-        self.scroll_type_index = (self.data[6] & 0b0110_0000) >> 5
-        self.is_vertical = self.data[6] & 0b0001_0000
+    @property
+    def width(self) -> int:
+        if self.is_vertical:
+            return DEFAULT_VERTICAL_WIDTH
+        else:
+            return self.length
 
+    @property
+    def height(self) -> int:
         if self.is_vertical:
-            self.height = self.length
-            self.width = DEFAULT_VERTICAL_WIDTH
+            return self.length
+        else:
+            return DEFAULT_HORIZONTAL_HEIGHT
 
-        self.jump_object_set_number = self.data[6] & 0b0000_1111  # for indexing purposes
-        self.jump_object_set = ObjectSet(rom, self.jump_object_set_number)
+    @property
+    def start_x_index(self) -> int:
+        return (self.data[5] & 0b0110_0000) >> 5
 
-        self.start_action = (self.data[7] & 0b1110_0000) >> 5
+    @property
+    def enemy_palette_index(self) -> int:
+        return (self.data[5] & 0b0001_1000) >> 3
+
+    @property
+    def object_palette_index(self) -> int:
+        return self.data[5] & 0b0000_0111
 
-        self.graphic_set_index = self.data[7] & 0b0001_1111
+    @property
+    def pipe_ends_level(self) -> bool:
+        return not (self.data[6] & 0b1000_0000)
 
-        self.time_index = (self.data[8] & 0b1100_0000) >> 6
+    @property
+    def scroll_type_index(self) -> int:
+        return (self.data[6] & 0b0110_0000) >> 5
 
-        self.music_index = self.data[8] & 0b0000_1111
+    @property
+    def is_vertical(self) -> int:
+        return self.data[6] & 0b0001_0000
 
-        self.jump_level_offset = (self.data[1] << 8) + self.data[0]
-        self.jump_enemy_offset = (self.data[3] << 8) + self.data[2]
+    @property
+    def jump_object_set_number(self) -> int:
+        """For indexing purposes."""
+        return self.data[6] & 0b0000_1111
+
+    @property
+    def jump_object_set(self) -> ObjectSet:
+        # only read the object set from the ROM again, when the header points to a different one
+        if self._jump_object_set is None or self._jump_object_set.number != self.jump_object_set_number:
+            self._jump_object_set = ObjectSet(self._rom, self.jump_object_set_number)
+
+        return self._jump_object_set
+
+    @property
+    def start_action(self) -> int:
+        return (self.data[7] & 0b1110_0000) >> 5
+
+    @property
+    def graphic_set_index(self) -> int:
+        return self.data[7] & 0b0001_1111
+
+    @property
+    def time_index(self) -> int:
+        return (self.data[8] & 0b1100_0000) >> 6
+
+    @property
+    def music_index(self) -> int:
+        return self.data[8] & 0b0000_1111
+
+    @property
+    def jump_level_offset(self) -> int:
+        return (self.data[1] << 8) + self.data[0]
+
+    @property
+    def jump_enemy_offset(self) -> int:
+        return (self.data[3] << 8) + self.data[2]
 
     def mario_position(self):
         x = MARIO_X_POSITIONS[self.start_x_index] >> 4
@@ -83,7 +145,10 @@ class LevelHeader:
 
     @jump_level_address.setter
     def jump_level_address(self, value):
-        self.jump_level_offset = value - self.jump_object_set.level_offset
+        offset = value - self.jump_object_set.level_offset
+
+        self.data[0] = offset & 0x00FF
+        self.data[1] = offset >> 8
 
     @property
     def jump_enemy_address(self):
@@ -91,4 +156,7 @@ class LevelHeader:
 
     @jump_enemy_address.setter
     def jump_enemy_address(self, value):
-        self.jump_enemy_offset = value - ENEMY_BASE_OFFSET
+        offset = value - ENEMY_BASE_OFFSET
+
+        self.data[2] = offset & 0x00FF
+        self.data[3] = offset >> 8
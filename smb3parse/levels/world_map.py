@@ -36,8 +36,7 @@ Y_START_POS_LIST = Map_Y_Starts
 
 def list_world_map_addresses(rom: Rom) -> list[int]:
     addresses = [
-        WORLD_MAP_BASE_OFFSET + rom.little_endian(LAYOUT_LIST_OFFSET + OFFSET_SIZE * world)
-        for world in range(WORLD_COUNT)
+        WORLD_MAP_BASE_OFFSET + rom.u16le(LAYOUT_LIST_OFFSET + OFFSET_SIZE * world) for world in range(WORLD_COUNT)
     ]
 
     return addresses
@@ -64,16 +63,12 @@ def level_name(data: Optional[LevelPointerData]) -> str:
     return f"Level {data.world.index + 1}-{TILE_NAMES[tile]}"
 
 
-def _get_normal_enterable_tiles(rom: Rom) -> bytes:
-    return rom.read(TILE_ATTRIBUTES_TS0_OFFSET, 4)
-
-
 def _get_special_enterable_tiles(rom: Rom) -> bytes:
     return rom.read(SPECIAL_ENTERABLE_TILES_LIST, SPECIAL_ENTERABLE_TILE_AMOUNT)
 
 
-def _get_completable_tiles(rom: Rom) -> bytearray:
-    completable_tile_amount = (
+def _completable_tile_amount(rom: Rom) -> int:
+    return (
         rom.find(
             COMPLETABLE_LIST_END_MARKER.to_bytes(1, byteorder="big"),
             COMPLETABLE_TILES_LIST,
@@ -81,16 +76,15 @@ def _get_completable_tiles(rom: Rom) -> bytearray:
         - COMPLETABLE_TILES_LIST
     )
 
-    return rom.read(COMPLETABLE_TILES_LIST, completable_tile_amount)
-
 
 def tile_is_enterable(tile_index: int, rom: Rom) -> bool:
+    # called for every tile of a world map, so look at the tile lists without copying them
     quadrant_index = tile_index >> 6
 
     return (
-        tile_index >= _get_normal_enterable_tiles(rom)[quadrant_index]
-        or tile_index in _get_completable_tiles(rom)
-        or tile_index in _get_special_enterable_tiles(rom)
+        tile_index >= rom.u8(TILE_ATTRIBUTES_TS0_OFFSET + quadrant_index)
+        or tile_index in rom.view(COMPLETABLE_TILES_LIST, _completable_tile_amount(rom))
+        or tile_index in rom.view(SPECIAL_ENTERABLE_TILES_LIST, SPECIAL_ENTERABLE_TILE_AMOUNT)
     )
 
 
@@ -73,7 +73,7 @@ class ObjectSet:
         self.level_offset = BASE_OFFSET
 
         if self.number != ENEMY_ITEM_OBJECT_SET:
-            object_set_offset = self.rom.int(OFFSET_BY_OBJECT_SET_A000 + self.number) * PRG_BANK_SIZE
+            object_set_offset = self.rom.u8(OFFSET_BY_OBJECT_SET_A000 + self.number) * PRG_BANK_SIZE
 
             self.level_offset += object_set_offset - PAGE_A000_OFFSET
 
@@ -141,3 +141,19 @@ def test_level_7_1():
 
     assert level_header.jump_enemy_address == 0xC25D
     assert level_header.jump_level_address == 0x1EA71
+
+
+def test_fields_follow_the_bytes():
+    # GIVEN a level header
+    level_header_bytes = bytearray([0x93, 0xBC, 0x06, 0xC0, 0xEA, 0x80, 0x81, 0x01, 0x00])
+
+    level_header = LevelHeader(rom, level_header_bytes, PIPE_OBJECT_SET)
+
+    # WHEN its bytes are changed afterwards
+    level_header_bytes[6] |= 0b0001_0000
+    level_header_bytes[8] = 0x05
+
+    # THEN the fields show the change, without parsing the header again
+    assert level_header.music_index == 5
+    assert level_header.is_vertical
+    assert level_header.width == DEFAULT_VERTICAL_WIDTH
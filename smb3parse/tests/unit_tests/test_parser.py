@@ -1,6 +1,14 @@
 import json
 
-from smb3parse.util.parser import FoundLevel
+from smb3parse.constants import BASE_OFFSET
+from smb3parse.util.parser import FoundLevel, cache as cache_module
+from smb3parse.util.parser.cache import FoundLevelCache
+from smb3parse.util.parser.constants import MEM_Screen_Start_AddressL, MMC3_8K_TO_PRG_C000
+from smb3parse.util.parser.cpu import NesCPU
+from smb3parse.util.parser.level import LevelParseResult
+from smb3parse.util.parser.memory import NESMemory
+from smb3parse.util.parser.trace import KIND_INSTRUCTION, KIND_WRITE, TraceReader, TraceRecorder
+from smb3parse.util.rom import PRG_BANK_SIZE
 
 
 def test_found_level_json():
@@ -11,3 +19,156 @@ def test_found_level_json():
     recovered_found_level = FoundLevel.from_dict(json.loads(as_json))
 
     assert recovered_found_level == found_level
+
+
+def test_nes_memory_observers_and_ignored_writes(rom):
+    # GIVEN the memory of the parser with an observer on a part of it
+    memory = NESMemory(rom)
+
+    observed_writes = []
+    memory.add_write_observer(range(0x6010, 0x6020), lambda address, value: observed_writes.append((address, value)))
+
+    # WHEN values are written inside and outside of the observed range, and to the ignored addresses
+    memory[0x6000] = 1
+    memory[0x6010] = 2
+    memory[MEM_Screen_Start_AddressL] = 3
+
+    # THEN only the observed write was reported and the ignored write didn't change the memory
+    assert observed_writes == [(0x6010, 2)]
+    assert memory[0x6000 : 0x6000 + 1] == [1]
+    assert memory[0x6010] == 2
+    assert memory[MEM_Screen_Start_AddressL] == rom.int(BASE_OFFSET + (rom.prg_banks - 2) * PRG_BANK_SIZE)
+
+    # and the level loading is never kept waiting
+    memory[0x10] = 0
+    assert memory[0x10] == 0b1000_0000
+
+
+def test_found_level_cache_only_keeps_results_of_unchanged_banks(rom, tmp_path):
+    # GIVEN a cache with the parse results of two levels in different PRG banks
+    cache = FoundLevelCache(tmp_path)
+
+    unchanged_result = LevelParseResult(0x20, 0x6, False, [1])
+    changed_result = LevelParseResult(0x30, 0x9, True, [2])
+
+    found_levels = [FoundLevel([123, 234], [234, 345], 1, 234, 567, 5, 50, 48, True, False, True).to_dict()]
+
+    cache.store(rom, found_levels, {(1, 0x100, 0x200): unchanged_result, (2, 0x300, 0x400): changed_result})
+
+    assert cache.found_levels(rom) == found_levels
+
+    # WHEN one of the banks is changed
+    rom.write(BASE_OFFSET + 2 * PRG_BANK_SIZE, rom.int(BASE_OFFSET + 2 * PRG_BANK_SIZE) ^ 0xFF)
+
+    # THEN only the result of the level in the unchanged bank is still returned
+    assert cache.parse_results(rom) == {(1, 0x100, 0x200): unchanged_result}
+
+    # and the found levels of the ROM are unknown
+    assert cache.found_levels(rom) is None
+
+
+def test_found_level_cache_drops_the_oldest_entries(rom, tmp_path, monkeypatch):
+    # GIVEN a cache, that only keeps the found levels of one ROM and one parse result
+    monkeypatch.setattr(cache_module, "MAX_FOUND_LEVEL_FILES", 1)
+    monkeypatch.setattr(cache_module, "MAX_PARSE_RESULTS", 1)
+
+    cache = FoundLevelCache(tmp_path)
+
+    old_result = LevelParseResult(0x20, 0x6, False, [1])
+    new_result = LevelParseResult(0x30, 0x9, True, [1])
+
+    cache.store(rom, [], {(1, 0x100, 0x200): old_result})
+
+    # WHEN the results of a changed ROM are stored
+    rom.write(BASE_OFFSET + 2 * PRG_BANK_SIZE, rom.int(BASE_OFFSET + 2 * PRG_BANK_SIZE) ^ 0xFF)
+
+    cache.store(rom, [], {(2, 0x300, 0x400): new_result})
+
+    # THEN only the newer entries are kept and no temporary files are left behind
+    assert cache.parse_results(rom) == {(2, 0x300, 0x400): new_result}
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [f"{cache.rom_hash(rom)}.json", cache_module.PARSE_RESULTS_FILE_NAME]
+    )
+
+
+def test_cpu_restores_snapshot(rom):
+    # GIVEN a freshly set up CPU and a snapshot of it
+    cpu = NesCPU(rom)
+    start_state = cpu.snapshot()
+
+    # WHEN its memory, registers and banks are changed and the snapshot is restored
+    cpu.memory[0x6000] = 0x12
+    cpu.memory.load_a000_page(3)
+    cpu.pc, cpu.a = 0x1234, 0x56
+
+    cpu.restore(start_state)
+
+    # THEN it is in the same state as before
+    assert cpu.snapshot() == start_state
+    assert cpu.memory[0x6000] == 0
+
+
+def test_cpu_hooks_for_pc_and_bank_switches(rom):
+    # GIVEN a program in RAM, that switches the bank at 0xC000 through the mapper, like the ROM does
+    cpu = NesCPU(rom)
+
+    program = [0xA9, MMC3_8K_TO_PRG_C000, 0x8D, 0x00, 0x80, 0xA9, 0x05, 0x8D, 0x01, 0x80]  # LDA #, STA $8000, ...
+    program_start = 0x300
+    program_end = program_start + len(program)
+
+    for offset, byte in enumerate(program):
+        cpu.memory[program_start + offset] = byte
+
+    # and hooks on the second instruction and on bank switches
+    called_pcs = []
+    bank_switches = []
+
+    cpu.add_pc_hook(program_start + 2, lambda: called_pcs.append(cpu.pc))
+    cpu.add_bank_switch_hook(lambda page_address, prg_index: bank_switches.append((page_address, prg_index)))
+
+    # WHEN the program is run
+    cpu.pc = program_start
+    cpu.run_until(program_end)
+
+    # THEN the hooks were called and the bank was switched
+    assert called_pcs == [program_start + 2]
+    assert bank_switches == [(0xC000, 5)]
+
+    assert cpu.c000_bank == 5
+    assert cpu.memory[0xC000] == rom.int(BASE_OFFSET + 5 * PRG_BANK_SIZE)
+
+
+def test_trace_records_instructions_and_writes(rom):
+    # GIVEN a CPU recording a trace into a small ring buffer and a program in RAM, that writes into memory
+    cpu = NesCPU(rom)
+
+    recorder = TraceRecorder(capacity=8)
+    cpu.record_trace(recorder)
+
+    program = [0xE8, 0x8E, 0x00, 0x60, 0x4C, 0x00, 0x03]  # INX, STX $6000, JMP $0300
+    program_start = 0x300
+
+    for offset, byte in enumerate(program):
+        cpu.memory[program_start + offset] = byte
+
+    # WHEN it runs longer, than the trace has room for
+    cpu.pc = program_start
+    cpu.run_until(-1, max_steps=30)
+
+    recorder.flush()
+
+    # THEN only the latest records are kept
+    reader = TraceReader(recorder.buffer)
+
+    assert [record.step for record in reader] == [25, 26, 26, 27, 28, 29, 29, 30]
+
+    # and writes can be found together with their instruction
+    stores = reader.filter(written_addresses=range(0x6000, 0x6001))
+
+    assert [(record.kind, record.address) for record in stores] == [
+        (KIND_INSTRUCTION, program_start + 1),
+        (KIND_WRITE, 0x6000),
+        (KIND_INSTRUCTION, program_start + 1),
+        (KIND_WRITE, 0x6000),
+    ]
+    assert stores[-1].value == cpu.x
@@ -1,4 +1,5 @@
-from smb3parse.util.rom import INESHeader, Rom
+from smb3parse.types import NormalizedAddress
+from smb3parse.util.rom import INESHeader, Rom, changed_ranges
 
 
 def test_find():
@@ -59,3 +60,61 @@ def test_expanded_rom_reads_same_as_normal(rom, expanded_rom):
             continue
 
         assert rom.read(offset, 0x10) == expanded_rom.read(offset, 0x10)
+
+
+def test_changed_ranges():
+    # GIVEN data with changes in and across the chunks it is compared in
+    old_data = bytes(range(256)) * 16
+    new_data = bytearray(old_data)
+
+    new_data[10:12] = b"\xff\xff"
+    new_data[15] = 0xFF
+    new_data[1020:1030] = b"\xaa" * 10
+
+    # THEN only the bytes, that actually changed, are reported
+    assert list(changed_ranges(old_data, new_data)) == [(10, 12), (15, 16), (1020, 1030)]
+
+    # THEN changes close to each other can be joined
+    assert list(changed_ranges(old_data, new_data, join_distance=3)) == [(10, 16), (1020, 1030)]
+
+
+def test_dirty_ranges():
+    rom_bytes = bytearray(b"\x00\x01\x02\x03\x04\x05\x06\x00\xff\xff\xff\xff\xff\xff\xff\xff")
+    header = INESHeader.from_buffer_copy(rom_bytes)
+
+    rom = Rom(rom_bytes, header)
+
+    # WHEN bytes are written, that are the same as before
+    rom.write(NormalizedAddress(8), b"\xff\xff")
+
+    # THEN nothing is dirty
+    assert not rom.dirty_ranges
+
+    # WHEN changes are written, that touch and overlap
+    rom.write(NormalizedAddress(1), b"\xaa\xbb")
+    rom.write(NormalizedAddress(3), b"\xcc")
+    rom.write(NormalizedAddress(10), b"\x00\xff\x00")
+    rom.write(NormalizedAddress(2), b"\x00\x00")
+
+    # THEN only the changed bytes are dirty, merged into as few ranges as possible
+    assert list(rom.dirty_ranges) == [(1, 4), (10, 11), (12, 13)]
+
+
+def test_views_and_accessors():
+    rom_bytes = bytearray(b"\x00\x01\x02\x03\x04\x05\x06\x00\xff\xff\xff\xff\xff\xff\xff\xff")
+    header = INESHeader.from_buffer_copy(rom_bytes)
+
+    rom = Rom(rom_bytes, header)
+
+    assert rom.u8(5) == rom.int(5) == 0x05
+    assert rom.u16le(1) == rom.little_endian(1) == 0x0201
+
+    # WHEN a view of the ROM data is taken
+    view = rom.view(2, 3)
+
+    # THEN it has the same content as a read, but changes with the ROM data
+    assert view == rom.read(2, 3)
+
+    rom.write(NormalizedAddress(3), 0xAA)
+
+    assert view[1] == 0xAA
@@ -1,3 +1,6 @@
+import os
+import tempfile
+from pathlib import Path
 from typing import Optional
 
 
@@ -37,3 +40,21 @@ def lrange(a1: int, a2: Optional[int] = None, a3: Optional[int] = None, /):
         return list(range(a1, a2))
 
     return list(range(a1, a2, a3))
+
+
+def write_atomically(path: Path, data: bytes):
+    """
+    Writes the data into a temporary file next to the path first and then replaces the file at the path with it. That
+    way there is always either the old or the new file at the path, even if the program crashes while writing, or
+    another program writes to the same path at the same time.
+    """
+    file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(data)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
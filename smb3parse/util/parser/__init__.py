@@ -1,16 +1,20 @@
 import pathlib
 import time
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Generator
+from typing import Generator, Optional
 
-from smb3parse.constants import OFFSET_SIZE
+from smb3parse.constants import OFFSET_SIZE, PAGE_A000_ByTileset, PAGE_C000_ByTileset
 from smb3parse.data_points import LevelPointerData
 from smb3parse.levels import HEADER_LENGTH, WORLD_COUNT
 from smb3parse.levels.level_header import LevelHeader
 from smb3parse.levels.world_map import WorldMap
 from smb3parse.objects.object_set import MUSHROOM_OBJECT_SET, SPADE_BONUS_OBJECT_SET
-from smb3parse.util.parser.cpu import NesCPU
+from smb3parse.util.parser.cache import FoundLevelCache, prg_banks_of
+from smb3parse.util.parser.cpu import CPUSnapshot, NesCPU
+from smb3parse.util.parser.level import LevelKey, LevelParseResult
+from smb3parse.util.process_pool import create_pool, with_worker_state
 from smb3parse.util.rom import Rom
 
 
@@ -90,202 +94,348 @@ class FoundLevelRecord:
         )
 
 
+def _key_of(record: FoundLevelRecord) -> LevelKey:
+    return record.object_set, record.level_address, record.enemy_address
+
+
+def _parse_level(cpu: NesCPU, start_state: CPUSnapshot, record: FoundLevelRecord) -> LevelParseResult:
+    rom = cpu.rom
+
+    cpu.restore(start_state)
+
+    parsed_level = cpu.load_from_address(record.object_set, record.level_address, record.enemy_address)
+
+    # besides the banks loaded into memory, the level depends on what is read from the ROM directly
+    prg_banks = set(cpu.memory.loaded_prg_banks)
+    prg_banks.update(prg_banks_of(rom, PAGE_A000_ByTileset + record.object_set, 1))
+    prg_banks.update(prg_banks_of(rom, PAGE_C000_ByTileset + record.object_set, 1))
+    prg_banks.update(prg_banks_of(rom, record.level_address, HEADER_LENGTH))
+    prg_banks.update(prg_banks_of(rom, record.enemy_address, parsed_level.enemy_data_length + 2))
+
+    return LevelParseResult(
+        parsed_level.object_data_length,
+        parsed_level.enemy_data_length,
+        parsed_level.has_jump(),
+        sorted(prg_banks),
+    )
+
+
+def _jump_destination(rom: Rom, record: FoundLevelRecord) -> Optional[FoundLevelRecord]:
+    """Follows the offsets in the header of the level. Returns None, if the level doesn't jump anywhere."""
+    header_of_old_level = LevelHeader(
+        rom,
+        rom.read(record.level_address, HEADER_LENGTH),
+        record.object_set,
+    )
+
+    object_set_number = header_of_old_level.jump_object_set_number
+
+    if 0 in [header_of_old_level.jump_level_offset, object_set_number]:
+        return None
+
+    return FoundLevelRecord(
+        header_of_old_level.jump_level_address,
+        record.level_address,
+        header_of_old_level.jump_enemy_address,
+        record.level_address + OFFSET_SIZE,
+        object_set_number,
+        found_in_world=False,
+        found_as_jump=True,
+    )
+
+
+def _level_records_of_world(world: WorldMap) -> list[FoundLevelRecord]:
+    found_level_records: list[FoundLevelRecord] = [
+        (FoundLevelRecord.from_level_pointer(lp, True, False, False)) for lp in world.level_pointers
+    ]
+
+    # add airship
+    found_level_records.append(
+        FoundLevelRecord(
+            world.data.airship_level_address,
+            world.data.airship_level_offset_address,
+            world.data.airship_enemy_address,
+            world.data.airship_enemy_offset_address,
+            world.data.airship_level_object_set,
+            False,
+            False,
+            True,
+        )
+    )
+
+    # add generic exit
+    found_level_records.append(
+        FoundLevelRecord(
+            world.data.generic_exit_level_address,
+            world.data.generic_exit_level_offset_address,
+            world.data.generic_exit_enemy_address,
+            world.data.generic_exit_enemy_offset_address,
+            world.data.generic_exit_object_set,
+            False,
+            False,
+            True,
+        )
+    )
+
+    # add big ? level
+    found_level_records.append(
+        FoundLevelRecord(
+            world.data.big_q_block_level_address,
+            world.data.big_q_block_level_offset_address,
+            world.data.big_q_block_enemy_address,
+            world.data.big_q_block_enemy_offset_address,
+            world.data.big_q_block_object_set,
+            False,
+            False,
+            True,
+        )
+    )
+
+    # add coin ship level
+    found_level_records.append(
+        FoundLevelRecord(
+            world.data.coin_ship_level_address,
+            world.data.coin_ship_level_offset_address,
+            world.data.coin_ship_enemy_address,
+            world.data.coin_ship_enemy_offset_address,
+            world.data.coin_ship_level_object_set,
+            False,
+            False,
+            True,
+        )
+    )
+
+    # add special/white toad house level
+    found_level_records.append(
+        FoundLevelRecord(
+            world.data.toad_warp_level_address,
+            world.data.toad_warp_level_offset_address,
+            0x0,  # enemy item data is used directly, not as an offset
+            world.data.toad_warp_item_address,
+            MUSHROOM_OBJECT_SET,
+            False,
+            False,
+            True,
+        ),
+    )
+
+    return found_level_records
+
+
+@dataclass
+class _ParseWorker:
+    cpu: NesCPU
+    start_state: CPUSnapshot
+    known_parse_results: dict[LevelKey, LevelParseResult]
+
+
+def _set_up_parse_worker(rom_data: bytes, known_parse_results: dict[LevelKey, LevelParseResult]) -> _ParseWorker:
+    cpu = NesCPU(Rom(bytearray(rom_data)))
+
+    return _ParseWorker(cpu, cpu.snapshot(), known_parse_results)
+
+
+def _parse_jump_chain(worker: _ParseWorker, record: FoundLevelRecord) -> dict[LevelKey, LevelParseResult]:
+    """
+    Parses the level of the record and every level it jumps to, in a worker process of the pool. The chain might go
+    further than gen_levels_in_rom needs, but a level always parses the same, so that is only wasted work.
+    """
+    parse_results: dict[LevelKey, LevelParseResult] = {}
+    parsed_addresses: set[int] = set()
+
+    next_record: Optional[FoundLevelRecord] = record
+
+    while next_record is not None and next_record.level_address not in parsed_addresses:
+        parsed_addresses.add(next_record.level_address)
+
+        if _key_of(next_record) in worker.known_parse_results:
+            parse_result = worker.known_parse_results[_key_of(next_record)]
+        else:
+            parse_result = parse_results[_key_of(next_record)] = _parse_level(
+                worker.cpu, worker.start_state, next_record
+            )
+
+        if not parse_result.has_jump:
+            break
+
+        next_record = _jump_destination(worker.cpu.rom, next_record)
+
+    return parse_results
+
+
+def _levels_per_object_set(levels_by_address: dict[int, FoundLevel]) -> defaultdict:
+    levels_per_object_set = defaultdict(list)
+
+    for level_address in sorted(levels_by_address.keys()):
+        found_level = levels_by_address[level_address]
+        levels_per_object_set[found_level.object_set_number].append(level_address)
+
+    return levels_per_object_set
+
+
 def gen_levels_in_rom(
-    rom: Rom,
+    rom: Rom, parallel: bool = False, cache: Optional[FoundLevelCache] = None
 ) -> Generator[tuple[int, int], bool, tuple[defaultdict, dict[int, FoundLevel]]]:
+    """
+    Finds all levels in the ROM, by parsing the levels on the world maps and following their jumps.
+
+    Yields the current world number and the number of levels found in it so far and receives, whether to stop.
+
+    :param rom: The ROM to search.
+    :param parallel: Whether to parse the levels in a pool of processes. The levels are found and merged in the same
+        order either way, so the result is the same.
+    :param cache: If given, levels are only parsed, if the cache doesn't know them already, and the result is stored
+        in it afterwards.
+    """
     levels_by_address: dict[int, FoundLevel] = {}
+    parse_results: dict[LevelKey, LevelParseResult] = {}
 
-    start = time.time()
+    if cache is not None:
+        cached_found_levels = cache.found_levels(rom)
 
-    for world_num in range(WORLD_COUNT - 1):
-        levels_in_world = 0
-
-        world = WorldMap.from_world_number(rom, world_num + 1)
-
-        found_level_records: list[FoundLevelRecord] = [
-            (FoundLevelRecord.from_level_pointer(lp, True, False, False)) for lp in world.level_pointers
-        ]
-
-        # add airship
-        found_level_records.append(
-            FoundLevelRecord(
-                world.data.airship_level_address,
-                world.data.airship_level_offset_address,
-                world.data.airship_enemy_address,
-                world.data.airship_enemy_offset_address,
-                world.data.airship_level_object_set,
-                False,
-                False,
-                True,
-            )
-        )
+        if cached_found_levels is not None:
+            for found_level in map(FoundLevel.from_dict, cached_found_levels):
+                levels_by_address[found_level.level_offset] = found_level
 
-        # add generic exit
-        found_level_records.append(
-            FoundLevelRecord(
-                world.data.generic_exit_level_address,
-                world.data.generic_exit_level_offset_address,
-                world.data.generic_exit_enemy_address,
-                world.data.generic_exit_enemy_offset_address,
-                world.data.generic_exit_object_set,
-                False,
-                False,
-                True,
-            )
-        )
+            return _levels_per_object_set(levels_by_address), levels_by_address
 
-        # add big ? level
-        found_level_records.append(
-            FoundLevelRecord(
-                world.data.big_q_block_level_address,
-                world.data.big_q_block_level_offset_address,
-                world.data.big_q_block_enemy_address,
-                world.data.big_q_block_enemy_offset_address,
-                world.data.big_q_block_object_set,
-                False,
-                False,
-                True,
-            )
-        )
+        parse_results.update(cache.parse_results(rom))
 
-        # add coin ship level
-        found_level_records.append(
-            FoundLevelRecord(
-                world.data.coin_ship_level_address,
-                world.data.coin_ship_level_offset_address,
-                world.data.coin_ship_enemy_address,
-                world.data.coin_ship_enemy_offset_address,
-                world.data.coin_ship_level_object_set,
-                False,
-                False,
-                True,
-            )
-        )
+    start = time.time()
 
-        # add special/white toad house level
-        found_level_records.append(
-            FoundLevelRecord(
-                world.data.toad_warp_level_address,
-                world.data.toad_warp_level_offset_address,
-                0x0,  # enemy item data is used directly, not as an offset
-                world.data.toad_warp_item_address,
-                MUSHROOM_OBJECT_SET,
-                False,
-                False,
-                True,
-            ),
-        )
+    # set up the CPU once and return to this state for every level
+    cpu = NesCPU(rom)
+    start_state = cpu.snapshot()
 
-        should_stop = False
-        for record in found_level_records:
-            if should_stop:
-                return defaultdict(list), levels_by_address
+    records_per_world = [
+        _level_records_of_world(WorldMap.from_world_number(rom, world_num + 1)) for world_num in range(WORLD_COUNT - 1)
+    ]
 
-            if record.level_address in levels_by_address:
-                found_level = levels_by_address[record.level_address]
+    chains_per_world: list[list[Future]] = [[] for _ in records_per_world]
 
-                assert record.level_address_offset not in found_level.level_offset_positions
-                found_level.level_offset_positions.append(record.level_address_offset)
+    executor: Optional[ProcessPoolExecutor] = None
 
-                assert record.enemy_address_offset not in found_level.enemy_offset_positions
-                found_level.enemy_offset_positions.append(record.enemy_address_offset)
+    if parallel:
+        # spawned, not forked, since this runs inside the editor, see create_pool
+        executor = create_pool(_set_up_parse_worker, (rom.as_bytes(), parse_results))
 
-                found_level.found_in_world |= record.found_in_world
-                found_level.found_as_jump |= record.found_as_jump
-                found_level.is_generic |= record.is_generic
+        # like below, only the first record of a level address is parsed
+        submitted_addresses: set[int] = set()
 
-                continue
+        for records, chains in zip(records_per_world, chains_per_world):
+            for record in records:
+                if record.object_set == SPADE_BONUS_OBJECT_SET or record.level_address in submitted_addresses:
+                    continue
 
-            if record.object_set == SPADE_BONUS_OBJECT_SET:
-                continue
+                submitted_addresses.add(record.level_address)
+                chains.append(executor.submit(with_worker_state(_parse_jump_chain), record))
 
-            print(
-                f"W{world_num + 1}",
-                hex(record.level_address),
-                hex(record.enemy_address),
-                record.object_set,
-            )
-            # traverse Jump Destinations by following the offsets in the header
-            while True:
-                levels_in_world += 1
+    try:
+        for world_num, found_level_records in enumerate(records_per_world):
+            levels_in_world = 0
+
+            # keep reporting progress, while waiting for the levels of this world to be parsed in the pool
+            while chains_per_world[world_num]:
+                done_chains, pending_chains = wait(chains_per_world[world_num], timeout=0.1)
+
+                for chain in done_chains:
+                    parse_results.update(chain.result())
+
+                chains_per_world[world_num] = list(pending_chains)
 
-                should_stop = yield world.number, levels_in_world
+                if pending_chains and (yield world_num + 1, levels_in_world):
+                    return defaultdict(list), levels_by_address
 
+            should_stop = False
+            for record in found_level_records:
                 if should_stop:
-                    break
+                    return defaultdict(list), levels_by_address
 
-                parsed_level = NesCPU(rom).load_from_address(
-                    record.object_set, record.level_address, record.enemy_address
-                )
+                if record.level_address in levels_by_address:
+                    found_level = levels_by_address[record.level_address]
 
-                found_level = FoundLevel(
-                    [record.level_address_offset],
-                    [record.enemy_address_offset],
-                    world_num + 1,
-                    record.level_address,
-                    record.enemy_address,
-                    record.object_set,
-                    parsed_level.object_data_length,
-                    parsed_level.enemy_data_length,
-                    record.found_in_world,
-                    record.found_as_jump,
-                    record.is_generic,
-                )
+                    assert record.level_address_offset not in found_level.level_offset_positions
+                    found_level.level_offset_positions.append(record.level_address_offset)
+
+                    assert record.enemy_address_offset not in found_level.enemy_offset_positions
+                    found_level.enemy_offset_positions.append(record.enemy_address_offset)
 
-                levels_by_address[record.level_address] = found_level
+                    found_level.found_in_world |= record.found_in_world
+                    found_level.found_as_jump |= record.found_as_jump
+                    found_level.is_generic |= record.is_generic
 
-                if not parsed_level.has_jump():
-                    break
+                    continue
 
-                header_of_old_level = LevelHeader(
-                    rom,
-                    rom.read(record.level_address, HEADER_LENGTH),
+                if record.object_set == SPADE_BONUS_OBJECT_SET:
+                    continue
+
+                print(
+                    f"W{world_num + 1}",
+                    hex(record.level_address),
+                    hex(record.enemy_address),
                     record.object_set,
                 )
+                # traverse Jump Destinations by following the offsets in the header
+                while True:
+                    levels_in_world += 1
 
-                level_address_position = record.level_address
-                level_address = header_of_old_level.jump_level_address
+                    should_stop = yield world_num + 1, levels_in_world
 
-                enemy_address_position = record.level_address + OFFSET_SIZE
-                enemy_address = header_of_old_level.jump_enemy_address
+                    if should_stop:
+                        break
 
-                object_set_number = header_of_old_level.jump_object_set_number
+                    if _key_of(record) not in parse_results:
+                        parse_results[_key_of(record)] = _parse_level(cpu, start_state, record)
 
-                new_record = FoundLevelRecord(
-                    level_address,
-                    level_address_position,
-                    enemy_address,
-                    enemy_address_position,
-                    object_set_number,
-                )
+                    parse_result = parse_results[_key_of(record)]
+
+                    found_level = FoundLevel(
+                        [record.level_address_offset],
+                        [record.enemy_address_offset],
+                        world_num + 1,
+                        record.level_address,
+                        record.enemy_address,
+                        record.object_set,
+                        parse_result.object_data_length,
+                        parse_result.enemy_data_length,
+                        record.found_in_world,
+                        record.found_as_jump,
+                        record.is_generic,
+                    )
+
+                    levels_by_address[record.level_address] = found_level
 
-                if 0 in [header_of_old_level.jump_level_offset, object_set_number]:
-                    break
+                    if not parse_result.has_jump:
+                        break
 
-                if level_address in levels_by_address:
-                    found_level = levels_by_address[level_address]
-                    assert level_address_position not in found_level.level_offset_positions
-                    found_level.level_offset_positions.append(level_address_position)
-                    found_level.enemy_offset_positions.append(enemy_address_position)
-                    found_level.found_as_jump = True
-                    break
+                    new_record = _jump_destination(rom, record)
 
-                new_record.found_in_world = False
-                new_record.found_as_jump = True
+                    if new_record is None:
+                        break
 
-                record = new_record
+                    if new_record.level_address in levels_by_address:
+                        found_level = levels_by_address[new_record.level_address]
+                        assert new_record.level_address_offset not in found_level.level_offset_positions
+                        found_level.level_offset_positions.append(new_record.level_address_offset)
+                        found_level.enemy_offset_positions.append(new_record.enemy_address_offset)
+                        found_level.found_as_jump = True
+                        break
 
-                print("    ", hex(level_address), object_set_number)
+                    record = new_record
+
+                    print("    ", hex(record.level_address), record.object_set)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     print(time.time() - start)
 
-    level_count = 0
+    if cache is not None:
+        cache.store(rom, [levels_by_address[key].to_dict() for key in sorted(levels_by_address.keys())], parse_results)
 
-    levels_per_object_set = defaultdict(list)
+    level_count = 0
 
-    for level_address in sorted(levels_by_address.keys()):
-        found_level = levels_by_address[level_address]
-        levels_per_object_set[found_level.object_set_number].append(level_address)
+    levels_per_object_set = _levels_per_object_set(levels_by_address)
 
     for object_set, levels_addresses in sorted(levels_per_object_set.items()):
         level_count += len(levels_addresses)
@@ -304,6 +454,10 @@ def gen_levels_in_rom(
 
     level_data = pathlib.Path("data/levels.dat")
 
+    if not level_data.exists():
+        # not started from the editor's directory, for example by the command line export
+        return levels_per_object_set, levels_by_address
+
     missing = 0
     levels: dict[int, set[int]] = defaultdict(set)
 
@@ -311,9 +465,9 @@ def gen_levels_in_rom(
         if not line:
             continue
 
-        world_no, *_, level_address, _, object_set_no, _ = line.split(",")
+        world_no, *_, level_address_text, _, object_set_no, _ = line.split(",")
 
-        level_address = int(level_address, 16) - 9
+        level_address = int(level_address_text, 16) - 9
         object_set_num = int(object_set_no, 16)
 
         if int(world_no) in [0, 9]:
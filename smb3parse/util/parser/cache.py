@@ -0,0 +1,166 @@
+import json
+from hashlib import sha1
+from pathlib import Path
+from typing import Optional
+
+from smb3parse.constants import BASE_OFFSET
+from smb3parse.types import NormalizedAddress
+from smb3parse.util.parser.level import LevelKey, LevelParseResult
+from smb3parse.util import write_atomically
+from smb3parse.util.rom import PRG_BANK_SIZE, Rom
+
+PARSE_RESULTS_FILE_NAME = "parse_results.json"
+
+MAX_FOUND_LEVEL_FILES = 16
+"""How many ROMs the found levels are kept of. Every change to a ROM gives it a new hash, so old files are dropped."""
+MAX_PARSE_RESULTS = 4096
+"""How many parse results are kept. Those of the most recently stored ROMs are kept, the oldest are dropped first."""
+
+
+def prg_banks_of(rom: Rom, offset: int, length: int) -> list[int]:
+    """Returns the PRG banks, that reading the given range of the ROM touches, as the parser would index them."""
+    first_bank = max(0, (offset - BASE_OFFSET) // PRG_BANK_SIZE)
+    last_bank = min(rom.prg_banks - 1, (offset + length - 1 - BASE_OFFSET) // PRG_BANK_SIZE)
+
+    return list(range(first_bank, last_bank + 1))
+
+
+def _key_to_str(key: LevelKey) -> str:
+    return ",".join(map(str, key))
+
+
+def _str_to_key(key_str: str) -> LevelKey:
+    object_set, level_address, enemy_address = map(int, key_str.split(","))
+
+    return object_set, level_address, enemy_address
+
+
+class FoundLevelCache:
+    """
+    Remembers the results of gen_levels_in_rom on disk, so that ROMs don't have to be emulated level by level again.
+
+    The found levels of a ROM are stored under a hash of all its PRG banks, so an unchanged ROM doesn't need any
+    parsing. The parse results of single levels are stored together with the hashes of the PRG banks they depended on,
+    so that after a change to the ROM, only levels in the changed banks need to be parsed again.
+
+    The files are replaced atomically, so a crash, or another editor storing at the same time, never leaves a broken
+    file behind. Only the found levels of the most recently used ROMs and the newest parse results are kept.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def bank_hashes(rom: Rom) -> list[str]:
+        # read the banks the same way the parser loads them into memory
+        return [
+            sha1(rom.view(BASE_OFFSET + prg_index * PRG_BANK_SIZE, PRG_BANK_SIZE)).hexdigest()
+            for prg_index in range(rom.prg_banks)
+        ]
+
+    @staticmethod
+    def rom_hash(rom: Rom) -> str:
+        prg_size = rom.prg_banks * PRG_BANK_SIZE
+
+        return sha1(rom.view(NormalizedAddress(BASE_OFFSET), prg_size)).hexdigest()
+
+    def _found_levels_path(self, rom: Rom) -> Path:
+        return self.cache_dir / f"{self.rom_hash(rom)}.json"
+
+    def found_levels(self, rom: Rom) -> Optional[list[dict]]:
+        """Returns the found levels of the ROM as dicts, if it was completely parsed before and didn't change since."""
+        path = self._found_levels_path(rom)
+
+        if not path.exists():
+            return None
+
+        try:
+            found_levels = json.loads(path.read_text())
+        except ValueError:
+            return None
+
+        try:
+            # mark it as recently used, so it is pruned last
+            path.touch()
+        except OSError:
+            pass
+
+        return found_levels
+
+    def parse_results(self, rom: Rom) -> dict[LevelKey, LevelParseResult]:
+        """Returns all cached parse results, whose PRG banks are still the same in the given ROM."""
+        path = self.cache_dir / PARSE_RESULTS_FILE_NAME
+
+        if not path.exists():
+            return {}
+
+        try:
+            cached_results = json.loads(path.read_text())
+        except ValueError:
+            return {}
+
+        bank_hashes = self.bank_hashes(rom)
+
+        parse_results: dict[LevelKey, LevelParseResult] = {}
+
+        for key_str, cached_result in cached_results.items():
+            cached_bank_hashes: dict[str, str] = cached_result.pop("bank_hashes")
+
+            if all(
+                int(prg_index) < len(bank_hashes) and bank_hashes[int(prg_index)] == bank_hash
+                for prg_index, bank_hash in cached_bank_hashes.items()
+            ):
+                parse_results[_str_to_key(key_str)] = LevelParseResult.from_dict(cached_result)
+
+        return parse_results
+
+    def store(self, rom: Rom, found_levels: list[dict], parse_results: dict[LevelKey, LevelParseResult]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        found_levels_path = self._found_levels_path(rom)
+
+        write_atomically(found_levels_path, json.dumps(found_levels).encode())
+
+        self._prune_found_levels(found_levels_path)
+
+        path = self.cache_dir / PARSE_RESULTS_FILE_NAME
+
+        try:
+            cached_results = json.loads(path.read_text()) if path.exists() else {}
+        except ValueError:
+            cached_results = {}
+
+        bank_hashes = self.bank_hashes(rom)
+
+        for key, parse_result in parse_results.items():
+            cached_result: dict = parse_result.to_dict()
+            cached_result["bank_hashes"] = {
+                str(prg_index): bank_hashes[prg_index] for prg_index in parse_result.prg_banks
+            }
+
+            # move it to the end, so the results of older ROMs are dropped first
+            cached_results.pop(_key_to_str(key), None)
+            cached_results[_key_to_str(key)] = cached_result
+
+        # dicts keep their order through json, so the oldest results are at the front
+        kept_results = dict(list(cached_results.items())[-MAX_PARSE_RESULTS:])
+
+        write_atomically(path, json.dumps(kept_results).encode())
+
+    def _prune_found_levels(self, newest_path: Path):
+        found_level_paths = []
+
+        for path in self.cache_dir.glob("*.json"):
+            if path.name in (PARSE_RESULTS_FILE_NAME, newest_path.name):
+                continue
+
+            try:
+                found_level_paths.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                # another editor might have pruned it already
+                continue
+
+        found_level_paths.sort(reverse=True)
+
+        for _, path in found_level_paths[MAX_FOUND_LEVEL_FILES - 1 :]:
+            path.unlink(missing_ok=True)
@@ -29,7 +29,14 @@ MEM_Graphics_Set = 0x7EBD
 MEM_Screen_Start_AddressL = 0x8000
 MEM_Screen_Start_AddressH = 0x8001
 
+MMC3_COMMAND = 0x8000
+MMC3_PAGE = 0x8001
+
+MMC3_8K_TO_PRG_C000 = 0x46
+MMC3_8K_TO_PRG_A000 = 0x47
+
 ROM_Level_Load_Entry = 0x891A  # From World Map Position
+ROM_NextObjectParsing = 0x98EE
 ROM_EndObjectParsing = 0x9934
 ROM_LevelLoad_By_TileSet = 0x9A1D  # Directly By Address
 
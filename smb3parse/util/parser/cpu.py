@@ -1,5 +1,9 @@
 """First draft of a parser, emulating the 6502 processor of the NES and letting the ROM generate the level."""
 
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
 from py65.devices import mpu6502
 from py65.disassembler import Disassembler
 
@@ -27,13 +31,19 @@ from smb3parse.util.parser.constants import (
     MEM_Screen_Memory_End,
     MEM_Screen_Memory_Start,
     MEM_World_Num,
+    MMC3_8K_TO_PRG_A000,
+    MMC3_8K_TO_PRG_C000,
+    MMC3_COMMAND,
+    MMC3_PAGE,
     ROM_EndObjectParsing,
     ROM_LevelLoad_By_TileSet,
     ROM_Level_Load_Entry,
+    ROM_NextObjectParsing,
 )
 from smb3parse.util.parser.level import ParsedLevel
-from smb3parse.util.parser.memory import NESMemory
+from smb3parse.util.parser.memory import MEMORY_SIZE, NESMemory
 from smb3parse.util.parser.object import ParsedEnemy, ParsedObject
+from smb3parse.util.parser.trace import TraceRecorder
 from smb3parse.util.rom import Rom
 
 PINK = "\033[95m"
@@ -43,12 +53,33 @@ YELLOW = "\033[93m"
 RED = "\033[91m"
 CLEAR = "\033[0m"
 
+PCHook = Callable[[], None]
+BankSwitchHook = Callable[[int, int], None]
+"""Gets the address of the switched page, 0xA000 or 0xC000, and the index of the PRG bank, that is now there."""
+
+
+@dataclass(frozen=True)
+class CPUSnapshot:
+    """The memory and registers of a NesCPU at one point in time. See NesCPU.snapshot and NesCPU.restore."""
+
+    memory: bytes
+    loaded_prg_banks: frozenset[int]
+    mapper_command: int
+
+    pc: int
+    a: int
+    x: int
+    y: int
+    sp: int
+    p: int
+
 
 class NesCPU(mpu6502.MPU):
     def __init__(self, rom: Rom, should_log=False):
-        super(NesCPU, self).__init__()
+        # giving the memory to the MPU directly, saves it from building a list of 64 KiB first
+        super(NesCPU, self).__init__(memory=NESMemory(rom))
 
-        self.memory = NESMemory([0x0] * 0x10000, rom)
+        self.memory: NESMemory
         self.memory[MEM_Random_Pool_Start] = 0x88  # as in the ROM
         self.memory[MEM_Reset_Latch] = 0x5A  # prevents crash in LoadLevel_LittleCloudSolidRun
 
@@ -63,13 +94,72 @@ class NesCPU(mpu6502.MPU):
         self.did_start_object_parsing = False
         self.objects: list[ParsedObject] = []
 
-        # instructions
-        self.old_inst_0xa9 = NesCPU.inst_0xa9
+        self._pc_hooks: defaultdict[int, list[PCHook]] = defaultdict(list)
+        self._bank_switch_hooks: list[BankSwitchHook] = []
+
+        self._mapper_command = 0
+        self.memory.add_write_observer(range(MMC3_COMMAND, MMC3_PAGE + 1), self._on_mapper_write)
+
+        self.add_pc_hook(ROM_NextObjectParsing, self._on_next_object)
+
+        self._trace_recorder: Optional[TraceRecorder] = None
+        self._trace_step = 0
+
+    def add_pc_hook(self, pc: int, callback: PCHook):
+        """Calls the callback, whenever the instruction at the given address is about to be executed."""
+        self._pc_hooks[pc].append(callback)
+
+    def add_bank_switch_hook(self, callback: BankSwitchHook):
+        """Calls the callback, whenever the ROM switches the PRG bank at 0xA000 or 0xC000 through the mapper."""
+        self._bank_switch_hooks.append(callback)
+
+    def record_trace(self, recorder: TraceRecorder):
+        """Records all following instructions and memory writes into the recorder. See trace.py for reading it."""
+        self._trace_recorder = recorder
+
+        self.memory.add_write_observer(range(MEMORY_SIZE), self._record_write)
+
+    def _record_write(self, address: int, value: int):
+        assert self._trace_recorder is not None
+
+        self._trace_recorder.record_write(self._trace_step, address, value)
+
+    def snapshot(self) -> CPUSnapshot:
+        return CPUSnapshot(
+            self.memory.snapshot(),
+            frozenset(self.memory.loaded_prg_banks),
+            self._mapper_command,
+            self.pc,
+            self.a,
+            self.x,
+            self.y,
+            self.sp,
+            self.p,
+        )
+
+    def restore(self, snapshot: CPUSnapshot):
+        """
+        Puts the CPU back into the state of the snapshot and forgets everything parsed since. Taking a snapshot right
+        after creating a NesCPU lets it parse one level after the other, without setting up the CPU every time.
+        """
+        self.memory.restore(snapshot.memory, snapshot.loaded_prg_banks)
+        self._mapper_command = snapshot.mapper_command
+
+        self.pc = snapshot.pc
+        self.a = snapshot.a
+        self.x = snapshot.x
+        self.y = snapshot.y
+        self.sp = snapshot.sp
+        self.p = snapshot.p
+
+        self.processorCycles = 0
+        self.step_count = 0
+        self.a000_bank = 0
+        self.c000_bank = 0
 
-        # self.instruct is a class attribute, so changes to it are kept between instantiations, therefore only replace
-        # the load instruction once
-        if self.instruct[0xA9] != NesCPU.new_inst_0xa9:
-            self.instruct[0xA9] = NesCPU.new_inst_0xa9
+        self.did_start_object_parsing = False
+        # a new list, since the last ParsedLevel still references the old one
+        self.objects = []
 
     def load_from_world_map(self, world: int, pos: Position) -> ParsedLevel:
         self.start_pc = ROM_Level_Load_Entry
@@ -86,7 +176,7 @@ class NesCPU(mpu6502.MPU):
     def load_from_address(self, object_set_num: int, level_address: int, enemy_address: int) -> ParsedLevel:
         self.start_pc = ROM_LevelLoad_By_TileSet
 
-        object_set_offset = self.rom.int(PAGE_A000_ByTileset + object_set_num) * 0x2000 - 0xA000
+        object_set_offset = self.rom.u8(PAGE_A000_ByTileset + object_set_num) * 0x2000 - 0xA000
         level_offset = level_address - object_set_offset - BASE_OFFSET
 
         self.memory[MEM_Level_TileSet] = object_set_num
@@ -95,8 +185,8 @@ class NesCPU(mpu6502.MPU):
         self.memory[MEM_EnemiesStartA] = enemy_address & 0xFF
         self.memory[MEM_EnemiesStartB] = enemy_address >> 8
 
-        self.memory[MEM_PAGE_A000] = self.a000_bank = self.rom.int(PAGE_A000_ByTileset + object_set_num)
-        self.memory[MEM_PAGE_C000] = self.c000_bank = self.rom.int(PAGE_C000_ByTileset + object_set_num)
+        self.memory[MEM_PAGE_A000] = self.a000_bank = self.rom.u8(PAGE_A000_ByTileset + object_set_num)
+        self.memory[MEM_PAGE_C000] = self.c000_bank = self.rom.u8(PAGE_C000_ByTileset + object_set_num)
 
         self.memory.load_a000_page(self.a000_bank)
         self.memory.load_c000_page(self.c000_bank)
@@ -106,8 +196,8 @@ class NesCPU(mpu6502.MPU):
         enemy_address += 1
 
         if enemy_address >= 0x0:
-            while self.rom.int(enemy_address) != 0xFF:
-                enemy_bytes = list(map(int, self.rom.read(enemy_address, 3)))
+            while self.rom.u8(enemy_address) != 0xFF:
+                enemy_bytes = list(self.rom.view(enemy_address, 3))
                 level.parsed_enemies.append(ParsedEnemy(ENEMY_ITEM_OBJECT_SET, enemy_bytes, enemy_address))
 
                 enemy_address += 3
@@ -145,30 +235,40 @@ class NesCPU(mpu6502.MPU):
         self.objects[-1].tiles_in_level.append((address, value))
 
     def run_until(self, address: int, max_steps: int = -1):
-        while self.pc != address and self.step_count != max_steps:
-            self.step()
+        steps = 0
 
-    def step(self):
-        if self.pc == 0x98EE:
-            self._maybe_finish_parsing_last_object()
-            parsed_object = self._start_parsing_next_object()
+        if self.should_log or self._trace_recorder is not None:
+            while self.pc != address and steps != max_steps:
+                self.step()
+                steps += 1
+
+            return
+
+        # between hooked addresses, only plain steps of the MPU are executed
+        pc_hooks = self._pc_hooks
+        mpu_step = super(NesCPU, self).step
 
-            if self.should_log:
-                object_bytes_text = list(map(hex, parsed_object.obj_bytes))
+        while self.pc != address and steps != max_steps:
+            if self.pc in pc_hooks:
+                self._call_pc_hooks()
 
-                optional_byte = hex(self.memory[parsed_object.pos_in_mem + 3])
+            mpu_step()
+            steps += 1
 
-                print(f"--> Parsing Object from {parsed_object.pos_in_mem:#x}, {object_bytes_text} ({optional_byte})")
+    def _call_pc_hooks(self):
+        for callback in self._pc_hooks[self.pc]:
+            callback()
 
-        elif self.pc == ROM_EndObjectParsing:
-            self._maybe_finish_parsing_last_object()
-            breakpoint()
-        elif self.pc == 0xD22B:
-            # breakpoint()
-            pass
-        elif self.pc == 0xFF4E:
-            # breakpoint()
-            pass
+    def step(self):
+        if self.pc in self._pc_hooks:
+            self._call_pc_hooks()
+
+        if self._trace_recorder is not None:
+            # writes of the instruction are recorded with the same step
+            self._trace_step += 1
+            self._trace_recorder.record_instruction(
+                self._trace_step, self.pc, self.a, self.x, self.y, self.a000_bank, self.c000_bank
+            )
 
         if not self.should_log:
             super(NesCPU, self).step()
@@ -196,6 +296,35 @@ class NesCPU(mpu6502.MPU):
 
         print(f"           A={self.a:X}, X={self.x:X}, Y={self.y:X}, A000={self.a000_bank}, C000={self.c000_bank}")
 
+    def _on_next_object(self):
+        self._maybe_finish_parsing_last_object()
+        parsed_object = self._start_parsing_next_object()
+
+        if self.should_log:
+            object_bytes_text = list(map(hex, parsed_object.obj_bytes))
+
+            optional_byte = hex(self.memory[parsed_object.pos_in_mem + 3])
+
+            print(f"--> Parsing Object from {parsed_object.pos_in_mem:#x}, {object_bytes_text} ({optional_byte})")
+
+    def _on_mapper_write(self, address: int, value: int):
+        if address == MMC3_COMMAND:
+            self._mapper_command = value
+
+        elif self._mapper_command == MMC3_8K_TO_PRG_C000:
+            self.c000_bank = value
+            self.memory.load_c000_page(value)
+
+            for callback in self._bank_switch_hooks:
+                callback(0xC000, value)
+
+        elif self._mapper_command == MMC3_8K_TO_PRG_A000:
+            self.a000_bank = value
+            self.memory.load_a000_page(value)
+
+            for callback in self._bank_switch_hooks:
+                callback(0xA000, value)
+
     def _start_parsing_next_object(self):
         level_pointer = (self.memory[0x62] << 8) + self.memory[0x61]
         object_bytes = self.memory[level_pointer : level_pointer + 3]
@@ -243,16 +372,3 @@ class NesCPU(mpu6502.MPU):
         op = op.replace(",X", f",{self.x}").replace(",Y", f",{self.y}")
 
         return op
-
-    def new_inst_0xa9(self):
-        ram_address = self.ByteAt(self.ProgramCounter())
-
-        if ram_address == 0x46:
-            self.c000_bank = self.memory[MEM_PAGE_C000]
-            self.memory.load_c000_page(self.c000_bank)
-
-        elif ram_address == 0x47:
-            self.a000_bank = self.memory[MEM_PAGE_A000]
-            self.memory.load_a000_page(self.a000_bank)
-
-        self.old_inst_0xa9(self)
@@ -5,7 +5,7 @@ from PySide6.QtWidgets import QWidget
 from foundry.game.File import ROM
 from foundry.game.gfx.GraphicsSet import GraphicsSet
 from foundry.game.gfx.Palette import load_palette_group
-from foundry.game.gfx.drawable.Block import Block, get_block, get_tile
+from foundry.game.gfx.drawable.Block import Block, get_block
 from smb3parse.levels import LEVEL_SCREEN_WIDTH
 from smb3parse.util.parser.level import ParsedLevel
 
@@ -36,7 +36,6 @@ class Canvas(QWidget):
     def anim_timer(self):
         self.gfx_set.anim_frame += 1
         self.gfx_set.anim_frame %= 4
-        get_tile.cache_clear()
 
         self.repaint()
 
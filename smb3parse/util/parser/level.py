@@ -77,3 +77,31 @@ class ParsedLevel:
         return any(
             parsed_object.domain == domain and parsed_object.obj_id in id_range for parsed_object in self.parsed_objects
         )
+
+
+LevelKey = tuple[int, int, int]
+"""Object set, level address and enemy address. The same key always parses to the same level."""
+
+
+@dataclass
+class LevelParseResult:
+    """The parts of a ParsedLevel, that gen_levels_in_rom needs. Small enough to pass between processes and to cache."""
+
+    object_data_length: int
+    enemy_data_length: int
+    has_jump: bool
+
+    prg_banks: list[int] = field(default_factory=list)
+    """The PRG banks the result depends on. If none of them changed, the level parses the same."""
+
+    def to_dict(self) -> dict[str, list[int] | int | bool]:
+        return dict(vars(self))
+
+    @staticmethod
+    def from_dict(data: dict) -> "LevelParseResult":
+        return LevelParseResult(
+            data["object_data_length"],
+            data["enemy_data_length"],
+            data["has_jump"],
+            data["prg_banks"],
+        )
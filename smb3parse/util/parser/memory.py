@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
 from smb3parse.constants import BASE_OFFSET
 from smb3parse.util.parser.constants import (
@@ -7,15 +7,55 @@ from smb3parse.util.parser.constants import (
 )
 from smb3parse.util.rom import PRG_BANK_SIZE, Rom
 
+MEMORY_SIZE = 0x10000
+PAGE_SIZE = 0x100
+PAGE_COUNT = MEMORY_SIZE // PAGE_SIZE
 
-class NESMemory(list):
-    def __init__(self, backing_list: list, rom: Rom):
-        super(NESMemory, self).__init__(backing_list)
+ALWAYS_SET_ADDRESS = 0x10
+"""Reading this address always returns the value with the highest bit set, so that the level loading doesn't wait."""
 
+IGNORED_WRITE_ADDRESSES = frozenset([ALWAYS_SET_ADDRESS, MEM_Screen_Start_AddressL, MEM_Screen_Start_AddressH])
+"""
+Writes to these addresses are dropped. The screen start addresses seem to access the Mapper, but actually overwrite a
+pointer to the screen memory.
+"""
+
+Observer = Callable[[int, int], None]
+
+
+def _pages_of(address_range: range) -> range:
+    return range(address_range.start // PAGE_SIZE, (address_range.stop - 1) // PAGE_SIZE + 1)
+
+
+class NESMemory:
+    """
+    The 64 KiB address space of the NES, backed by a bytearray.
+
+    Observers and ignored addresses are looked up through a table of all 256 pages of memory. Reading from or writing
+    to a page without any of them is a single lookup in that table and an access of the bytearray. The zero page only
+    adds a comparison with its one ignored address. Only accesses to pages with observers go through the slower checks.
+    """
+
+    def __init__(self, rom: Rom):
         self.rom = rom
 
-        self._read_observers: dict[range, Callable] = {}
-        self._write_observers: dict[range, Callable] = {}
+        self._data = bytearray(MEMORY_SIZE)
+        self._data[ALWAYS_SET_ADDRESS] = 0b1000_0000
+
+        self._read_observers: dict[range, Observer] = {}
+        self._write_observers: dict[range, Observer] = {}
+
+        self._read_pages: list[Optional[Callable[[int], int]]] = [None] * PAGE_COUNT
+        self._write_pages: list[Optional[Callable[[int, int], None]]] = [None] * PAGE_COUNT
+
+        self.loaded_prg_banks: set[int] = set()
+        """All PRG banks, that were loaded into memory at some point."""
+
+        for address in IGNORED_WRITE_ADDRESSES:
+            self._write_pages[address // PAGE_SIZE] = self._checked_write
+
+        # the zero page is written to the most, so it only checks its one ignored address, until it is observed
+        self._write_pages[ALWAYS_SET_ADDRESS // PAGE_SIZE] = self._zero_page_write
 
         last_prg_index = rom.prg_banks - 1
 
@@ -32,36 +72,75 @@ class NESMemory(list):
         self._load_bank(prg_index, 0xC000)
 
     def _load_bank(self, prg_index: int, offset: int):
+        self.loaded_prg_banks.add(prg_index)
+
         prg_bank_position = BASE_OFFSET + prg_index * PRG_BANK_SIZE
 
-        self[offset : offset + PRG_BANK_SIZE] = self.rom.read(prg_bank_position, PRG_BANK_SIZE)
+        self._data[offset : offset + PRG_BANK_SIZE] = self.rom.view(prg_bank_position, PRG_BANK_SIZE)
 
-    def add_read_observer(self, address_range: range, callback: Callable):
+    def snapshot(self) -> bytes:
+        return bytes(self._data)
+
+    def restore(self, data: bytes, loaded_prg_banks: Iterable[int]):
+        """Overwrites the whole memory with the given data. Observers are kept and not notified."""
+        self._data[:] = data
+
+        self.loaded_prg_banks = set(loaded_prg_banks)
+
+    def add_read_observer(self, address_range: range, callback: Observer):
         self._read_observers[address_range] = callback
 
-    def add_write_observer(self, address_range: range, callback: Callable):
+        for page in _pages_of(address_range):
+            self._read_pages[page] = self._observed_read
+
+    def add_write_observer(self, address_range: range, callback: Observer):
         self._write_observers[address_range] = callback
 
+        for page in _pages_of(address_range):
+            self._write_pages[page] = self._checked_write
+
+    def __len__(self):
+        return MEMORY_SIZE
+
     def __getitem__(self, address):
-        if address == 0x10:
-            return_value = 0b1000_0000
+        try:
+            read = self._read_pages[address >> 8]
+        except TypeError:
+            # slices are only read by the parser itself, not the CPU, so they aren't observed
+            return list(self._data[address])
+
+        if read is None:
+            return self._data[address]
+
+        return read(address)
+
+    def __setitem__(self, address: int, value: int):
+        write = self._write_pages[address >> 8]
+
+        if write is None:
+            self._data[address] = value
         else:
-            return_value = super(NESMemory, self).__getitem__(address)
+            write(address, value)
+
+    def _observed_read(self, address: int) -> int:
+        value = self._data[address]
 
         for address_range, callback in self._read_observers.items():
             if address in address_range:
-                callback(address, return_value)
+                callback(address, value)
+
+        return value
 
-        return return_value
+    def _zero_page_write(self, address: int, value: int):
+        if address != ALWAYS_SET_ADDRESS:
+            self._data[address] = value
 
-    def __setitem__(self, address, value):
+    def _checked_write(self, address: int, value: int):
         for address_range, callback in self._write_observers.items():
             if address in address_range:
                 callback(address, value)
 
-        if address in [MEM_Screen_Start_AddressL, MEM_Screen_Start_AddressH]:
-            # ignore these addresses, since they seem to access the Mapper, but actually overwrite a pointer to the
-            # screen memory
+        if address in IGNORED_WRITE_ADDRESSES:
             return
 
-        return super(NESMemory, self).__setitem__(address, value)
+        self._data[address] = value
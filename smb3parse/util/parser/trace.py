@@ -0,0 +1,210 @@
+"""
+Compact execution traces of the NesCPU.
+
+Every executed instruction and every memory write is recorded as a record of fixed size into a preallocated ring
+buffer, which can live in memory or in a memory mapped file. Once the buffer is full, the oldest records are
+overwritten.
+
+Traces can be read back and filtered with the TraceReader, or from the command line:
+
+    python -m smb3parse.util.parser.trace trace.bin --pc 9800-9934 --address 6000-7950
+"""
+
+import argparse
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+MAGIC = b"SMB3TRC1"
+
+_HEADER = struct.Struct("<8sIQ")
+"""Magic bytes, capacity in records and the number of records written in total."""
+
+_RECORD = struct.Struct("<BIHBBBBB")
+"""Kind, step, PC or written address, A or written value, X, Y, bank at 0xA000 and bank at 0xC000."""
+
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+KIND_INSTRUCTION = 0
+KIND_WRITE = 1
+
+DEFAULT_CAPACITY = 1 << 20
+
+
+@dataclass
+class TraceRecord:
+    kind: int
+    step: int
+
+    address: int
+    """The PC of an instruction, or the written address of a write."""
+
+    value: int
+    """The A register of an instruction, or the written value of a write."""
+
+    x: int = 0
+    y: int = 0
+    a000_bank: int = 0
+    c000_bank: int = 0
+
+    def __str__(self):
+        if self.kind == KIND_WRITE:
+            return f"{self.step:8}        [{self.address:04X}] <- {self.value:02X}"
+
+        return (
+            f"{self.step:8} {self.address:04X}: A={self.value:02X}, X={self.x:02X}, Y={self.y:02X}, "
+            f"A000={self.a000_bank}, C000={self.c000_bank}"
+        )
+
+
+class TraceRecorder:
+    """
+    Records instructions and memory writes into a ring buffer of fixed size. If a path is given, the buffer is a memory
+    mapped file of that name, otherwise a bytearray.
+
+    See NesCPU.record_trace.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, path: Optional[Path] = None):
+        self.capacity = capacity
+        self.count = 0
+
+        size = HEADER_SIZE + capacity * RECORD_SIZE
+
+        self._file = None
+        self.buffer: bytearray | mmap.mmap
+
+        if path is None:
+            self.buffer = bytearray(size)
+        else:
+            self._file = Path(path).open("w+b")
+            self._file.truncate(size)
+
+            self.buffer = mmap.mmap(self._file.fileno(), size)
+
+        self._write_header()
+
+    def _write_header(self):
+        _HEADER.pack_into(self.buffer, 0, MAGIC, self.capacity, self.count)
+
+    def _offset_of_next_record(self) -> int:
+        offset = HEADER_SIZE + (self.count % self.capacity) * RECORD_SIZE
+
+        self.count += 1
+
+        return offset
+
+    def record_instruction(self, step: int, pc: int, a: int, x: int, y: int, a000_bank: int, c000_bank: int):
+        _RECORD.pack_into(
+            self.buffer, self._offset_of_next_record(), KIND_INSTRUCTION, step, pc, a, x, y, a000_bank, c000_bank
+        )
+
+    def record_write(self, step: int, address: int, value: int):
+        _RECORD.pack_into(self.buffer, self._offset_of_next_record(), KIND_WRITE, step, address, value, 0, 0, 0, 0)
+
+    def flush(self):
+        """Updates the header, so that a TraceReader knows how many records were written."""
+        self._write_header()
+
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.flush()
+
+    def close(self):
+        self.flush()
+
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+        if self._file is not None:
+            self._file.close()
+
+
+class TraceReader:
+    """Reads the records of a trace in the order they were recorded, starting from the oldest one still available."""
+
+    def __init__(self, data: bytes | bytearray | mmap.mmap):
+        magic, self.capacity, self.count = _HEADER.unpack_from(data, 0)
+
+        if magic != MAGIC:
+            raise ValueError("Not a trace of the level parser.")
+
+        self._data = data
+
+    @staticmethod
+    def from_file(path: Path) -> "TraceReader":
+        return TraceReader(Path(path).read_bytes())
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        first_record = max(0, self.count - self.capacity)
+
+        for record_number in range(first_record, self.count):
+            offset = HEADER_SIZE + (record_number % self.capacity) * RECORD_SIZE
+
+            yield TraceRecord(*_RECORD.unpack_from(self._data, offset))
+
+    def filter(self, pc_range: Optional[range] = None, written_addresses: Optional[range] = None) -> list[TraceRecord]:
+        """
+        Returns the instructions, whose PC is inside the given range, and the instructions, that wrote to one of the
+        given addresses. Every instruction is followed by its writes. If both are given, instructions have to match
+        both.
+        """
+        filtered_records: list[TraceRecord] = []
+
+        instruction: Optional[TraceRecord] = None
+        writes: list[TraceRecord] = []
+
+        def add_instruction():
+            if instruction is None:
+                # its instruction was already overwritten in the ring buffer
+                return
+
+            if pc_range is not None and instruction.address not in pc_range:
+                return
+
+            if written_addresses is None:
+                filtered_records.append(instruction)
+                filtered_records.extend(writes)
+
+            elif matching_writes := [write for write in writes if write.address in written_addresses]:
+                filtered_records.append(instruction)
+                filtered_records.extend(matching_writes)
+
+        for record in self:
+            if record.kind == KIND_WRITE:
+                writes.append(record)
+                continue
+
+            add_instruction()
+
+            instruction = record
+            writes = []
+
+        add_instruction()
+
+        return filtered_records
+
+
+def _parse_range(text: str) -> range:
+    """Parses a hex address, or a range of them, like 9800-9934, with the end being inclusive."""
+    start, _, end = text.partition("-")
+
+    return range(int(start, 16), int(end or start, 16) + 1)
+
+
+def main(args: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Dumps an execution trace of the level parser.")
+    parser.add_argument("trace", type=Path, help="A trace file written by a TraceRecorder.")
+    parser.add_argument("--pc", type=_parse_range, help="Only instructions in this range of PCs, like 9800-9934.")
+    parser.add_argument("--address", type=_parse_range, help="Only instructions writing into this range of addresses.")
+
+    parsed_args = parser.parse_args(args)
+
+    for record in TraceReader.from_file(parsed_args.trace).filter(parsed_args.pc, parsed_args.address):
+        print(record)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Runs tasks in a pool of processes, which all need the same state, that is expensive to set up, like an emulated CPU.
+Every worker process sets that state up once, when it starts, instead of receiving it with every task.
+
+The setup function and the tasks have to be defined on module level, so they can be sent to the worker processes.
+
+Worker processes are spawned as fresh interpreters by default, instead of being forked. The pools are also created
+inside the editor, where forking a process with running Qt threads can leave the workers deadlocked on a lock, that
+one of those threads held.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+State = TypeVar("State")
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+_worker_state: Any = None
+"""The state of the current worker process, as returned by the setup function of its pool."""
+
+
+def _init_worker(setup: Callable[..., Any], setup_args: tuple):
+    global _worker_state
+
+    _worker_state = setup(*setup_args)
+
+
+def _run_task(task: Callable[[Any, Item], Result], item: Item) -> Result:
+    return task(_worker_state, item)
+
+
+def create_pool(
+    setup: Callable[..., Any],
+    setup_args: tuple,
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> ProcessPoolExecutor:
+    """
+    Creates a pool, whose processes call setup with the setup_args once, when they start. Tasks, that are submitted
+    through with_worker_state, get the returned state passed in.
+    """
+    if mp_context is None:
+        mp_context = multiprocessing.get_context("spawn")
+
+    return ProcessPoolExecutor(workers, mp_context=mp_context, initializer=_init_worker, initargs=(setup, setup_args))
+
+
+def with_worker_state(task: Callable[[State, Item], Result]) -> Callable[[Item], Result]:
+    """Wraps the task, so that it gets the state of the worker process it runs in, as its first argument."""
+    return partial(_run_task, task)
+
+
+def map_in_pool(
+    task: Callable[[State, Item], Result],
+    setup: Callable[..., State],
+    setup_args: tuple,
+    items: Iterable[Item],
+    workers: int,
+    chunksize: int = 1,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Result]:
+    """
+    Yields the results of the task for every item, in the order of the items. With only one worker, the state is set
+    up and the tasks are run in the calling process, instead of starting a pool.
+    """
+    if workers == 1:
+        state = setup(*setup_args)
+
+        yield from (task(state, item) for item in items)
+        return
+
+    with create_pool(setup, setup_args, workers, mp_context) as executor:
+        yield from executor.map(with_worker_state(task), items, chunksize=chunksize)
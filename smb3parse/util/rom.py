@@ -1,17 +1,105 @@
 import pathlib
+from bisect import bisect_left, bisect_right
 from ctypes import Structure, c_char, c_ubyte
 from os import PathLike
 from pathlib import Path
+from typing import Iterator, Optional
 
 from smb3parse.constants import BASE_OFFSET, PAGE_A000_ByTileset, WORLD_MAP_TSA_INDEX
 from smb3parse.types import AnyAddress, NormalizedAddress
-from smb3parse.util import little_endian
 
 TSA_OS_LIST = PAGE_A000_ByTileset
 TSA_TABLE_SIZE = 0x400
 
 PRG_BANK_SIZE = 0x2000
 
+_COMPARE_CHUNK_SIZE = 1024
+"""Data is compared in chunks of this size first, so only chunks, that differ, have to be compared byte by byte."""
+
+
+def changed_ranges(
+    old_data: bytes | bytearray, new_data: bytes | bytearray, join_distance: int = 0
+) -> Iterator[tuple[int, int]]:
+    """
+    Yields the start and end offsets of all spans of bytes, that differ between the two buffers of the same size.
+
+    :param join_distance: Spans with at most this many unchanged bytes between them are yielded as one.
+    """
+    if len(old_data) != len(new_data):
+        raise ValueError(f"Can't compare data of different lengths {len(old_data)} and {len(new_data)}.")
+
+    if old_data == new_data:
+        return
+
+    start = -1
+
+    for offset in range(0, len(new_data), _COMPARE_CHUNK_SIZE):
+        chunk_end = offset + _COMPARE_CHUNK_SIZE
+        chunks_differ = old_data[offset:chunk_end] != new_data[offset:chunk_end]
+
+        if chunks_differ and start == -1:
+            start = offset
+        elif not chunks_differ and start != -1:
+            yield from _changed_bytes(old_data, new_data, start, offset, join_distance)
+            start = -1
+
+    if start != -1:
+        yield from _changed_bytes(old_data, new_data, start, len(new_data), join_distance)
+
+
+def _changed_bytes(
+    old_data: bytes | bytearray, new_data: bytes | bytearray, start: int, end: int, join_distance: int
+) -> Iterator[tuple[int, int]]:
+    range_start = range_end = -1
+
+    for offset, (old_byte, new_byte) in enumerate(zip(old_data[start:end], new_data[start:end]), start):
+        if old_byte == new_byte:
+            continue
+
+        if range_start == -1:
+            range_start = offset
+
+        elif offset - range_end > join_distance:
+            yield range_start, range_end
+            range_start = offset
+
+        range_end = offset + 1
+
+    yield range_start, range_end
+
+
+class ByteRanges:
+    """A set of offsets, kept as sorted ranges, that are merged, when they overlap or touch."""
+
+    def __init__(self):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def add(self, start: int, end: int):
+        # all ranges, that end at or after the start and begin at or before the end, are merged with the new one
+        first = bisect_left(self._ends, start)
+        last = bisect_right(self._starts, end)
+
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+
+    def clear(self):
+        self._starts.clear()
+        self._ends.clear()
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __bool__(self):
+        return bool(self._starts)
+
 
 class INESHeader(Structure):
     _fields_ = [
@@ -38,9 +126,14 @@ class INESHeader(Structure):
 class Rom:
     VANILLA_PRG_SIZE = 0x40000
 
-    def __init__(self, rom_data: bytearray, header: INESHeader | None = None):
+    def __init__(
+        self, rom_data: bytearray, header: INESHeader | None = None, dirty_ranges: Optional[ByteRanges] = None
+    ):
         self._data = rom_data
 
+        self.dirty_ranges = ByteRanges() if dirty_ranges is None else dirty_ranges
+        """The ranges of the ROM data, that were changed by writes since the last time the ranges were cleared."""
+
         if header is None:
             header = INESHeader.from_buffer_copy(bytes(rom_data))
 
@@ -71,7 +164,10 @@ class Rom:
 
         return NormalizedAddress(offset + no_bytes_added_to_rom)
 
-    def tsa_data_for_object_set(self, object_set: int) -> bytearray:
+    def tsa_data_for_object_set(self, object_set: int) -> memoryview:
+        return self.view(self.tsa_offset_for_object_set(object_set), TSA_TABLE_SIZE)
+
+    def tsa_offset_for_object_set(self, object_set: int) -> NormalizedAddress:
         # TSA_OS_LIST offset value assumes vanilla ROM size, so normalize it
 
         tsa_index = self.int(TSA_OS_LIST + object_set)
@@ -86,12 +182,10 @@ class Rom:
             tsa_index = WORLD_MAP_TSA_INDEX
 
         # INES header size + (bank with tsa data * sizeof(bank))
-        tsa_start = BASE_OFFSET + tsa_index * PRG_BANK_SIZE
-
-        return self.read(tsa_start, TSA_TABLE_SIZE)
+        return NormalizedAddress(BASE_OFFSET + tsa_index * PRG_BANK_SIZE)
 
     def little_endian(self, offset: AnyAddress) -> int:
-        return little_endian(self.read(offset, 2))
+        return self.u16le(offset)
 
     def write_little_endian(self, offset: AnyAddress, integer: int):
         right_byte = (integer & 0xFF00) >> 8
@@ -107,6 +201,23 @@ class Rom:
     def _read(self, offset: NormalizedAddress, length: int) -> bytearray:
         return self._data[offset : offset + length]
 
+    def view(self, offset: AnyAddress, length: int) -> memoryview:
+        """
+        Like read, but returns a view into the ROM data, instead of a copy. Use it for data, that is only looked at
+        once, and copy what needs to be kept, since the ROM data can't change its size, while a view of it exists.
+        """
+        offset = self.prg_normalize(offset)
+
+        return memoryview(self._data)[offset : offset + length]
+
+    def u8(self, offset: AnyAddress) -> int:
+        return self._data[self.prg_normalize(offset)]
+
+    def u16le(self, offset: AnyAddress) -> int:
+        offset = self.prg_normalize(offset)
+
+        return self._data[offset] | self._data[offset + 1] << 8
+
     def read_until(self, offset: AnyAddress, delimiter: bytes | int):
         if isinstance(delimiter, int):
             delimiter = bytes([delimiter])
@@ -124,6 +235,14 @@ class Rom:
         return self._write(offset, data)
 
     def _write(self, offset: NormalizedAddress, data: bytes):
+        old_data = self._data[offset : offset + len(data)]
+
+        if len(old_data) != len(data):
+            self.dirty_ranges.add(offset, offset + len(data))
+        else:
+            for start, end in changed_ranges(old_data, data):
+                self.dirty_ranges.add(offset + start, offset + end)
+
         self._data[offset : offset + len(data)] = data
 
     def find(
@@ -167,10 +286,12 @@ class Rom:
     def from_file(path: PathLike):
         return Rom(bytearray(pathlib.Path(path).read_bytes()))
 
+    def as_bytes(self) -> bytes:
+        """Returns a copy of the ROM data, for example to send it to another process."""
+        return bytes(self._data)
+
     def save_to(self, path: PathLike):
         Path(path).open("wb").write(self._data)
 
     def int(self, offset: AnyAddress) -> int:
-        read_bytes = self.read(offset, 1)
-
-        return read_bytes[0]
+        return self.u8(offset)